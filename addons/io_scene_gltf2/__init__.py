@@ -421,6 +421,24 @@ class ExportGLTF2_Base(ConvertGLTF2_Base):
         max=100
     )
 
+    export_image_cache_directory: StringProperty(
+        name='Image Cache',
+        description=(
+            'Directory where encoded images are kept between exports. '
+            'Images whose sources did not change are copied from it instead of being encoded again. '
+            'Empty disables the cache'
+        ),
+        default='',
+        subtype='DIR_PATH',
+    )
+
+    export_image_cache_size: IntProperty(
+        name='Image Cache Size',
+        description='Maximum size, in MB, of the image cache. Least recently used images are removed first',
+        default=1024,
+        min=1,
+    )
+
     export_keep_originals: BoolProperty(
         name='Keep Original',
         description=('Keep original textures files if possible. '
@@ -523,6 +541,22 @@ class ExportGLTF2_Base(ConvertGLTF2_Base):
         max=30
     )
 
+    export_compression_threads: IntProperty(
+        name='Compression Threads',
+        description='Number of threads used to compress mesh and animation data (0 = all processors)',
+        default=0,
+        min=0,
+    )
+
+    export_image_threads: IntProperty(
+        name='Image Encoding Threads',
+        description='Number of threads encoding PNG images composed from several channels. '
+                    '0 uses all processors, 1 encodes them with Blender on the main thread',
+        default=0,
+        min=0,
+        options={'HIDDEN'},
+    )
+
     export_tangents: BoolProperty(
         name='Tangents',
         description='Export vertex tangents with meshes',
@@ -699,6 +733,33 @@ class ExportGLTF2_Base(ConvertGLTF2_Base):
         default=False
     )
 
+    export_primitive_cache_directory: StringProperty(
+        name='Mesh Cache',
+        description=(
+            'Directory where extracted mesh data is kept between exports. '
+            'Meshes that did not change are read from it instead of being extracted again. '
+            'Empty disables the cache'
+        ),
+        default='',
+        subtype='DIR_PATH',
+    )
+
+    export_primitive_cache_size: IntProperty(
+        name='Mesh Cache Size',
+        description='Maximum size, in MB, of the mesh cache. Least recently used meshes are removed first',
+        default=1024,
+        min=1,
+    )
+
+    export_primitive_processes: IntProperty(
+        name='Mesh Extraction Processes',
+        description='Number of worker processes creating primitives from mesh data, ahead of node gathering. '
+                    '0 uses all processors, 1 extracts meshes on the main thread only',
+        default=1,
+        min=0,
+        options={'HIDDEN'},
+    )
+
     export_animations: BoolProperty(
         name='Animations',
         description='Exports active actions and NLA tracks as glTF animations',
@@ -833,6 +894,44 @@ class ExportGLTF2_Base(ConvertGLTF2_Base):
         default=False
     )
 
+    export_optimize_animation_reduce: BoolProperty(
+        name='Reduce Keyframes',
+        description=(
+            "Remove sampled keyframes of object, bone and shape key animations "
+            "that linear interpolation reproduces within tolerance"
+        ),
+        default=False
+    )
+
+    export_optimize_animation_translation_tolerance: FloatProperty(
+        name='Translation Tolerance',
+        description='Maximum translation error allowed when reducing keyframes',
+        default=0.0001,
+        min=0.0,
+        soft_max=0.1,
+        precision=4,
+        subtype='DISTANCE'
+    )
+
+    export_optimize_animation_rotation_tolerance: FloatProperty(
+        name='Rotation Tolerance',
+        description='Maximum rotation error allowed when reducing keyframes',
+        default=0.001,
+        min=0.0,
+        soft_max=0.1,
+        precision=4,
+        subtype='ANGLE'
+    )
+
+    export_optimize_animation_scale_tolerance: FloatProperty(
+        name='Scale / Weight Tolerance',
+        description='Maximum scale or shape key weight error allowed when reducing keyframes',
+        default=0.0001,
+        min=0.0,
+        soft_max=0.1,
+        precision=4
+    )
+
     export_optimize_disable_viewport: BoolProperty(
         name='Disable Viewport for Other Objects',
         description=(
@@ -1006,6 +1105,14 @@ class ExportGLTF2_Base(ConvertGLTF2_Base):
         default=False
     )
 
+    export_gpu_instances_quantization: BoolProperty(
+        name='Quantize GPU Instances',
+        description='Store instance rotations, and scales when possible, as normalized integers. '
+                    'Rotations and scales that are all default values are omitted. '
+                    'Scales may need KHR_mesh_quantization',
+        default=False
+    )
+
     export_action_filter: BoolProperty(
         name='Filter Actions',
         description='Filter Actions to be exported',
@@ -1068,6 +1175,13 @@ class ExportGLTF2_Base(ConvertGLTF2_Base):
         default=-1,
     )
 
+    export_profile_report: BoolProperty(
+        name='Profiling Report',
+        description='Write a JSON report of export timings and counters next to the exported file',
+        default=False,
+        options={'HIDDEN'},
+    )
+
     # Custom scene property for saving settings
     scene_key = "glTF2ExportSettings"
 
@@ -1126,7 +1240,7 @@ class ExportGLTF2_Base(ConvertGLTF2_Base):
         import os
         import datetime
         from .io.exp.user_extensions import export_user_extensions
-        from .io.com.debug import Log
+        from .io.com.debug import Log, Profiler
         from .blender.exp import export as gltf2_blender_export
         from .io.com.path import path_to_uri
 
@@ -1152,6 +1266,8 @@ class ExportGLTF2_Base(ConvertGLTF2_Base):
         if export_settings['gltf_loglevel'] < 0:
             export_settings['loglevel'] = set_debug_log()
 
+        export_settings['gltf_profile_report'] = self.export_profile_report
+
         export_settings['exported_images'] = {}
         export_settings['exported_texture_nodes'] = []
         export_settings['additional_texture_export'] = []
@@ -1189,6 +1305,11 @@ class ExportGLTF2_Base(ConvertGLTF2_Base):
             export_settings['gltf_draco_generic_quantization'] = self.export_draco_generic_quantization
         else:
             export_settings['gltf_draco_mesh_compression'] = False
+        export_settings['gltf_compression_threads'] = self.export_compression_threads
+        export_settings['gltf_image_threads'] = self.export_image_threads
+        export_settings['gltf_image_cache_directory'] = bpy.path.abspath(self.export_image_cache_directory) \
+            if self.export_image_cache_directory else ''
+        export_settings['gltf_image_cache_size'] = self.export_image_cache_size
 
         if is_meshopt_available():
             export_settings['gltf_meshopt_compression'] = self.export_meshopt_compression_enable
@@ -1240,6 +1361,10 @@ class ExportGLTF2_Base(ConvertGLTF2_Base):
         export_settings['gltf_yup'] = self.export_yup
         export_settings['gltf_apply'] = self.export_apply
         export_settings['gltf_shared_accessors'] = self.export_shared_accessors
+        export_settings['gltf_primitive_cache_directory'] = bpy.path.abspath(self.export_primitive_cache_directory) \
+            if self.export_primitive_cache_directory else ''
+        export_settings['gltf_primitive_cache_size'] = self.export_primitive_cache_size
+        export_settings['gltf_primitive_processes'] = self.export_primitive_processes
         export_settings['gltf_current_frame'] = self.export_current_frame
         export_settings['gltf_animations'] = self.export_animations
         export_settings['gltf_def_bones'] = self.export_def_bones
@@ -1283,6 +1408,13 @@ class ExportGLTF2_Base(ConvertGLTF2_Base):
             export_settings['gltf_optimize_animation_keep_armature'] = self.export_optimize_animation_keep_anim_armature
             export_settings['gltf_optimize_animation_keep_object'] = self.export_optimize_animation_keep_anim_object
             export_settings['gltf_optimize_disable_viewport'] = self.export_optimize_disable_viewport
+            export_settings['gltf_optimize_animation_reduce'] = self.export_optimize_animation_reduce
+            export_settings['gltf_optimize_animation_tolerances'] = {
+                'location': self.export_optimize_animation_translation_tolerance,
+                'rotation_quaternion': self.export_optimize_animation_rotation_tolerance,
+                'scale': self.export_optimize_animation_scale_tolerance,
+                'value': self.export_optimize_animation_scale_tolerance,
+            }
             export_settings['gltf_export_reset_pose_bones'] = self.export_reset_pose_bones
             export_settings['gltf_export_reset_sk_data'] = self.export_morph_reset_sk_data
             export_settings['gltf_bake_animation'] = self.export_bake_animation
@@ -1299,6 +1431,7 @@ class ExportGLTF2_Base(ConvertGLTF2_Base):
             export_settings['gltf_optimize_animation_keep_armature'] = False
             export_settings['gltf_optimize_animation_keep_object'] = False
             export_settings['gltf_optimize_disable_viewport'] = False
+            export_settings['gltf_optimize_animation_reduce'] = False
             export_settings['gltf_export_anim_single_armature'] = False
             export_settings['gltf_export_reset_pose_bones'] = False
             export_settings['gltf_export_reset_sk_data'] = False
@@ -1327,6 +1460,7 @@ class ExportGLTF2_Base(ConvertGLTF2_Base):
         export_settings['gltf_lighting_mode'] = self.export_import_convert_lighting_mode
 
         export_settings['gltf_gpu_instances'] = self.export_gpu_instances
+        export_settings['gltf_gpu_instances_quantization'] = self.export_gpu_instances_quantization
 
         export_settings['gltf_try_sparse_sk'] = self.export_try_sparse_sk
         export_settings['gltf_try_omit_sparse_sk'] = self.export_try_omit_sparse_sk
@@ -1392,6 +1526,7 @@ class ExportGLTF2_Base(ConvertGLTF2_Base):
 
         # Initialize logging for export
         export_settings['log'] = Log(export_settings['loglevel'])
+        export_settings['profiler'] = Profiler(export_settings['gltf_profile_report'])
 
         # Pre-export hook
         export_user_extensions('pre_export_hook', export_settings)
@@ -1526,6 +1661,9 @@ def export_panel_data_scene_graph(layout, operator):
     if body:
         body.prop(operator, 'export_gn_mesh')
         body.prop(operator, 'export_gpu_instances')
+        col = body.column()
+        col.active = operator.export_gpu_instances
+        col.prop(operator, 'export_gpu_instances_quantization')
         body.prop(operator, 'export_hierarchy_flatten_objs')
         body.prop(operator, 'export_hierarchy_full_collections')
 
@@ -1549,6 +1687,11 @@ def export_panel_data_mesh(layout, operator):
         col = body.column()
         col.prop(operator, 'export_shared_accessors')
 
+        col = body.column()
+        col.prop(operator, 'export_primitive_cache_directory')
+        if operator.export_primitive_cache_directory:
+            col.prop(operator, 'export_primitive_cache_size')
+
         header, sub_body = body.panel("GLTF_export_data_material_vertex_color", default_closed=True)
         header.label(text="Vertex Colors")
         if sub_body:
@@ -1582,6 +1725,9 @@ def export_panel_data_material(layout, operator):
         col.prop(operator, 'export_image_format')
         if operator.export_image_format in ["AUTO", "JPEG", "WEBP"]:
             col.prop(operator, 'export_image_quality')
+        col.prop(operator, 'export_image_cache_directory')
+        if operator.export_image_cache_directory:
+            col.prop(operator, 'export_image_cache_size')
         col = body.column()
         col.active = operator.export_image_format != "WEBP" and operator.export_materials not in [
             'PLACEHOLDER', 'NONE', 'VIEWPORT']
@@ -1686,6 +1832,8 @@ def export_panel_data_compression(layout, operator):
         col.prop(operator, 'export_draco_color_quantization', text="Color")
         col.prop(operator, 'export_draco_generic_quantization', text="Generic")
 
+        body.prop(operator, 'export_compression_threads')
+
 # TODO: Make sure we can't enable both Draco and Meshopt at the same time
 
 
@@ -1697,6 +1845,7 @@ def export_panel_data_meshopt_compression(layout, operator):
     if body:
         body.active = operator.export_meshopt_compression_enable
         body.prop(operator, 'export_meshopt_extension')
+        body.prop(operator, 'export_compression_threads')
 
 
 def export_panel_animation(layout, operator):
@@ -1847,6 +1996,13 @@ def export_panel_animation_optimize(layout, operator):
         row = body.row()
         row.prop(operator, 'export_optimize_disable_viewport')
 
+        body.prop(operator, 'export_optimize_animation_reduce')
+        col = body.column()
+        col.active = operator.export_optimize_animation_reduce
+        col.prop(operator, 'export_optimize_animation_translation_tolerance')
+        col.prop(operator, 'export_optimize_animation_rotation_tolerance')
+        col.prop(operator, 'export_optimize_animation_scale_tolerance')
+
 
 def export_panel_animation_extra(layout, operator):
     header, body = layout.panel("GLTF_export_animation_extra", default_closed=True)
@@ -2040,6 +2196,70 @@ class ImportGLTF2(Operator, ConvertGLTF2_Base, ImportHelper):
         default=False,
     )
 
+    import_gpu_instancing: EnumProperty(
+        name='GPU Instances',
+        items=(
+            ('OBJECTS', 'Objects',
+             'Create an object for each instance'),
+            ('INSTANCER', 'Geometry Nodes Instancer',
+             'Create a single object for all instances of a mesh, '
+             'instancing the mesh on its points with a Geometry Nodes modifier'),
+        ),
+        description='How instances of EXT_mesh_gpu_instancing are imported',
+        default='OBJECTS',
+    )
+
+    import_memory_map: BoolProperty(
+        name='Memory-Map Files',
+        description=(
+            'Map the glb file and external buffers in memory instead of reading them. '
+            'Only the parts of the buffers that are used are loaded, which reduces memory usage on large files'
+        ),
+        default=False,
+    )
+
+    import_filter_scene: IntProperty(
+        name='Scene',
+        description='Only import the nodes of the scene with this index. -1 imports all scenes',
+        default=-1,
+        min=-1,
+    )
+
+    import_filter_nodes: StringProperty(
+        name='Node Names',
+        description=(
+            'Only import the nodes whose name matches this pattern (eg. "Wheel*"), with their children. '
+            'Empty imports all nodes'
+        ),
+        default='',
+    )
+
+    import_filter_meshes: StringProperty(
+        name='Meshes',
+        description=(
+            'Only import the nodes using one of these meshes, as a comma separated list of mesh indices. '
+            'Empty imports all meshes'
+        ),
+        default='',
+    )
+
+    accessor_cache_size: IntProperty(
+        name='Accessor Cache Size',
+        description='Maximum size, in MB, of decoded accessors kept in memory to be shared between primitives',
+        default=512,
+        min=0,
+        options={'HIDDEN'},
+    )
+
+    import_decode_threads: IntProperty(
+        name='Decode Threads',
+        description='Number of threads decoding mesh data ahead of mesh creation. '
+                    '0 uses all processors, 1 decodes on the main thread only',
+        default=0,
+        min=0,
+        options={'HIDDEN'},
+    )
+
     def draw(self, context):
         operator = self
         layout = self.layout
@@ -2053,6 +2273,7 @@ class ImportGLTF2(Operator, ConvertGLTF2_Base, ImportHelper):
         import_texture_panel(layout, operator)
         import_bone_panel(layout, operator)
         import_ux_panel(layout, operator)
+        import_filter_panel(layout, operator)
 
         import_panel_user_extension(context, layout)
 
@@ -2115,14 +2336,18 @@ class ImportGLTF2(Operator, ConvertGLTF2_Base, ImportHelper):
         from .blender.imp.blender_gltf import BlenderGlTF
 
         try:
-            gltf_importer = glTFImporter(filename, import_settings)
-            gltf_importer.read()
-            gltf_importer.checks()
-
-            gltf_importer.log.info("Data are loaded, start creating Blender stuff")
-
-            start_time = time.time()
-            BlenderGlTF.create(gltf_importer)
+            # Files are unmapped and released when leaving, even if import failed
+            with glTFImporter(filename, import_settings) as gltf_importer:
+                gltf_importer.read()
+                gltf_importer.checks()
+
+                gltf_importer.log.info("Data are loaded, start creating Blender stuff")
+
+                start_time = time.time()
+                BlenderGlTF.create(gltf_importer)
+                cache = gltf_importer.accessor_cache
+                gltf_importer.log.info("Accessor cache: {} hits, {} misses, {} evictions".format(
+                    cache.hits, cache.misses, cache.evictions))
             elapsed_s = "{:.2f}s".format(time.time() - start_time)
             gltf_importer.log.info("glTF import finished in " + elapsed_s)
 
@@ -2146,6 +2371,7 @@ def import_mesh_panel(layout, operator):
         body.prop(operator, 'merge_vertices')
         body.prop(operator, 'import_merge_material_slots')
         body.prop(operator, 'import_point_as_pointcloud')
+        body.prop(operator, 'import_gpu_instancing')
 
 
 def import_bone_panel(layout, operator):
@@ -2167,6 +2393,16 @@ def import_ux_panel(layout, operator):
         if operator.import_scene_as_collection is True:
             body.prop(operator, 'import_select_created_objects')
         body.prop(operator, 'import_scene_extras')
+        body.prop(operator, 'import_memory_map')
+
+
+def import_filter_panel(layout, operator):
+    header, body = layout.panel("GLTF_import_filter", default_closed=True)
+    header.label(text="Filter")
+    if body:
+        body.prop(operator, 'import_filter_scene')
+        body.prop(operator, 'import_filter_nodes')
+        body.prop(operator, 'import_filter_meshes')
 
 
 def import_texture_panel(layout, operator):
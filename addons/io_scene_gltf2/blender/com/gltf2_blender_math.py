@@ -14,6 +14,7 @@
 
 import typing
 import math
+import numpy as np
 from mathutils import Matrix, Vector, Quaternion, Euler
 
 from .data_path import get_target_property_name
@@ -170,6 +171,148 @@ def transform_value(value: Vector, _: Matrix = Matrix.Identity(4), need_rotation
     return value
 
 
+def transform_array(values: np.ndarray, data_path: str, transform: Matrix = Matrix.Identity(4),
+                    need_rotation_correction: bool = False) -> np.ndarray:
+    """Manage transformations, for an array of values (one per row). Same results as transform."""
+    target = get_target_property_name(data_path)
+    if target == "location":
+        # Rotation correction is applied after translation, so it does not change the location
+        m = np.array(transform, dtype=np.float64)
+        return values @ m[:3, :3].T + m[:3, 3]
+    if target == "rotation_quaternion":
+        length = np.linalg.norm(values, axis=1, keepdims=True)
+        rotations = np.divide(values, length, out=np.zeros_like(values), where=length > 0.0)
+        rotations = quaternion_multiply(np.array(transform.to_quaternion(), dtype=np.float64), rotations)
+        if need_rotation_correction:
+            correction = np.array((2**0.5 / 2, -2**0.5 / 2, 0.0, 0.0))
+            rotations = quaternion_multiply(rotations, correction)
+        # Matrix.to_quaternion gives quaternions with a non-negative w
+        rotations[rotations[:, 0] < 0.0] *= -1.0
+        return rotations
+    if target == "scale":
+        # Matrix.to_scale gives the length of each axis
+        m = np.array(transform.to_3x3(), dtype=np.float64)
+        return np.abs(values) * np.linalg.norm(m, axis=0)
+    if target == "value":
+        return values
+
+    raise RuntimeError("Cannot transform values at {}".format(data_path))
+
+
+def quaternion_multiply(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Hamilton product of w first quaternions, for arrays of quaternions (one per row) or single ones."""
+    aw, ax, ay, az = np.moveaxis(np.asarray(a), -1, 0)
+    bw, bx, by, bz = np.moveaxis(np.asarray(b), -1, 0)
+    return np.stack([
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ], axis=-1)
+
+
+def swizzle_yup_array(values: np.ndarray, data_path: str) -> np.ndarray:
+    """Manage Yup, for an array of values (one per row). Same results as swizzle_yup."""
+    target = get_target_property_name(data_path)
+    if target == "location":
+        return np.stack([values[:, 0], values[:, 2], -values[:, 1]], axis=1)
+    if target == "rotation_quaternion":
+        return np.stack([values[:, 0], values[:, 1], values[:, 3], -values[:, 2]], axis=1)
+    if target == "scale":
+        return values[:, [0, 2, 1]]
+    if target == "value":
+        return values
+
+    raise RuntimeError("Cannot transform values at {}".format(data_path))
+
+
+def array_to_gltf(values: np.ndarray, data_path: str) -> np.ndarray:
+    """Transform an array of values (one per row) to glTF order, like mathutils_to_gltf."""
+    if get_target_property_name(data_path) == "rotation_quaternion":
+        # Blender has w-first quaternion notation
+        return values[:, [1, 2, 3, 0]]
+    return values
+
+
+def inverted_safe_array(matrices: np.ndarray) -> np.ndarray:
+    """Inverse of each matrix of an array, like Matrix.inverted_safe.
+
+    Degenerate matrices (for example with a 0 scale) get a small value added on their diagonal first.
+    """
+    matrices = np.array(matrices, dtype=np.float64)
+    singular = np.linalg.det(matrices) == 0.0
+    if np.any(singular):
+        matrices[singular] += np.eye(matrices.shape[-1]) * 1e-8
+    try:
+        return np.linalg.inv(matrices)
+    except np.linalg.LinAlgError:
+        return np.linalg.pinv(matrices)
+
+
+def decompose_array(matrices: np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Locations, rotations (w first quaternions) and scales of an array of 4x4 matrices, like Matrix.decompose."""
+    location = matrices[:, :3, 3]
+
+    basis = matrices[:, :3, :3]
+    scale = np.linalg.norm(basis, axis=1)
+    basis = np.divide(basis, scale[:, np.newaxis, :], out=np.zeros_like(basis), where=scale[:, np.newaxis, :] > 0.0)
+    # Negative scales are applied on all axes, so that the rotation part is a rotation
+    negative = np.linalg.det(basis) < 0.0
+    basis[negative] *= -1.0
+    scale[negative] *= -1.0
+
+    return location, rotation_matrix_to_quaternion_array(basis), scale
+
+
+def rotation_matrix_to_quaternion_array(m: np.ndarray) -> np.ndarray:
+    """Quaternions (w first, with a non-negative w) of an array of 3x3 rotation matrices."""
+    q = np.empty((len(m), 4))
+    trace = m[:, 0, 0] + m[:, 1, 1] + m[:, 2, 2]
+
+    # Use the largest of w, x, y, z as divisor, for precision
+    w_largest = trace > 0.0
+    x_largest = ~w_largest & (m[:, 0, 0] > m[:, 1, 1]) & (m[:, 0, 0] > m[:, 2, 2])
+    y_largest = ~w_largest & ~x_largest & (m[:, 1, 1] > m[:, 2, 2])
+    z_largest = ~w_largest & ~x_largest & ~y_largest
+
+    r = m[w_largest]
+    s = np.sqrt(np.maximum(1.0 + r[:, 0, 0] + r[:, 1, 1] + r[:, 2, 2], 1e-12)) * 2.0
+    q[w_largest] = np.stack([
+        0.25 * s,
+        (r[:, 2, 1] - r[:, 1, 2]) / s,
+        (r[:, 0, 2] - r[:, 2, 0]) / s,
+        (r[:, 1, 0] - r[:, 0, 1]) / s], axis=1)
+
+    r = m[x_largest]
+    s = np.sqrt(np.maximum(1.0 + r[:, 0, 0] - r[:, 1, 1] - r[:, 2, 2], 1e-12)) * 2.0
+    q[x_largest] = np.stack([
+        (r[:, 2, 1] - r[:, 1, 2]) / s,
+        0.25 * s,
+        (r[:, 0, 1] + r[:, 1, 0]) / s,
+        (r[:, 0, 2] + r[:, 2, 0]) / s], axis=1)
+
+    r = m[y_largest]
+    s = np.sqrt(np.maximum(1.0 + r[:, 1, 1] - r[:, 0, 0] - r[:, 2, 2], 1e-12)) * 2.0
+    q[y_largest] = np.stack([
+        (r[:, 0, 2] - r[:, 2, 0]) / s,
+        (r[:, 0, 1] + r[:, 1, 0]) / s,
+        0.25 * s,
+        (r[:, 1, 2] + r[:, 2, 1]) / s], axis=1)
+
+    r = m[z_largest]
+    s = np.sqrt(np.maximum(1.0 + r[:, 2, 2] - r[:, 0, 0] - r[:, 1, 1], 1e-12)) * 2.0
+    q[z_largest] = np.stack([
+        (r[:, 1, 0] - r[:, 0, 1]) / s,
+        (r[:, 0, 2] + r[:, 2, 0]) / s,
+        (r[:, 1, 2] + r[:, 2, 1]) / s,
+        0.25 * s], axis=1)
+
+    q /= np.linalg.norm(q, axis=1, keepdims=True)
+    # Same canonical form as Matrix.to_quaternion
+    q[q[:, 0] < 0.0] *= -1.0
+    return q
+
+
 def round_if_near(value: float, target: float) -> float:
     """If value is very close to target, round to target."""
     return value if abs(value - target) > 2.0e-6 else target
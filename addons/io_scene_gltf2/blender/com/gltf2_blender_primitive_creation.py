@@ -0,0 +1,350 @@
+# Copyright 2018-2026 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Creation of primitives from a snapshot of mesh data, the last step of primitive extraction.
+# Only numpy is used here, not Blender, so that it can run in worker processes,
+# where this module is imported as a top level module, by gltf2_blender_primitive_worker.
+
+from multiprocessing import resource_tracker, shared_memory
+import io
+import os
+import pickle
+import sys
+import numpy as np
+
+try:
+    from .gltf2_blender_utils import fast_structured_np_unique
+except ImportError:
+    from gltf2_blender_utils import fast_structured_np_unique  # Worker process
+
+SHARED_ALIGNMENT = 64
+
+
+def create_primitives(snapshot):
+    """Create primitives from a snapshot made by PrimitiveCreator.snapshot.
+
+    Component types are returned as ints. Returns a dict with primitives, the number of
+    loose edges and points primitives at the end of the list, and the attributes shared
+    by all triangle primitives, if accessors are shared.
+    """
+    shared_attributes = None
+    if snapshot['shared'] is True:
+        primitives, shared_attributes = __create_shared(snapshot)
+        if len(primitives) == 0:
+            shared_attributes = None
+    else:
+        primitives = __create_not_shared(snapshot)
+
+    # Manage edges & points primitives.
+    # One for edges, one for points
+    # No material for them, so only one primitive for each
+    edges_points = __create_edges_and_points(snapshot)
+
+    return {
+        'primitives': primitives + edges_points,
+        'edges_points': len(edges_points),
+        'shared_attributes': shared_attributes,
+    }
+
+
+def __create_shared(snapshot):
+    primitives = []
+    dots, shared_dot_indices = fast_structured_np_unique(snapshot['dots'], return_inverse=True)
+    blender_idxs = dots['vertex_index']
+
+    attributes = {}
+    uvmap_attributes_index = __set_uvmap_attributes(snapshot, snapshot['uvmap_attribute_list'], dots, attributes)
+
+    for attr in snapshot['attributes']:
+        __set_attribute(snapshot, attr, dots, blender_idxs, attributes)
+
+    if snapshot['skin'] is True:
+        __set_skin_attributes(snapshot, blender_idxs, attributes)
+
+    for material_idx, dot_indices in snapshot['prim_indices']:
+        indices = shared_dot_indices[dot_indices]
+
+        if len(indices) == 0:
+            continue
+
+        primitives.append({
+            # No attribute here, as they are shared across all primitives
+            'indices': indices,
+            'material': material_idx,
+            'uvmap_attributes_index': uvmap_attributes_index
+        })
+
+    return primitives, attributes
+
+
+def __create_not_shared(snapshot):
+    primitives = []
+
+    for (material_idx, dot_indices), uvmap_attribute_list in zip(
+            snapshot['prim_indices'], snapshot['uvmap_attribute_lists']):
+        # Extract just dots used by this primitive, deduplicate them, and
+        # calculate indices into this deduplicated list.
+        prim_dots = snapshot['dots'][dot_indices]
+        prim_dots, indices = fast_structured_np_unique(prim_dots, return_inverse=True)
+
+        if len(prim_dots) == 0:
+            continue
+
+        # Now just move all the data for prim_dots into attribute arrays
+        attributes = {}
+        blender_idxs = prim_dots['vertex_index']
+
+        for attr in snapshot['attributes']:
+            __set_attribute(snapshot, attr, prim_dots, blender_idxs, attributes)
+
+        uvmap_attributes_index = __set_uvmap_attributes(snapshot, uvmap_attribute_list, prim_dots, attributes)
+
+        if snapshot['skin'] is True:
+            __set_skin_attributes(snapshot, blender_idxs, attributes)
+
+        primitives.append({
+            'attributes': attributes,
+            'indices': indices,
+            'material': material_idx,
+            'uvmap_attributes_index': uvmap_attributes_index
+        })
+
+    return primitives
+
+
+def __create_edges_and_points(snapshot):
+    primitives = []
+
+    if snapshot['loose_edges'] is True and snapshot['blender_idxs_edges'].shape[0] > 0:
+        # Export one glTF vert per unique Blender vert in a loose edge
+        dots_edges, indices = fast_structured_np_unique(snapshot['dots_edges'], return_inverse=True)
+        blender_idxs = np.unique(snapshot['blender_idxs_edges'])
+
+        primitives.append({
+            'attributes': __edges_points_attributes(snapshot, dots_edges, blender_idxs),
+            'indices': indices,
+            'mode': 1,  # LINES
+            'material': 0,
+            'uvmap_attributes_index': {}
+        })
+
+    if snapshot['loose_points'] is True and snapshot['blender_idxs_points'].shape[0] > 0:
+        primitives.append({
+            'attributes': __edges_points_attributes(
+                snapshot, snapshot['dots_points'], snapshot['blender_idxs_points']),
+            'mode': 0,  # POINTS
+            'material': 0,
+            'uvmap_attributes_index': {}
+        })
+
+    return primitives
+
+
+def __edges_points_attributes(snapshot, dots, blender_idxs):
+    attributes = {}
+    for attr in snapshot['attributes']:
+        if attr['domain'] != 'POINT':
+            continue
+        __set_attribute(snapshot, attr, dots, blender_idxs, attributes, edges_points=True)
+
+    if snapshot['skin'] is True:
+        __set_skin_attributes(snapshot, blender_idxs, attributes)
+    return attributes
+
+
+def __set_uvmap_attributes(snapshot, uvmap_attribute_list, dots, attributes):
+    # UVMaps defined as custom attributes by materials, exported after the other TEXCOORD_x
+    next_texcoor_idx = snapshot['tex_coord_max']
+    uvmap_attributes_index = {}
+    for attr in uvmap_attribute_list:
+        res = np.empty((len(dots), 2), dtype=np.float32)
+        for i in range(2):
+            res[:, i] = dots[attr + str(i)]
+
+        attributes["TEXCOORD_" + str(next_texcoor_idx)] = {
+            "data": res,
+            "component_type": snapshot['texcoord_component_type'],
+            "data_type": snapshot['texcoord_data_type'],
+        }
+        uvmap_attributes_index[attr] = next_texcoor_idx
+        next_texcoor_idx += 1
+    return uvmap_attributes_index
+
+
+def __set_attribute(snapshot, attr, dots, blender_idxs, attributes, edges_points=False):
+    if attr['kind'] == 'position':
+        data = snapshot['locs'][blender_idxs]
+    elif attr['kind'] == 'morph_position':
+        data = snapshot['morph_locs'][attr['index']][blender_idxs]
+    elif attr['kind'] == 'morph_tangent':
+        # Morph tangent are after these 3 others, so, they are already calculated
+        data = calc_morph_tangents(
+            attributes[attr['normal']]["data"],
+            attributes[attr['morph_normal']]["data"],
+            attributes[attr['tangent']]["data"],
+        )
+    else:
+        data = np.empty((len(dots), attr['len']), dtype=attr['dtype'])
+        for i in range(attr['len']):
+            data[:, i] = dots[attr['name'] + str(i)]
+
+    types = attr['edges_points_types'] if edges_points is True else attr['types']
+    attributes[attr['name']] = {"data": data}
+    if types is not None:
+        attributes[attr['name']]["component_type"], attributes[attr['name']]["data_type"] = types
+
+
+def __set_skin_attributes(snapshot, blender_idxs, attributes):
+    # Joints and weights of each dot, as flat arrays of 4 influences per set
+    joints = snapshot['vert_joints'][blender_idxs]
+    weights = snapshot['vert_weights'][blender_idxs]
+    for i in range(snapshot['num_joint_sets']):
+        attributes['JOINTS_%d' % i] = joints[:, 4 * i:4 * i + 4].reshape(-1)
+        attributes['WEIGHTS_%d' % i] = weights[:, 4 * i:4 * i + 4].reshape(-1)
+
+
+def calc_morph_tangents(normals, morph_normals, tangents):
+    """Morph target tangents, as deltas.
+
+    Tangents are rotated by the rotation from morphed normals to normals, computed like
+    mathutils.Vector.rotation_difference, for all dots at once.
+    """
+    n = normals.astype(np.float64)
+    t = tangents[:, :3].astype(np.float64)
+    a = __normalized(n + morph_normals)  # convert back to non-delta
+    b = __normalized(n)
+
+    axis = np.cross(a, b)
+    sin = np.linalg.norm(axis, axis=1)
+    cos = np.einsum('ij,ij->i', a, b)
+    angle = np.arctan2(sin, cos)
+
+    rotated = sin > np.finfo(np.float32).eps
+    axis[rotated] /= sin[rotated, np.newaxis]
+    axis[~rotated] = 0.0
+
+    # Parallel vectors: no rotation. Opposite vectors: half turn around any orthogonal axis
+    opposite = ~rotated & (cos <= 0.0)
+    if np.any(opposite):
+        ortho = __ortho(a[opposite])
+        length = np.linalg.norm(ortho, axis=1)
+        valid = length > 0.0  # Zero vectors give no rotation
+        ortho[valid] /= length[valid, np.newaxis]
+        ortho[~valid] = 0.0
+        axis[opposite] = ortho
+        angle[opposite] = np.where(valid, np.pi, 0.0)
+    angle[~rotated & ~opposite] = 0.0
+
+    # Rodrigues' rotation formula
+    cos = np.cos(angle)[:, np.newaxis]
+    sin = np.sin(angle)[:, np.newaxis]
+    t_morph = t * cos + np.cross(axis, t) * sin + axis * np.einsum('ij,ij->i', axis, t)[:, np.newaxis] * (1.0 - cos)
+
+    return (t_morph - t).astype(np.float32)  # back to delta
+
+
+def __normalized(vectors):
+    length = np.linalg.norm(vectors, axis=1)
+    res = np.zeros_like(vectors)
+    valid = length > 0.0
+    res[valid] = vectors[valid] / length[valid, np.newaxis]
+    return res
+
+
+def __ortho(vectors):
+    # Like ortho_v3_v3 in Blender, based on the dominant axis of each vector
+    x, y, z = np.abs(vectors).T
+    dominant = np.where(x > y, np.where(x > z, 0, 2), np.where(y > z, 1, 2))
+    v0, v1, v2 = vectors.T
+    return np.select(
+        [dominant[:, np.newaxis] == 0, dominant[:, np.newaxis] == 1],
+        [np.stack([-v1 - v2, v0, v0], axis=1), np.stack([v1, -v0 - v2, v1], axis=1)],
+        np.stack([v2, v2, -v0 - v1], axis=1),
+    )
+
+############################## Shared memory ##############################
+
+
+def share_snapshot(snapshot):
+    """Copy all arrays of a snapshot in one new shared memory block.
+
+    Returns the block, that the caller unlinks once done, and the message to send to
+    create_shared_primitives. The message only holds plain values: the snapshot is pickled
+    with arrays referenced by their index in the block layout.
+    """
+    arrays = []
+    data = io.BytesIO()
+    SnapshotPickler(data, arrays).dump(snapshot)
+
+    layout = []
+    size = 0
+    for array in arrays:
+        size = -(-size // SHARED_ALIGNMENT) * SHARED_ALIGNMENT
+        layout.append((size, array.dtype, array.shape))
+        size += array.nbytes
+
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for array, (offset, dtype, shape) in zip(arrays, layout):
+        np.ndarray(shape, dtype, buffer=shm.buf, offset=offset)[...] = array
+    return shm, {'name': shm.name, 'layout': layout, 'snapshot': data.getvalue()}
+
+
+def create_shared_primitives(message):
+    """create_primitives, for a snapshot sent by share_snapshot. Runs in worker processes."""
+    shm = __attach(message['name'])
+    try:
+        arrays = [np.ndarray(shape, dtype, buffer=shm.buf, offset=offset)
+                  for offset, dtype, shape in message['layout']]
+        snapshot = SnapshotUnpickler(io.BytesIO(message['snapshot']), arrays).load()
+        result = create_primitives(snapshot)
+        # Created arrays are all copies, no view on the block is left once these are deleted
+        del snapshot, arrays
+    finally:
+        shm.close()
+    return result
+
+
+def __attach(name):
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if os.name == 'posix':
+        # The block is unlinked by the exporter, that created it, not when the worker exits
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+class SnapshotPickler(pickle.Pickler):
+    """Pickle a snapshot, collecting its arrays instead of copying them in the data."""
+
+    def __init__(self, file, arrays):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.arrays = arrays
+
+    def persistent_id(self, obj):
+        if isinstance(obj, np.ndarray):
+            self.arrays.append(obj)
+            return len(self.arrays) - 1
+        return None
+
+
+class SnapshotUnpickler(pickle.Unpickler):
+    """Unpickle a snapshot pickled by SnapshotPickler, with its arrays."""
+
+    def __init__(self, file, arrays):
+        super().__init__(file)
+        self.arrays = arrays
+
+    def persistent_load(self, pid):
+        return self.arrays[pid]
@@ -0,0 +1,48 @@
+# Copyright 2018-2026 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Entry point of the worker processes of the primitive pipeline, run as a script by the exporter.
+# As a script, the directory of this file is the first one of sys.path, so the creation module
+# is imported by its name, without the add-on package, that needs Blender.
+# Messages from share_snapshot are read from stdin, and ('result', created) or ('error', traceback)
+# responses are written to stdout, pickled, one for each message, in order.
+
+import pickle
+import sys
+import traceback
+
+import gltf2_blender_primitive_creation
+
+
+def main():
+    requests = sys.stdin.buffer
+    responses = sys.stdout.buffer
+    # stdout is only used for responses
+    sys.stdout = sys.stderr
+
+    while True:
+        try:
+            message = pickle.load(requests)
+        except EOFError:
+            return
+        try:
+            response = ('result', gltf2_blender_primitive_creation.create_shared_primitives(message))
+        except Exception:
+            response = ('error', traceback.format_exc())
+        pickle.dump(response, responses, protocol=pickle.HIGHEST_PROTOCOL)
+        responses.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -80,18 +80,18 @@ def array_to_accessor(
                 # fallback to uncompressed byte stride, should be correct for non-quantized attributes
                 byteStride = len(array[:1].tobytes())
 
-            compressed_data, filter = MeshoptEncoder.encode_attribute(
-                attribute_name, array, byteStride, export_settings)
+            compressed_data, filter = MeshoptEncoder.defer_attribute(
+                attribute_name, array, byteStride)
             buffer_view = gltf2_io_binary_data.BinaryData(
                 array.tobytes(),
                 gltf2_io_constants.BufferViewTarget.ARRAY_BUFFER,
             )
 
             buffer_view.set_extension(export_settings['gltf_meshopt_extension'], {
-                'buffer': compressed_data,  # to be filled in later by the exporter, use data in placeholder for now
+                'buffer': compressed_data,  # to be filled in later by the exporter, use placeholder for now
                 'byteOffset': None,  # to be filled in later by the exporter
                 'byteStride': byteStride,
-                'byteLength': len(compressed_data),
+                'byteLength': None,  # to be filled in later by the exporter
                 'count': len(array),
                 'mode': 'ATTRIBUTES',
                 'filter': filter
@@ -159,14 +159,14 @@ def array_to_accessor(
             # fallback to uncompressed byte stride, should be correct for non-quantized attributes
             byteStride = len(array[:1].tobytes())
 
-        compressed_data, filter = MeshoptEncoder.encode_attribute(
-            attribute_name, array, byteStride, export_settings)
+        compressed_data, filter = MeshoptEncoder.defer_attribute(
+            attribute_name, array, byteStride)
 
         buffer_view.set_extension(export_settings['gltf_meshopt_extension'], {
-            'buffer': compressed_data,  # to be filled in later by the exporter, use data in placeholder for now
+            'buffer': compressed_data,  # to be filled in later by the exporter, use placeholder for now
             'byteOffset': None,  # to be filled in later by the exporter
             'byteStride': byteStride,
-            'byteLength': len(compressed_data),
+            'byteLength': None,  # to be filled in later by the exporter
             'count': len(array),
             'mode': 'ATTRIBUTES',
             'filter': filter
@@ -16,6 +16,7 @@ import bpy
 import typing
 from math import ceil
 from ....io.com import gltf2_io
+from ....io.com.debug import get_profiler
 from ....io.exp.user_extensions import export_user_extensions
 from ....blender.com.conversion import get_gltf_interpolation
 from ...com.data_path import is_bone_anim_channel, get_channelbag_for_slot
@@ -32,6 +33,7 @@ from .sampled.object.channels import gather_object_sampled_channels, gather_samp
 from .sampled.shapekeys.channels import gather_sampled_sk_channel
 from .drivers import get_sk_drivers, get_driver_on_shapekey
 from .anim_utils import reset_bone_matrix, reset_sk_data, link_samplers, add_slide_data, merge_tracks_perform, bake_animation
+from .sampled.sampling_cache import get_cache_data, get_first_cache_data, get_timeline_data
 
 
 class ActionsData:
@@ -155,6 +157,9 @@ def gather_actions_animations(export_settings):
 
     prepare_actions_range(export_settings)
 
+    with get_profiler(export_settings).span('timeline sampling'):
+        __sample_actions_timeline(export_settings)
+
     animations = []
     merged_tracks = {}
 
@@ -251,6 +256,196 @@ def gather_actions_animations(export_settings):
 
     return new_animations
 
+
+def __sample_actions_timeline(export_settings):
+    """Sample actions of several objects in the same sweeps of the timeline, before exporting them.
+
+    Instead of one sweep per action of each object, the k-th action of all objects is sampled in the k-th sweep.
+    Only objects that are evaluated independently of other objects are sampled this way. Others, and shape key
+    actions, are still sampled when exported.
+    """
+    if export_settings['gltf_animation_mode'] not in ["ACTIONS", "BROADCAST"] \
+            or export_settings['gltf_force_sampling'] is False \
+            or export_settings['gltf_optimize_disable_viewport'] \
+            or export_settings['gltf_export_reset_pose_bones'] is False:
+        return
+    # Switching actions here would not call user extensions hooks
+    if export_settings['gltf_user_extensions']:
+        return
+
+    vtree = export_settings['vtree']
+
+    # Actions and slots to sample, by object, in export order
+    schedule = {}
+    for obj_uuid in vtree.get_all_objects():
+        if not __is_timeline_independent(obj_uuid, export_settings):
+            continue
+
+        animation_data = vtree.nodes[obj_uuid].blender_object.animation_data
+        slots = []
+        for action_data in __get_obj_blender_actions(obj_uuid, export_settings).values():
+            if action_data.action.name not in export_settings['ranges'][obj_uuid].keys():
+                continue
+            for slot in action_data.slots:
+                if slot.target_id_type != "OBJECT":
+                    continue
+                # Active action is sampled with all other objects, by the first cache
+                if animation_data.action == action_data.action and animation_data.action_slot is not None \
+                        and animation_data.action_slot.handle == slot.slot.handle:
+                    continue
+                slots.append((action_data.action, slot.slot))
+        if len(slots) > 0:
+            schedule[obj_uuid] = slots
+
+    # Cached matrices not relative to the Blender parent (for example when the hierarchy is flattened) include
+    # the world matrix of this parent, so depend on the actions of the Blender ancestors
+    scheduled_objects = set(vtree.nodes[obj_uuid].blender_object.as_pointer() for obj_uuid in schedule.keys())
+    for obj_uuid in list(schedule.keys()):
+        if __is_relative_to_blender_parent(obj_uuid, export_settings):
+            continue
+        ancestor = vtree.nodes[obj_uuid].blender_object.parent
+        while ancestor is not None:
+            if ancestor.as_pointer() in scheduled_objects:
+                del schedule[obj_uuid]
+                break
+            ancestor = ancestor.parent
+
+    nb_sweeps = max([len(slots) for slots in schedule.values()], default=0)
+    nb_samples = sum([len(slots) for slots in schedule.values()])
+    if nb_samples == nb_sweeps:
+        # No action can share a sweep with another one
+        return
+
+    # Objects are then found in cache when exported, so the first cache of all objects is done here
+    get_cache_data.update_cache(get_first_cache_data(
+        list(schedule.keys())[0], export_settings['gltf_frame_step'], export_settings))
+
+    # Keep current situation, restored after sampling
+    current_states = {}
+    for obj_uuid in schedule.keys():
+        blender_object = vtree.nodes[obj_uuid].blender_object
+        animation_data = blender_object.animation_data
+        current_world_matrix = None
+        if animation_data.action is None or animation_data.action_slot is None:
+            current_world_matrix = blender_object.matrix_world.copy()
+        current_states[obj_uuid] = (animation_data.action, animation_data.action_slot,
+                                    animation_data.use_nla, current_world_matrix)
+        animation_data.use_nla = False
+
+    for sweep in range(nb_sweeps):
+        sampled = {}
+        for obj_uuid, slots in schedule.items():
+            if sweep >= len(slots):
+                continue
+            blender_object = vtree.nodes[obj_uuid].blender_object
+            blender_action, blender_slot = slots[sweep]
+            try:
+                reset_bone_matrix(blender_object, export_settings)
+                blender_object.animation_data.action = blender_action
+                blender_object.animation_data.action_slot = blender_slot
+            except Exception as _e:
+                # Will be sampled when exported
+                continue
+            sampled[obj_uuid] = (blender_action.name, blender_slot.identifier)
+
+        ranges = [(export_settings['ranges'][obj_uuid][action_name]['start'],
+                   export_settings['ranges'][obj_uuid][action_name]['end']) for obj_uuid, (action_name, _) in sampled.items()]
+        data = get_timeline_data(list(sampled.keys()), ranges, export_settings['gltf_frame_step'], export_settings)
+
+        # Only keep data of the actions that were scheduled, others are sampled when exported
+        get_cache_data.update_cache({
+            obj_uuid: {action_name: {slot_identifier: data[obj_uuid][action_name][slot_identifier]}}
+            for obj_uuid, (action_name, slot_identifier) in sampled.items()
+            if slot_identifier in data.get(obj_uuid, {}).get(action_name, {}).keys()})
+
+    # Restore situation
+    for obj_uuid, (current_action, current_action_slot, current_use_nla, current_world_matrix) in current_states.items():
+        blender_object = vtree.nodes[obj_uuid].blender_object
+        reset_bone_matrix(blender_object, export_settings)
+        if current_action is None:
+            if blender_object.animation_data.action is not None:
+                blender_object.animation_data.action_slot = None
+            blender_object.animation_data.action = None
+        else:
+            blender_object.animation_data.action = current_action
+            blender_object.animation_data.action_slot = current_action_slot
+        blender_object.animation_data.use_nla = current_use_nla
+        if current_world_matrix is not None:
+            blender_object.matrix_world = current_world_matrix
+
+    export_settings['log'].info(
+        "Timeline sampling: {} actions sampled in {} sweeps, {} sweeps saved.".format(
+            nb_samples, nb_sweeps, nb_samples - nb_sweeps))
+    get_profiler(export_settings).count('timeline sweeps saved', nb_samples - nb_sweeps)
+
+
+def __is_timeline_independent(obj_uuid, export_settings):
+    """Check that object transforms can be sampled while other objects play any action.
+
+    Local transforms are computed from the parent world matrix, so parents don't matter, except when the
+    object is parented to vertices, or when the exported parent is not the Blender one (checked once all
+    actions are scheduled). Constraints and drivers can read other objects, so only the ones that read this
+    object itself are allowed.
+    """
+    vnode = export_settings['vtree'].nodes[obj_uuid]
+    if vnode.blender_type not in [VExportNode.OBJECT, VExportNode.ARMATURE]:
+        return False
+
+    # Same objects as the ones exported
+    if vnode.node is None and (export_settings["gltf_armature_object_remove"] is False or not vnode.blender_object):
+        return False
+
+    blender_object = vnode.blender_object
+    if blender_object is None or blender_object.animation_data is None:
+        return False
+    if blender_object.animation_data.use_tweak_mode:
+        return False
+    if blender_object.parent is not None and blender_object.parent_type in ["VERTEX", "VERTEX_3"]:
+        return False
+
+    if blender_object.type == "ARMATURE":
+        # World matrix of armature is used for bones, when armature object is not exported
+        if vnode.node is None and blender_object.parent is not None:
+            return False
+        if len(get_sk_drivers(obj_uuid, export_settings)) > 0:
+            return False
+
+    constraints = list(blender_object.constraints)
+    if blender_object.type == "ARMATURE":
+        for pose_bone in blender_object.pose.bones:
+            constraints.extend(pose_bone.constraints)
+    for constraint in constraints:
+        targets = [getattr(constraint, 'target', None), getattr(constraint, 'pole_target', None)]
+        targets.extend([t.target for t in getattr(constraint, 'targets', [])])
+        if any([t is not None and t != blender_object for t in targets]):
+            return False
+
+    for driver in blender_object.animation_data.drivers:
+        for variable in driver.driver.variables:
+            if any([t.id is not None and t.id not in [blender_object, blender_object.data] for t in variable.targets]):
+                return False
+
+    return True
+
+
+def __is_relative_to_blender_parent(obj_uuid, export_settings):
+    """Check that the cached local matrix of an object is relative to its Blender parent (object or bone)."""
+    vtree = export_settings['vtree']
+    vnode = vtree.nodes[obj_uuid]
+    blender_object = vnode.blender_object
+    if vnode.parent_uuid is None:
+        return blender_object.parent is None
+
+    parent_vnode = vtree.nodes[vnode.parent_uuid]
+    if parent_vnode.blender_type in [VExportNode.COLLECTION, VExportNode.INST_COLLECTION]:
+        return blender_object.parent is None
+    if parent_vnode.blender_type == VExportNode.BONE:
+        return blender_object.parent_type == "BONE" \
+            and parent_vnode.blender_bone.id_data == blender_object.parent \
+            and parent_vnode.blender_bone.name == blender_object.parent_bone
+    return blender_object.parent_type != "BONE" and parent_vnode.blender_object == blender_object.parent
+
+
 # We need to align if step is not 1
 # For example, cache will get frame 1/4/7/10 if step is 3, with an action starting at frame 1
 # If all backing is enabled, and scene start at 0, we will get frame 0/3/6/9 => Cache will fail
@@ -101,12 +101,12 @@ def __convert_keyframes(
 
     binary_data = gltf2_io_binary_data.BinaryData.from_list(times, gltf2_io_constants.ComponentType.Float)
     if export_settings['gltf_meshopt_compression']:
-        compressed_time, filter = MeshoptEncoder.encode_attribute(
-            'TIME', np.array(times, dtype=np.float32), 4, export_settings)
+        compressed_time, filter = MeshoptEncoder.defer_attribute(
+            'TIME', np.array(times, dtype=np.float32), 4)
         binary_data.set_extension(export_settings['gltf_meshopt_extension'], {
-            'buffer': compressed_time,  # to be filled in later by the exporter, use data in placeholder for now
+            'buffer': compressed_time,  # to be filled in later by the exporter, use placeholder for now
             'byteOffset': None,  # to be filled in later by the exporter
-            'byteLength': len(compressed_time),
+            'byteLength': None,  # to be filled in later by the exporter
             'byteStride': 4,
             'count': len(times),
             'mode': 'ATTRIBUTES',
@@ -288,8 +288,8 @@ def __convert_keyframes(
 
         if compressed_type is not None:
             num_components = gltf2_io_constants.DataType.num_elements(data_type)
-            compressed_values, filter = MeshoptEncoder.encode_attribute(compressed_type, np.array(
-                values, dtype=np.float32).reshape(-1, num_components), byteStride, export_settings)
+            compressed_values, filter = MeshoptEncoder.defer_attribute(compressed_type, np.array(
+                values, dtype=np.float32).reshape(-1, num_components), byteStride)
 
             if filter == 'QUATERNION':
                 component_type = gltf2_io_constants.ComponentType.Short
@@ -298,9 +298,9 @@ def __convert_keyframes(
                 output_normalized = None
 
             binary_data.set_extension(export_settings['gltf_meshopt_extension'], {
-                'buffer': compressed_values,  # to be filled in later by the exporter, use data in placeholder for now
+                'buffer': compressed_values,  # to be filled in later by the exporter, use placeholder for now
                 'byteOffset': None,  # to be filled in later by the exporter
-                'byteLength': len(compressed_values),
+                'byteLength': None,  # to be filled in later by the exporter
                 'count': len(values) // gltf2_io_constants.DataType.num_elements(data_type),
                 'byteStride': byteStride,
                 'mode': 'ATTRIBUTES',
@@ -15,6 +15,8 @@
 import typing
 import bpy
 import mathutils
+import numpy as np
+from ....io.com.debug import get_profiler
 from ...com import gltf2_blender_math
 
 
@@ -147,3 +149,117 @@ class Keyframe:
     @out_tangent.setter
     def out_tangent(self, value: typing.List[float]):
         self.__out_tangent = self.__set_indexed(value)
+
+
+def sampled_frames(start_frame, end_frame, step) -> typing.List[float]:
+    """Frames sampled from start to end, both included."""
+    frames = []
+    frame = start_frame
+    while frame <= end_frame:
+        frames.append(frame)
+        frame += step
+    return frames
+
+
+class SampledKeyframes:
+    """Keyframes of a sampled channel, stored by columns instead of one Keyframe per frame.
+
+    frames is an array of n frames, and values an array of n rows, one component per column.
+    Quaternions are stored w first, like in Blender.
+    """
+
+    def __init__(self, frames, values):
+        self.frames = np.asarray(frames, dtype=np.float64)
+        self.values = np.asarray(values, dtype=np.float64)
+        if self.values.ndim == 1:
+            # Scalar channel
+            self.values = self.values[:, np.newaxis]
+
+    def __len__(self):
+        return len(self.frames)
+
+    def seconds(self, fps: float) -> np.ndarray:
+        return self.frames / fps
+
+    def slide(self, offset: float) -> 'SampledKeyframes':
+        """Keyframes moved offset frames earlier."""
+        return SampledKeyframes(self.frames - offset, self.values)
+
+    def first_and_last(self) -> 'SampledKeyframes':
+        return SampledKeyframes(self.frames[[0, -1]], self.values[[0, -1]])
+
+    def is_constant(self) -> bool:
+        return bool(np.all(np.ptp(self.values, axis=0) < 0.0001))
+
+    def component_is_constant(self, component: int) -> bool:
+        return bool(np.ptp(self.values[:, component]) < 0.0001)
+
+    def reduce(self, tolerance: float, target: str) -> 'SampledKeyframes':
+        """Keyframes without the ones that LINEAR interpolation of the others reproduces within tolerance.
+
+        Uses Ramer-Douglas-Peucker: a segment is split at its worst keyframe, until all errors are in tolerance.
+        The error is an angle for rotation_quaternion (spherical interpolation), a distance for location,
+        and the largest component difference otherwise (scale, shape key weights).
+        """
+        keep = np.zeros(len(self), dtype=bool)
+        keep[[0, -1]] = True
+        segments = [(0, len(self) - 1)]
+        while segments:
+            first, last = segments.pop()
+            if last - first < 2:
+                continue
+            errors = self.__interpolation_errors(first, last, target)
+            worst = int(np.argmax(errors))
+            if errors[worst] > tolerance:
+                split = first + 1 + worst
+                keep[split] = True
+                segments.append((first, split))
+                segments.append((split, last))
+
+        return SampledKeyframes(self.frames[keep], self.values[keep])
+
+    def __interpolation_errors(self, first: int, last: int, target: str) -> np.ndarray:
+        """Errors of the keyframes between first and last, when interpolated from first and last."""
+        factors = (self.frames[first + 1:last] - self.frames[first]) / (self.frames[last] - self.frames[first])
+        factors = factors[:, np.newaxis]
+        start = self.values[first]
+        end = self.values[last]
+        values = self.values[first + 1:last]
+
+        if target == "rotation_quaternion":
+            start = start / np.linalg.norm(start)
+            end = end / np.linalg.norm(end)
+            values = values / np.linalg.norm(values, axis=1, keepdims=True)
+            # Quaternions q and -q are the same rotation, interpolate on the shortest path
+            dot = np.dot(start, end)
+            if dot < 0.0:
+                end = -end
+                dot = -dot
+            angle = np.arccos(min(dot, 1.0))
+            if angle < 1e-6:
+                interpolated = start + factors * (end - start)
+            else:
+                interpolated = (np.sin((1.0 - factors) * angle) * start + np.sin(factors * angle) * end) / np.sin(angle)
+            interpolated /= np.linalg.norm(interpolated, axis=1, keepdims=True)
+            cos = np.abs(np.sum(interpolated * values, axis=1))
+            return 2.0 * np.arccos(np.clip(cos, 0.0, 1.0))
+
+        interpolated = start + factors * (end - start)
+        if target == "location":
+            return np.linalg.norm(values - interpolated, axis=1)
+        return np.max(np.abs(values - interpolated), axis=1)
+
+
+def reduce_sampled_keyframes(keyframes: SampledKeyframes, target: str, name: str, export_settings) -> SampledKeyframes:
+    """Remove keyframes of a LINEAR sampled channel, when the option is enabled, and report the reduction."""
+    if not export_settings['gltf_optimize_animation_reduce'] or len(keyframes) <= 2:
+        return keyframes
+
+    reduced = keyframes.reduce(export_settings['gltf_optimize_animation_tolerances'][target], target)
+
+    export_settings['log'].info("Keyframe reduction: {} {}: {} -> {} keyframes ({:.1f}x)".format(
+        name, target, len(keyframes), len(reduced), len(keyframes) / len(reduced)))
+    profiler = get_profiler(export_settings)
+    profiler.count('sampled keyframes', len(keyframes))
+    profiler.count('reduced keyframes', len(reduced))
+    return reduced
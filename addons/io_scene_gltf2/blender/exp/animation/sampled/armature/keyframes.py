@@ -15,7 +15,7 @@
 import typing
 import numpy as np
 from ....cache import cached
-from ...keyframes import Keyframe
+from ...keyframes import SampledKeyframes, sampled_frames
 from ..sampling_cache import get_cache_data
 
 
@@ -28,21 +28,18 @@ def gather_bone_sampled_keyframes(
         slot_identifier: str,
         node_channel_is_animated: bool,
         export_settings
-) -> typing.List[Keyframe]:
+) -> typing.Optional[SampledKeyframes]:
 
     start_frame = export_settings['ranges'][armature_uuid][action_name]['start']
     end_frame = export_settings['ranges'][armature_uuid][action_name]['end']
 
-    keyframes = []
-
-    frame = start_frame
     step = export_settings['gltf_frame_step']
+    frames = sampled_frames(start_frame, end_frame, step)
+    values = np.empty((len(frames), 4 if channel == "rotation_quaternion" else 3))
 
-    while frame <= end_frame:
-        key = Keyframe(None, frame, channel)
-        key.set_id_type("OBJECT")
-
-        mat = get_cache_data(
+    for i, frame in enumerate(frames):
+        # Bones are cached already decomposed
+        trans, rot, scale = get_cache_data(
             'bone',
             armature_uuid,
             bone,
@@ -52,16 +49,13 @@ def gather_bone_sampled_keyframes(
             slot_identifier,
             export_settings)
 
-        trans, rot, scale = mat.decompose()
-
-        key.value = {
+        values[i] = {
             "location": trans,
             "rotation_quaternion": rot,
             "scale": scale
         }[channel]
 
-        keyframes.append(key)
-        frame += step
+    keyframes = SampledKeyframes(frames, values)
 
     if len(keyframes) == 0:
         # For example, option CROP negative frames, but all are negatives
@@ -75,7 +69,7 @@ def gather_bone_sampled_keyframes(
             # baked bones
             if export_settings['gltf_optimize_animation_keep_armature'] is False:
                 # Not keeping if not changing property
-                cst = fcurve_is_constant(keyframes)
+                cst = keyframes.is_constant()
                 return None if cst is True else keyframes
             else:
                 # Keep data, as requested by user. We keep all samples, as user don't want to optimize
@@ -88,19 +82,16 @@ def gather_bone_sampled_keyframes(
         # In that case, if there is no real keyframe on this channel for this given bone,
         # We can ignore these keyframes
         # if there are some fcurve, we can keep only 2 keyframes, first and last
-        cst = fcurve_is_constant(keyframes)
+        cst = keyframes.is_constant()
 
         if node_channel_is_animated is True:  # fcurve on this bone for this property
             # Keep animation, but keep only 2 keyframes if data are not changing
-            return [keyframes[0], keyframes[-1]] if cst is True and len(keyframes) >= 2 else keyframes
+            return keyframes.first_and_last() if cst is True and len(keyframes) >= 2 else keyframes
         else:  # bone is not animated (no fcurve)
             # Not keeping if not changing property if user decided to not keep
             if export_settings['gltf_optimize_animation_keep_armature'] is False:
                 return None if cst is True else keyframes
             else:
                 # Keep at least 2 keyframes if data are not changing
-                return [keyframes[0], keyframes[-1]] if cst is True and len(keyframes) >= 2 else keyframes
-
+                return keyframes.first_and_last() if cst is True and len(keyframes) >= 2 else keyframes
 
-def fcurve_is_constant(keyframes):
-    return all([j < 0.0001 for j in np.ptp([[k.value[i] for i in range(len(keyframes[0].value))] for k in keyframes], axis=0)])
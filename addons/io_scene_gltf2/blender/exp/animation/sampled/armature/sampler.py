@@ -24,6 +24,7 @@ from .....com import gltf2_blender_math
 from ....accessors import gather_accessor
 from ....cache import cached
 from ....tree import VExportNode
+from ...keyframes import reduce_sampled_keyframes
 from .keyframes import gather_bone_sampled_keyframes
 
 
@@ -54,6 +55,15 @@ def gather_bone_sampled_animation_sampler(
         # After check, no need to animate this node for this channel
         return None
 
+    interpolation = __gather_interpolation(
+        node_channel_is_animated,
+        node_channel_interpolation,
+        keyframes,
+        export_settings)
+
+    if interpolation == "LINEAR":
+        keyframes = reduce_sampled_keyframes(keyframes, channel, pose_bone.name, export_settings)
+
     # Now we are raw input/output, we need to convert to glTF data
     input, output = __convert_keyframes(armature_uuid, bone, channel, keyframes, action_name, export_settings)
 
@@ -61,11 +71,7 @@ def gather_bone_sampled_animation_sampler(
         extensions=None,
         extras=None,
         input=input,
-        interpolation=__gather_interpolation(
-            node_channel_is_animated,
-            node_channel_interpolation,
-            keyframes,
-            export_settings),
+        interpolation=interpolation,
         output=output)
 
     export_user_extensions('gather_animation_sampler_hook',
@@ -114,20 +120,18 @@ def __convert_keyframes(armature_uuid, bone_name, channel, keyframes, action_nam
     # - option to start animation at frame 0 for looping
     if armature_uuid in export_settings['slide'].keys(
     ) and action_name in export_settings['slide'][armature_uuid].keys():
-        for k in keyframes:
-            k.frame += -export_settings['slide'][armature_uuid][action_name]
-            k.seconds = k.frame / (bpy.context.scene.render.fps * bpy.context.scene.render.fps_base)
+        keyframes = keyframes.slide(export_settings['slide'][armature_uuid][action_name])
 
-    times = [k.seconds for k in keyframes]
+    seconds = keyframes.seconds(bpy.context.scene.render.fps * bpy.context.scene.render.fps_base)
+    times = seconds.astype(np.float32)
 
-    binary_data = gltf2_io_binary_data.BinaryData.from_list(times, gltf2_io_constants.ComponentType.Float)
+    binary_data = gltf2_io_binary_data.BinaryData(times.tobytes())
     if export_settings['gltf_meshopt_compression']:
-        compressed_time, filter = MeshoptEncoder.encode_attribute(
-            'TIME', np.array(times, dtype=np.float32), 4, export_settings)
+        compressed_time, filter = MeshoptEncoder.defer_attribute('TIME', times, 4)
         binary_data.set_extension(export_settings['gltf_meshopt_extension'], {
-            'buffer': compressed_time,  # to be filled in later by the exporter, use data in placeholder for now
+            'buffer': compressed_time,  # to be filled in later by the exporter, use placeholder for now
             'byteOffset': None,  # to be filled in later by the exporter
-            'byteLength': len(compressed_time),
+            'byteLength': None,  # to be filled in later by the exporter
             'byteStride': 4,
             'count': len(times),
             'mode': 'ATTRIBUTES',
@@ -138,8 +142,8 @@ def __convert_keyframes(armature_uuid, bone_name, channel, keyframes, action_nam
         binary_data,
         gltf2_io_constants.ComponentType.Float,
         len(times),
-        tuple([max(times)]),
-        tuple([min(times)]),
+        tuple([float(seconds.max())]),
+        tuple([float(seconds.min())]),
         gltf2_io_constants.DataType.Scalar,
         None,
         export_settings)
@@ -183,42 +187,16 @@ def __convert_keyframes(armature_uuid, bone_name, channel, keyframes, action_nam
             correction_matrix_local = axis_basis_change
     transform = correction_matrix_local
 
-    values = []
-    fps = (bpy.context.scene.render.fps * bpy.context.scene.render.fps_base)
-    for keyframe in keyframes:
-        # Transform the data and build gltf control points
-        value = gltf2_blender_math.transform(keyframe.value, target_datapath, transform, False)
-        keyframe_value = gltf2_blender_math.mathutils_to_gltf(value)
-
-        if keyframe.in_tangent is not None:
-            # we can directly transform the tangent as it currently is represented by a control point
-            in_tangent = gltf2_blender_math.transform(keyframe.in_tangent, target_datapath, transform, False)
-
-            # the tangent in glTF is relative to the keyframe value and uses seconds
-            if not isinstance(value, list):
-                in_tangent = fps * (in_tangent - value)
-            else:
-                in_tangent = [fps * (in_tangent[i] - value[i]) for i in range(len(value))]
-            keyframe_value = gltf2_blender_math.mathutils_to_gltf(in_tangent) + keyframe_value  # append
-
-        if keyframe.out_tangent is not None:
-            # we can directly transform the tangent as it currently is represented by a control point
-            out_tangent = gltf2_blender_math.transform(keyframe.out_tangent, target_datapath, transform, False)
-
-            # the tangent in glTF is relative to the keyframe value and uses seconds
-            if not isinstance(value, list):
-                out_tangent = fps * (out_tangent - value)
-            else:
-                out_tangent = [fps * (out_tangent[i] - value[i]) for i in range(len(value))]
-            keyframe_value = keyframe_value + gltf2_blender_math.mathutils_to_gltf(out_tangent)  # append
-
-        values += keyframe_value
+    # Transform the data and build gltf control points
+    # No tangents when baking, we are using LINEAR or STEP interpolation
+    values = gltf2_blender_math.transform_array(keyframes.values, target_datapath, transform, False)
+    values = np.ascontiguousarray(gltf2_blender_math.array_to_gltf(values, target_datapath), dtype=np.float32)
 
-     # store the keyframe data in a binary buffer
+    # store the keyframe data in a binary buffer
     component_type = gltf2_io_constants.ComponentType.Float
-    data_type = gltf2_io_constants.DataType.vec_type_from_num(len(keyframes[0].value))
+    data_type = gltf2_io_constants.DataType.vec_type_from_num(values.shape[1])
 
-    binary_values = gltf2_io_binary_data.BinaryData.from_list(values, component_type)
+    binary_values = gltf2_io_binary_data.BinaryData(values.tobytes())
     output_normalized = None
 
     if export_settings['gltf_meshopt_compression']:
@@ -236,9 +214,7 @@ def __convert_keyframes(armature_uuid, bone_name, channel, keyframes, action_nam
         }.get(channel, None)
 
         if compressed_type is not None:
-            num_components = gltf2_io_constants.DataType.num_elements(data_type)
-            compressed_values, filter = MeshoptEncoder.encode_attribute(compressed_type, np.array(
-                values, dtype=np.float32).reshape(-1, num_components), byteStride, export_settings)
+            compressed_values, filter = MeshoptEncoder.defer_attribute(compressed_type, values, byteStride)
 
             if filter == 'QUATERNION':
                 component_type = gltf2_io_constants.ComponentType.Short
@@ -247,10 +223,10 @@ def __convert_keyframes(armature_uuid, bone_name, channel, keyframes, action_nam
                 output_normalized = None
 
             binary_values.set_extension(export_settings['gltf_meshopt_extension'], {
-                'buffer': compressed_values,  # to be filled in later by the exporter, use data in placeholder for now
+                'buffer': compressed_values,  # to be filled in later by the exporter, use placeholder for now
                 'byteOffset': None,  # to be filled in later by the exporter
-                'byteLength': len(compressed_values),
-                'count': len(values) // gltf2_io_constants.DataType.num_elements(data_type),
+                'byteLength': None,  # to be filled in later by the exporter
+                'count': len(values),
                 'byteStride': byteStride,
                 'mode': 'ATTRIBUTES',
                 'filter': filter
@@ -263,7 +239,7 @@ def __convert_keyframes(armature_uuid, bone_name, channel, keyframes, action_nam
     output = gather_accessor(
         binary_values,
         component_type,
-        len(values) // gltf2_io_constants.DataType.num_elements(data_type),
+        len(values),
         None,
         None,
         data_type,
@@ -294,7 +270,7 @@ def __gather_interpolation(node_channel_is_animated, node_channel_interpolation,
             # baked => We have first and last keyframe
             return "STEP"
         else:
-            if keyframes[0].value == keyframes[1].value:
+            if np.array_equal(keyframes.values[0], keyframes.values[1]):
                 return "STEP"
             else:
                 return export_settings['gltf_sampling_interpolation_fallback']
@@ -102,20 +102,19 @@ def __convert_keyframes(blender_type_data, blender_id, channel, keyframes, actio
     # - option SLIDE for negative frames
     # - option to start animation at frame 0 for looping
     if blender_id in export_settings['slide'].keys() and action_name in export_settings['slide'][blender_id].keys():
-        for k in keyframes:
-            k.frame += -export_settings['slide'][blender_id][action_name]
-            k.seconds = k.frame / bpy.context.scene.render.fps
-
-    times = [k.seconds for k in keyframes]
+        keyframes = keyframes.slide(export_settings['slide'][blender_id][action_name])
+        seconds = keyframes.seconds(bpy.context.scene.render.fps)
+    else:
+        seconds = keyframes.seconds(bpy.context.scene.render.fps * bpy.context.scene.render.fps_base)
+    times = seconds.astype(np.float32)
 
-    binary_data = gltf2_io_binary_data.BinaryData.from_list(times, gltf2_io_constants.ComponentType.Float)
+    binary_data = gltf2_io_binary_data.BinaryData(times.tobytes())
     if export_settings['gltf_meshopt_compression']:
-        compressed_time, filter = MeshoptEncoder.encode_attribute(
-            'TIME', np.array(times, dtype=np.float32), 4, export_settings)
+        compressed_time, filter = MeshoptEncoder.defer_attribute('TIME', times, 4)
         binary_data.set_extension(export_settings['gltf_meshopt_extension'], {
-            'buffer': compressed_time,  # to be filled in later by the exporter, use data in placeholder for now
+            'buffer': compressed_time,  # to be filled in later by the exporter, use placeholder for now
             'byteOffset': None,  # to be filled in later by the exporter
-            'byteLength': len(compressed_time),
+            'byteLength': None,  # to be filled in later by the exporter
             'byteStride': 4,
             'count': len(times),
             'mode': 'ATTRIBUTES',
@@ -126,28 +125,22 @@ def __convert_keyframes(blender_type_data, blender_id, channel, keyframes, actio
         binary_data,
         gltf2_io_constants.ComponentType.Float,
         len(times),
-        tuple([max(times)]),
-        tuple([min(times)]),
+        tuple([float(seconds.max())]),
+        tuple([float(seconds.min())]),
         gltf2_io_constants.DataType.Scalar,
         None,
         export_settings)
 
-    values = []
-    for keyframe in keyframes:
-        keyframe_value = __convert_to_gltf(keyframe.value)
-        values += keyframe_value
+    values = keyframes.values.astype(np.float32)
 
-     # store the keyframe data in a binary buffer
+    # store the keyframe data in a binary buffer
     component_type = gltf2_io_constants.ComponentType.Float
-    if type(keyframes[0].value).__name__ != "float":
-        data_type = gltf2_io_constants.DataType.vec_type_from_num(len(keyframes[0].value))
-    else:
-        data_type = gltf2_io_constants.DataType.vec_type_from_num(1)
+    data_type = gltf2_io_constants.DataType.vec_type_from_num(values.shape[1])
 
     output = gather_accessor(
-        gltf2_io_binary_data.BinaryData.from_list(values, component_type),
+        gltf2_io_binary_data.BinaryData(values.tobytes()),
         component_type,
-        len(values) // gltf2_io_constants.DataType.num_elements(data_type),
+        len(values),
         None,
         None,
         data_type,
@@ -167,6 +160,3 @@ def __gather_interpolation(
     # TODOPointer
     return export_settings['gltf_sampling_interpolation_fallback']
 
-
-def __convert_to_gltf(value):
-    return value if type(value).__name__ != "float" else [value]
@@ -14,7 +14,7 @@
 
 import numpy as np
 from ....cache import cached
-from ...keyframes import Keyframe
+from ...keyframes import SampledKeyframes, sampled_frames
 from ..sampling_cache import get_cache_data
 
 
@@ -31,15 +31,11 @@ def gather_object_sampled_keyframes(
     start_frame = export_settings['ranges'][obj_uuid][action_name]['start']
     end_frame = export_settings['ranges'][obj_uuid][action_name]['end']
 
-    keyframes = []
-
-    frame = start_frame
     step = export_settings['gltf_frame_step']
+    frames = sampled_frames(start_frame, end_frame, step)
+    values = np.empty((len(frames), 4 if channel == "rotation_quaternion" else 3))
 
-    while frame <= end_frame:
-        key = Keyframe(None, frame, channel)
-        key.set_id_type("OBJECT")
-
+    for i, frame in enumerate(frames):
         mat = get_cache_data(
             'matrix',
             obj_uuid,
@@ -51,14 +47,13 @@ def gather_object_sampled_keyframes(
             export_settings)
 
         trans, rot, sca = mat.decompose()
-        key.value_total = {
+        values[i] = {
             "location": trans,
             "rotation_quaternion": rot,
             "scale": sca,
         }[channel]
 
-        keyframes.append(key)
-        frame += step
+    keyframes = SampledKeyframes(frames, values)
 
     if len(keyframes) == 0:
         # For example, option CROP negative frames, but all are negatives
@@ -72,7 +67,7 @@ def gather_object_sampled_keyframes(
             # baked object
             if export_settings['gltf_optimize_animation_keep_object'] is False:
                 # Not keeping if not changing property
-                cst = fcurve_is_constant(keyframes)
+                cst = keyframes.is_constant()
                 return None if cst is True else keyframes
             else:
                 # Keep data, as requested by user. We keep all samples, as user don't want to optimize
@@ -81,9 +76,9 @@ def gather_object_sampled_keyframes(
     else:
 
         # For objects, if all values are the same, we keep only first and last
-        cst = fcurve_is_constant(keyframes)
+        cst = keyframes.is_constant()
         if node_channel_is_animated is True:
-            return [keyframes[0], keyframes[-1]] if cst is True and len(keyframes) >= 2 else keyframes
+            return keyframes.first_and_last() if cst is True and len(keyframes) >= 2 else keyframes
         else:
             # baked object
             # Not keeping if not changing property if user decided to not keep
@@ -91,8 +86,5 @@ def gather_object_sampled_keyframes(
                 return None if cst is True else keyframes
             else:
                 # Keep at least 2 keyframes if data are not changing
-                return [keyframes[0], keyframes[-1]] if cst is True and len(keyframes) >= 2 else keyframes
-
+                return keyframes.first_and_last() if cst is True and len(keyframes) >= 2 else keyframes
 
-def fcurve_is_constant(keyframes):
-    return all([j < 0.0001 for j in np.ptp([[k.value[i] for i in range(len(keyframes[0].value))] for k in keyframes], axis=0)])
@@ -24,6 +24,7 @@ from .....com import gltf2_blender_math
 from ....tree import VExportNode
 from ....cache import cached
 from ....accessors import gather_accessor
+from ...keyframes import reduce_sampled_keyframes
 from .keyframes import gather_object_sampled_keyframes
 
 
@@ -50,6 +51,16 @@ def gather_object_sampled_animation_sampler(
         # After check, no need to animate this node for this channel
         return None
 
+    interpolation = __gather_interpolation(
+        node_channel_is_animated,
+        node_channel_interpolation,
+        keyframes,
+        export_settings)
+
+    if interpolation == "LINEAR":
+        keyframes = reduce_sampled_keyframes(
+            keyframes, channel, export_settings['vtree'].nodes[obj_uuid].blender_object.name, export_settings)
+
     # Now we are raw input/output, we need to convert to glTF data
     input, output = __convert_keyframes(obj_uuid, channel, keyframes, action_name, export_settings)
 
@@ -57,11 +68,7 @@ def gather_object_sampled_animation_sampler(
         extensions=None,
         extras=None,
         input=input,
-        interpolation=__gather_interpolation(
-            node_channel_is_animated,
-            node_channel_interpolation,
-            keyframes,
-            export_settings),
+        interpolation=interpolation,
         output=output)
 
     blender_object = export_settings['vtree'].nodes[obj_uuid].blender_object
@@ -97,20 +104,18 @@ def __convert_keyframes(obj_uuid: str, channel: str, keyframes, action_name: str
     # - option SLIDE for negative frames
     # - option to start animation at frame 0 for looping
     if obj_uuid in export_settings['slide'].keys() and action_name in export_settings['slide'][obj_uuid].keys():
-        for k in keyframes:
-            k.frame += -export_settings['slide'][obj_uuid][action_name]
-            k.seconds = k.frame / (bpy.context.scene.render.fps * bpy.context.scene.render.fps_base)
+        keyframes = keyframes.slide(export_settings['slide'][obj_uuid][action_name])
 
-    times = [k.seconds for k in keyframes]
+    seconds = keyframes.seconds(bpy.context.scene.render.fps * bpy.context.scene.render.fps_base)
+    times = seconds.astype(np.float32)
 
-    binary_data = gltf2_io_binary_data.BinaryData.from_list(times, gltf2_io_constants.ComponentType.Float)
+    binary_data = gltf2_io_binary_data.BinaryData(times.tobytes())
     if export_settings['gltf_meshopt_compression']:
-        compressed_time, filter = MeshoptEncoder.encode_attribute(
-            'TIME', np.array(times, dtype=np.float32), 4, export_settings)
+        compressed_time, filter = MeshoptEncoder.defer_attribute('TIME', times, 4)
         binary_data.set_extension(export_settings['gltf_meshopt_extension'], {
-            'buffer': compressed_time,  # to be filled in later by the exporter, use data in placeholder for now
+            'buffer': compressed_time,  # to be filled in later by the exporter, use placeholder for now
             'byteOffset': None,  # to be filled in later by the exporter
-            'byteLength': len(compressed_time),
+            'byteLength': None,  # to be filled in later by the exporter
             'count': len(times),
             'byteStride': 4,
             'mode': 'ATTRIBUTES',
@@ -121,8 +126,8 @@ def __convert_keyframes(obj_uuid: str, channel: str, keyframes, action_name: str
         binary_data,
         gltf2_io_constants.ComponentType.Float,
         len(times),
-        tuple([max(times)]),
-        tuple([min(times)]),
+        tuple([float(seconds.max())]),
+        tuple([float(seconds.min())]),
         gltf2_io_constants.DataType.Scalar,
         None,
         export_settings)
@@ -135,24 +140,18 @@ def __convert_keyframes(obj_uuid: str, channel: str, keyframes, action_name: str
         export_settings['gltf_cameras'] and export_settings['vtree'].nodes[obj_uuid].blender_type == VExportNode.CAMERA) or (
         export_settings['gltf_lights'] and export_settings['vtree'].nodes[obj_uuid].blender_type == VExportNode.LIGHT)
 
-    values = []
-    for keyframe in keyframes:
-
-        # Transform the data and build gltf control points
-        value = gltf2_blender_math.transform(keyframe.value, channel, transform, need_rotation_correction)
-        if is_yup:
-            value = gltf2_blender_math.swizzle_yup(value, channel)
-        keyframe_value = gltf2_blender_math.mathutils_to_gltf(value)
-
-        # No tangents when baking, we are using LINEAR or STEP interpolation
-
-        values += keyframe_value
+    # Transform the data and build gltf control points
+    # No tangents when baking, we are using LINEAR or STEP interpolation
+    values = gltf2_blender_math.transform_array(keyframes.values, channel, transform, need_rotation_correction)
+    if is_yup:
+        values = gltf2_blender_math.swizzle_yup_array(values, channel)
+    values = np.ascontiguousarray(gltf2_blender_math.array_to_gltf(values, channel), dtype=np.float32)
 
     # store the keyframe data in a binary buffer
     component_type = gltf2_io_constants.ComponentType.Float
-    data_type = gltf2_io_constants.DataType.vec_type_from_num(len(keyframes[0].value))
+    data_type = gltf2_io_constants.DataType.vec_type_from_num(values.shape[1])
 
-    binary_values = gltf2_io_binary_data.BinaryData.from_list(values, component_type)
+    binary_values = gltf2_io_binary_data.BinaryData(values.tobytes())
     output_normalized = None
 
     if export_settings['gltf_meshopt_compression']:
@@ -170,9 +169,7 @@ def __convert_keyframes(obj_uuid: str, channel: str, keyframes, action_name: str
         }.get(channel, None)
 
         if compressed_type is not None:
-            num_components = gltf2_io_constants.DataType.num_elements(data_type)
-            compressed_values, filter = MeshoptEncoder.encode_attribute(compressed_type, np.array(
-                values, dtype=np.float32).reshape(-1, num_components), byteStride, export_settings)
+            compressed_values, filter = MeshoptEncoder.defer_attribute(compressed_type, values, byteStride)
 
             if filter == 'QUATERNION':
                 component_type = gltf2_io_constants.ComponentType.Short
@@ -181,10 +178,10 @@ def __convert_keyframes(obj_uuid: str, channel: str, keyframes, action_name: str
                 output_normalized = None
 
             binary_values.set_extension(export_settings['gltf_meshopt_extension'], {
-                'buffer': compressed_values,  # to be filled in later by the exporter, use data in placeholder for now
+                'buffer': compressed_values,  # to be filled in later by the exporter, use placeholder for now
                 'byteOffset': None,  # to be filled in later by the exporter
-                'byteLength': len(compressed_values),
-                'count': len(values) // gltf2_io_constants.DataType.num_elements(data_type),
+                'byteLength': None,  # to be filled in later by the exporter
+                'count': len(values),
                 'byteStride': byteStride,
                 'mode': 'ATTRIBUTES',
                 'filter': filter
@@ -197,7 +194,7 @@ def __convert_keyframes(obj_uuid: str, channel: str, keyframes, action_name: str
     output = gather_accessor(
         binary_values,
         component_type,
-        len(values) // gltf2_io_constants.DataType.num_elements(data_type),
+        len(values),
         None,
         None,
         data_type,
@@ -233,7 +230,7 @@ def __gather_interpolation(
             # baked => We have first and last keyframe
             return "STEP"
         else:
-            if keyframes[0].value == keyframes[1].value:
+            if np.array_equal(keyframes.values[0], keyframes.values[1]):
                 return "STEP"
             else:
                 return export_settings['gltf_sampling_interpolation_fallback']
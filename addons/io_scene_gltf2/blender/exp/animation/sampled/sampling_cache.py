@@ -15,9 +15,11 @@
 import mathutils
 import bpy
 import typing
+import numpy as np
 from .....blender.com.data_path import get_sk_exported
+from .....blender.com.gltf2_blender_math import decompose_array, inverted_safe_array
 from .....blender.com.conversion import inverted_trs_mapping_node, texture_transform_blender_to_gltf, yvof_blender_to_gltf
-from ...cache import datacache
+from ...cache import cached, datacache
 from ...tree import VExportNode
 from ..drivers import get_sk_drivers
 from ..anim_extra_utils import gather_blender_element
@@ -40,32 +42,37 @@ def get_cache_data(path: str,
     data = {}
 
     # Ranges are stored at action level, so no need to give the slot_identifier here
-    min_, max_ = get_range(blender_obj_uuid, action_name, export_settings)
+    frames = get_frames(blender_obj_uuid, action_name, step, only_gather_provided, export_settings)
 
     if only_gather_provided:
         # If object is not in vtree, this is a material,  light or camera for pointers
         obj_uuids = [blender_obj_uuid] if blender_obj_uuid in export_settings['vtree'].nodes.keys() else []
     else:
-        obj_uuids = [uid for (uid, n) in export_settings['vtree'].nodes.items()
-                     if n.blender_type not in [VExportNode.BONE]]
+        obj_uuids = get_sampled_objects(blender_obj_uuid, export_settings)
 
     # For TRACK mode, we reset cache after each track export, so we don't need to keep others objects
     if export_settings['gltf_animation_mode'] in ["NLA_TRACKS"]:
         # If object is not in vtree, this is a material, light or camera for pointers
         obj_uuids = [blender_obj_uuid] if blender_obj_uuid in export_settings['vtree'].nodes.keys() else []
 
+    # Pointers are cached with all objects, or when they are requested. Not when caching a new action of an object
+    cache_pointers = export_settings['gltf_export_anim_pointer'] is True and \
+        (not only_gather_provided or blender_obj_uuid not in export_settings['vtree'].nodes.keys())
+
     depsgraph = bpy.context.evaluated_depsgraph_get()
 
-    frame = min_
-    while frame <= max_:
+    # Pose matrices of armatures, converted to bone local transforms once all frames are sampled
+    armature_samples = {}
+
+    for frame in frames:
         bpy.context.scene.frame_set(int(frame))
         current_instance = {}  # For GN instances, we are going to track instances by their order in instance iterator
 
-        object_caching(data, obj_uuids, current_instance, action_name,
+        object_caching(data, obj_uuids, current_instance, armature_samples, action_name,
                        slot_identifier, frame, depsgraph, export_settings)
 
         # KHR_animation_pointer caching for materials, lights, cameras
-        if export_settings['gltf_export_anim_pointer'] is True:
+        if cache_pointers is True:
             material_nodetree_caching(data, action_name, slot_identifier, frame, export_settings)
             material_caching(data, action_name, slot_identifier, frame, export_settings)
             light_nodetree_caching(data, action_name, slot_identifier, frame, export_settings)
@@ -73,7 +80,34 @@ def get_cache_data(path: str,
             light_caching(data, action_name, slot_identifier, frame, export_settings)
             extras_caching(data, action_name, slot_identifier, frame, export_settings)
 
-        frame += step
+    bone_caching(data, armature_samples, export_settings)
+
+    return data
+
+
+def get_first_cache_data(obj_uuid, step, export_settings):
+    """Cache all objects with their current action, as get_cache_data does when the first object is requested."""
+    return get_cache_data.__wrapped__(None, obj_uuid, None, None, None, step, None, export_settings)
+
+
+def get_timeline_data(obj_uuids, ranges, step, export_settings):
+    """Cache objects with the action currently assigned to each of them, in a single sweep of the timeline.
+
+    Frames are the ones get_cache_data evaluates for these actions, ranges being their (start, end) frame ranges.
+    """
+    data = {}
+
+    min_, max_ = get_range(None, None, export_settings)
+    frames = frames_in_ranges(min_, max_, step, ranges)
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    armature_samples = {}
+
+    for frame in frames:
+        bpy.context.scene.frame_set(int(frame))
+        object_caching(data, obj_uuids, {}, armature_samples, None, None, frame, depsgraph, export_settings)
+
+    bone_caching(data, armature_samples, export_settings)
 
     return data
 
@@ -102,6 +136,84 @@ def get_range(obj_uuid, key, export_settings):
     return min_, max_
 
 
+def get_frames(obj_uuid, key, step, only_gather_provided, export_settings):
+    """Frames to evaluate, every step from the start of the range, skipping frames outside every requested range.
+
+    When caching only the provided object, only its own range is requested.
+    """
+    min_, max_ = get_range(obj_uuid, key, export_settings)
+
+    if export_settings['gltf_animation_mode'] in ["NLA_TRACKS"]:
+        ranges = [(min_, max_)]
+    elif only_gather_provided and key in export_settings['ranges'].get(obj_uuid, {}).keys():
+        ranges = [(export_settings['ranges'][obj_uuid][key]['start'], export_settings['ranges'][obj_uuid][key]['end'])]
+    else:
+        ranges = [(r['start'], r['end']) for obj in export_settings['ranges'].values() for r in obj.values()]
+
+    return frames_in_ranges(min_, max_, step, ranges)
+
+
+def frames_in_ranges(min_, max_, step, ranges):
+    """Frames every step from min_ to max_, that are in at least one of the (start, end) ranges."""
+    # Merge overlapping ranges, so that each frame is checked against one range only
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    frames = []
+    current = 0
+    frame = min_
+    while frame <= max_:
+        while current < len(merged) and merged[current][1] < frame:
+            current += 1
+        if current == len(merged):
+            break
+        if merged[current][0] <= frame:
+            frames.append(frame)
+        frame += step
+    return frames
+
+
+def get_sampled_objects(obj_uuid, export_settings):
+    """Objects to cache when caching all objects at once, for the current animation mode.
+
+    In scene mode, all exported objects are baked. In other modes, only objects that have a frame range
+    (animated, or baked) are requested. GN instances are cached with all other instances of their parent,
+    as they are retrieved by their order in the instance iterator.
+    """
+    vtree = export_settings['vtree']
+
+    obj_uuids = []
+    for uid, n in vtree.nodes.items():
+        if n.blender_type in [VExportNode.BONE, VExportNode.COLLECTION]:
+            continue
+
+        if export_settings['gltf_animation_mode'] == "SCENE":
+            # Same objects as the ones baked by scene export
+            if n.node is None and (export_settings['gltf_armature_object_remove'] is False or not n.blender_object):
+                continue
+        elif len(export_settings['ranges'].get(uid, {})) == 0:
+            continue
+
+        obj_uuids.append(uid)
+
+    if obj_uuid in vtree.nodes.keys() and obj_uuid not in obj_uuids:
+        obj_uuids.append(obj_uuid)
+
+    instance_parents = set(vtree.nodes[uid].parent_uuid for uid in obj_uuids if vtree.nodes[uid].blender_object is None)
+    for uid, n in vtree.nodes.items():
+        if n.blender_object is None and n.blender_type != VExportNode.COLLECTION and n.parent_uuid in instance_parents \
+                and uid not in obj_uuids:
+            obj_uuids.append(uid)
+
+    # Keep vtree order, GN instances are counted in this order
+    order = {uid: i for i, uid in enumerate(vtree.nodes.keys())}
+    return sorted(obj_uuids, key=lambda uid: order[uid])
+
+
 def initialize_data_dict(data, key1, key2, key3, key4, key5):
     # No check on key1, this is already done before calling this function
     if key2 not in data[key1].keys():
@@ -370,8 +482,50 @@ def material_nodetree_caching(data, action_name, slot_identifier, frame, export_
                         :export_settings['KHR_animation_pointer'][None]['materials'][mat]['paths'][path]['length']]
 
 
-def armature_caching(data, obj_uuid, blender_obj, action_name, slot_identifier, frame, export_settings):
+@cached
+def get_bone_sampling(obj_uuid, export_settings):
+    """Bones of an armature to cache, and their rest matrices, computed once per export.
+
+    Local matrix of a bone is left @ inverted parent pose matrix @ pose matrix, where the parent
+    pose matrix is only used if the parent bone is exported too. When the armature object is
+    removed, local matrices of root bones are then multiplied by the armature world matrix.
+    """
+    blender_obj = export_settings['vtree'].nodes[obj_uuid].blender_object
     bones = export_settings['vtree'].get_all_bones(obj_uuid)
+
+    names = []
+    indices = []
+    parent_indices = []
+    lefts = []
+    for bone_uuid in [bone for bone in bones if export_settings['vtree'].nodes[bone].leaf_reference is None]:
+        blender_bone = export_settings['vtree'].nodes[bone_uuid].blender_bone
+        names.append(blender_bone.name)
+        indices.append(blender_obj.pose.bones.find(blender_bone.name))
+
+        if export_settings['vtree'].nodes[bone_uuid].parent_uuid is not None and export_settings['vtree'].nodes[
+                export_settings['vtree'].nodes[bone_uuid].parent_uuid].blender_type == VExportNode.BONE:
+            blender_bone_parent = export_settings['vtree'].nodes[export_settings['vtree']
+                                                                 .nodes[bone_uuid].parent_uuid].blender_bone
+            rest_mat = blender_bone_parent.bone.matrix_local.inverted_safe() @ blender_bone.bone.matrix_local
+            lefts.append(rest_mat.inverted_safe())
+            parent_indices.append(blender_obj.pose.bones.find(blender_bone_parent.name))
+        else:
+            if blender_bone.parent is None:
+                lefts.append(blender_bone.bone.matrix_local.inverted_safe())
+            else:
+                # Bone has a parent, but in export, after filter, is at root of armature
+                lefts.append(mathutils.Matrix.Identity(4))
+            parent_indices.append(-1)
+
+    return {
+        'names': names,
+        'indices': np.array(indices, dtype=np.int64),
+        'parent_indices': np.array(parent_indices, dtype=np.int64),
+        'lefts': np.array([np.array(m) for m in lefts], dtype=np.float64).reshape(-1, 4, 4),
+    }
+
+
+def armature_caching(data, obj_uuid, blender_obj, armature_samples, action_name, slot_identifier, frame, export_settings):
     if blender_obj.animation_data and blender_obj.animation_data.action \
             and blender_obj.animation_data.action_slot \
             and export_settings['gltf_animation_mode'] in ["ACTIVE_ACTIONS", "ACTIONS", "BROADCAST"]:
@@ -390,32 +544,57 @@ def armature_caching(data, obj_uuid, blender_obj, action_name, slot_identifier,
     if key4 not in data[key1][key2][key3].keys():
         data[key1][key2][key3][key4] = {}
 
-    for bone_uuid in [bone for bone in bones if export_settings['vtree'].nodes[bone].leaf_reference is None]:
-        blender_bone = export_settings['vtree'].nodes[bone_uuid].blender_bone
-
-        if export_settings['vtree'].nodes[bone_uuid].parent_uuid is not None and export_settings['vtree'].nodes[
-                export_settings['vtree'].nodes[bone_uuid].parent_uuid].blender_type == VExportNode.BONE:
-            blender_bone_parent = export_settings['vtree'].nodes[export_settings['vtree']
-                                                                 .nodes[bone_uuid].parent_uuid].blender_bone
-            rest_mat = blender_bone_parent.bone.matrix_local.inverted_safe() @ blender_bone.bone.matrix_local
-            matrix = rest_mat.inverted_safe() @ blender_bone_parent.matrix.inverted_safe() @ blender_bone.matrix
-        else:
-            if blender_bone.parent is None:
-                matrix = blender_bone.bone.matrix_local.inverted_safe() @ blender_bone.matrix
-            else:
-                # Bone has a parent, but in export, after filter, is at root of armature
-                matrix = blender_bone.matrix.copy()
+    # Pose matrices of all bones, in one call. Blender matrices are stored column by column
+    poses = np.empty(len(blender_obj.pose.bones) * 16, dtype=np.float32)
+    blender_obj.pose.bones.foreach_get('matrix', poses)
 
-            # Because there is no armature object, we need to apply the TRS of armature to the root bone
-            if export_settings['gltf_armature_object_remove'] is True:
-                matrix = matrix @ blender_obj.matrix_world
+    samples = armature_samples.setdefault((key1, key2, key3), {'frames': [], 'poses': [], 'worlds': []})
+    samples['frames'].append(frame)
+    samples['poses'].append(poses.reshape(-1, 4, 4).transpose(0, 2, 1))
+    samples['worlds'].append(np.array(blender_obj.matrix_world, dtype=np.float64))
 
-        if blender_bone.name not in data[key1][key2][key3][key4].keys():
-            data[key1][key2][key3][key4][blender_bone.name] = {}
-        data[key1][key2][key3][key4][blender_bone.name][frame] = matrix
 
+def bone_caching(data, armature_samples, export_settings):
+    """Store local transforms of bones, computed for all sampled frames of each armature at once."""
+    for (key1, key2, key3), samples in armature_samples.items():
+        sampling = get_bone_sampling(key1, export_settings)
+        if len(sampling['names']) == 0:
+            continue
 
-def object_caching(data, obj_uuids, current_instance, action_name, slot_identifier, frame, depsgraph, export_settings):
+        poses = np.stack(samples['poses']).astype(np.float64)  # frames x pose bones x 4 x 4
+        bone_poses = poses[:, sampling['indices']]
+        has_parent = sampling['parent_indices'] >= 0
+
+        matrices = np.empty_like(bone_poses)
+        matrices[:, ~has_parent] = sampling['lefts'][~has_parent] @ bone_poses[:, ~has_parent]
+        if np.any(has_parent):
+            parent_poses = poses[:, sampling['parent_indices'][has_parent]]
+            parent_inverses = inverted_safe_array(parent_poses.reshape(-1, 4, 4)).reshape(parent_poses.shape)
+            matrices[:, has_parent] = sampling['lefts'][has_parent] @ parent_inverses @ bone_poses[:, has_parent]
+
+        # Because there is no armature object, we need to apply the TRS of armature to the root bone
+        if export_settings['gltf_armature_object_remove'] is True and np.any(~has_parent):
+            worlds = np.stack(samples['worlds'])
+            matrices[:, ~has_parent] = matrices[:, ~has_parent] @ worlds[:, np.newaxis]
+
+        frame_count, bone_count = matrices.shape[:2]
+        locations, rotations, scales = decompose_array(matrices.reshape(-1, 4, 4))
+        locations = locations.reshape(frame_count, bone_count, 3)
+        rotations = rotations.reshape(frame_count, bone_count, 4)
+        scales = scales.reshape(frame_count, bone_count, 3)
+
+        # Bone data are stored as (location, rotation, scale), rotation is w first
+        for bone_index, bone_name in enumerate(sampling['names']):
+            bone_data = data[key1][key2][key3]["bone"].setdefault(bone_name, {})
+            for frame_index, frame in enumerate(samples['frames']):
+                bone_data[frame] = (
+                    locations[frame_index, bone_index],
+                    rotations[frame_index, bone_index],
+                    scales[frame_index, bone_index])
+
+
+def object_caching(data, obj_uuids, current_instance, armature_samples, action_name, slot_identifier, frame, depsgraph,
+                   export_settings):
     for obj_uuid in obj_uuids:
 
         # Do not cache real collection
@@ -494,7 +673,7 @@ def object_caching(data, obj_uuids, current_instance, action_name, slot_identifi
         # Store data for all bones, if object is an armature
 
         if blender_obj and blender_obj.type == "ARMATURE":
-            armature_caching(data, obj_uuid, blender_obj, action_name, slot_identifier, frame, export_settings)
+            armature_caching(data, obj_uuid, blender_obj, armature_samples, action_name, slot_identifier, frame, export_settings)
 
         elif blender_obj is None:  # GN instances
             # case of baking object, for GN instances
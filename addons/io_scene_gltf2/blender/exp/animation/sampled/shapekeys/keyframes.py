@@ -13,11 +13,10 @@
 # limitations under the License.
 
 import bpy
-import typing
 import numpy as np
 from ......blender.com.data_path import get_sk_exported
 from ....cache import cached
-from ...keyframes import Keyframe
+from ...keyframes import SampledKeyframes, sampled_frames
 from ...fcurves.channels import get_channel_groups
 from ...fcurves.keyframes import gather_non_keyed_values
 from ...drivers import get_driver_on_shapekey
@@ -34,10 +33,8 @@ def gather_sk_sampled_keyframes(id_type,
     start_frame = export_settings['ranges'][obj_uuid][action_name]['start']
     end_frame = export_settings['ranges'][obj_uuid][action_name]['end']
 
-    keyframes = []
-
-    frame = start_frame
     step = export_settings['gltf_frame_step']
+    frames = sampled_frames(start_frame, end_frame, step)
     blender_obj = export_settings['vtree'].nodes[obj_uuid].blender_object
 
     if export_settings['gltf_optimize_disable_viewport'] is True:
@@ -72,16 +69,14 @@ def gather_sk_sampled_keyframes(id_type,
 
             non_keyed_values = gather_non_keyed_values(id_type, obj_uuid, channels, None, False, export_settings)
 
-            while frame <= end_frame:
-                key = Keyframe(channels, frame, None)
-                key.set_id_type("KEY")
-                key.value = [c.evaluate(frame) for c in channels if c is not None]
-                # Complete key with non keyed values, if needed
-                if len([c for c in channels if c is not None]) != key.get_target_len():
-                    complete_key(key, non_keyed_values)
-
-                keyframes.append(key)
-                frame += step
+            # Complete keys with non keyed values, if needed
+            keyed = [i for i, c in enumerate(channels) if c is not None]
+            values = np.empty((len(frames), len(channels)))
+            for i in range(len(channels)):
+                if i not in keyed:
+                    values[:, i] = non_keyed_values[i]
+            for i, frame in enumerate(frames):
+                values[i, keyed] = [channels[c].evaluate(frame) for c in keyed]
 
         else:
             # So, drivers will be evaluated, on the custom property
@@ -89,70 +84,42 @@ def gather_sk_sampled_keyframes(id_type,
             non_keyed_values = gather_non_keyed_values(id_type, obj_uuid, channels, None, False, export_settings)
 
             # The bake tool will store the value of the custom property
-            while frame <= end_frame:
-                key = Keyframe([None] * (len(get_sk_exported(blender_obj.data.shape_keys.key_blocks))), frame, 'value')
-                key.set_id_type("KEY")
-                key.value_total = get_cache_data(
-                    'sk',
-                    obj_uuid,
-                    None,
-                    action_name,
-                    frame,
-                    step,
-                    slot_identifier,
-                    export_settings
-                )
-
-                keyframes.append(key)
-                frame += step
+            values = __bake_values(obj_uuid, blender_obj, action_name, frames, step, slot_identifier, export_settings)
 
     else:
         # Full bake, we will go frame by frame. This can take time (more than using evaluate)
 
-        while frame <= end_frame:
-            key = Keyframe([None] * (len(get_sk_exported(blender_obj.data.shape_keys.key_blocks))), frame, 'value')
-            key.set_id_type("KEY")
-            key.value_total = get_cache_data(
-                'sk',
-                obj_uuid,
-                None,
-                action_name,
-                frame,
-                step,
-                slot_identifier,
-                export_settings
-            )
-
-            keyframes.append(key)
-            frame += step
-
-    if len(keyframes) == 0:
+        values = __bake_values(obj_uuid, blender_obj, action_name, frames, step, slot_identifier, export_settings)
+
+    if len(frames) == 0:
         # For example, option CROP negative frames, but all are negatives
         return None
 
     # In case SK has only basis
-    if any([len(k.value) == 0 for k in keyframes]):
+    if values.shape[1] == 0:
         return None
 
+    keyframes = SampledKeyframes(frames, values)
+
     if not export_settings['gltf_optimize_animation']:
         return keyframes
 
     # For sk, if all values are the same, we keep only first and last
-    cst = fcurve_is_constant(keyframes)
-    return [keyframes[0], keyframes[-1]] if cst is True and len(keyframes) >= 2 else keyframes
-
-
-def fcurve_is_constant(keyframes):
-    return all([j < 0.0001 for j in np.ptp([[k.value[i] for i in range(len(keyframes[0].value))] for k in keyframes], axis=0)])
-
-# TODO de-duplicate, but import issue???
-
-
-def complete_key(key: Keyframe, non_keyed_values: typing.Tuple[typing.Optional[float]]):
-    """
-    Complete keyframe with non keyed values
-    """
-    for i in range(0, key.get_target_len()):
-        if i in key.get_indices():
-            continue  # this is a keyed array_index or a SK animated
-        key.set_value_index(i, non_keyed_values[i])
+    return keyframes.first_and_last() if keyframes.is_constant() and len(keyframes) >= 2 else keyframes
+
+
+def __bake_values(obj_uuid, blender_obj, action_name, frames, step, slot_identifier, export_settings):
+    # The bake tool stores the values of all exported shape keys
+    values = np.empty((len(frames), len(get_sk_exported(blender_obj.data.shape_keys.key_blocks))))
+    for i, frame in enumerate(frames):
+        values[i] = get_cache_data(
+            'sk',
+            obj_uuid,
+            None,
+            action_name,
+            frame,
+            step,
+            slot_identifier,
+            export_settings
+        )
+    return values
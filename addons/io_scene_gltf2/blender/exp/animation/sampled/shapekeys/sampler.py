@@ -18,8 +18,8 @@ from ......io.com import gltf2_io, constants as gltf2_io_constants
 from ......io.exp import binary_data as gltf2_io_binary_data
 from ......io.exp.meshopt import MeshoptEncoder
 from ......io.exp.user_extensions import export_user_extensions
-from .....com.gltf2_blender_math import mathutils_to_gltf
 from ....accessors import gather_accessor
+from ...keyframes import reduce_sampled_keyframes
 from .keyframes import gather_sk_sampled_keyframes
 
 
@@ -42,6 +42,12 @@ def gather_sk_sampled_animation_sampler(
         # After check, no need to animate this node for this channel
         return None
 
+    interpolation = __gather_interpolation(export_settings)
+
+    if interpolation == "LINEAR":
+        keyframes = reduce_sampled_keyframes(
+            keyframes, 'value', export_settings['vtree'].nodes[obj_uuid].blender_object.name, export_settings)
+
     # Now we are raw input/output, we need to convert to glTF data
     input, output = __convert_keyframes(obj_uuid, keyframes, action_name, export_settings)
 
@@ -49,7 +55,7 @@ def gather_sk_sampled_animation_sampler(
         extensions=None,
         extras=None,
         input=input,
-        interpolation=__gather_interpolation(export_settings),
+        interpolation=interpolation,
         output=output
     )
 
@@ -87,20 +93,18 @@ def __convert_keyframes(obj_uuid, keyframes, action_name: str, export_settings):
     # - option SLIDE for negative frames
     # - option to start animation at frame 0 for looping
     if obj_uuid in export_settings['slide'].keys() and action_name in export_settings['slide'][obj_uuid].keys():
-        for k in keyframes:
-            k.frame += -export_settings['slide'][obj_uuid][action_name]
-            k.seconds = k.frame / (bpy.context.scene.render.fps * bpy.context.scene.render.fps_base)
+        keyframes = keyframes.slide(export_settings['slide'][obj_uuid][action_name])
 
-    times = [k.seconds for k in keyframes]
+    seconds = keyframes.seconds(bpy.context.scene.render.fps * bpy.context.scene.render.fps_base)
+    times = seconds.astype(np.float32)
 
-    binary_data = gltf2_io_binary_data.BinaryData.from_list(times, gltf2_io_constants.ComponentType.Float)
+    binary_data = gltf2_io_binary_data.BinaryData(times.tobytes())
     if export_settings['gltf_meshopt_compression']:
-        compressed_time, filter = MeshoptEncoder.encode_attribute(
-            'TIME', np.array(times, dtype=np.float32), 4, export_settings)
+        compressed_time, filter = MeshoptEncoder.defer_attribute('TIME', times, 4)
         binary_data.set_extension(export_settings['gltf_meshopt_extension'], {
-            'buffer': compressed_time,  # to be filled in later by the exporter, use data in placeholder for now
+            'buffer': compressed_time,  # to be filled in later by the exporter, use placeholder for now
             'byteOffset': None,  # to be filled in later by the exporter
-            'byteLength': len(compressed_time),
+            'byteLength': None,  # to be filled in later by the exporter
             'count': len(times),
             'byteStride': 4,
             'mode': 'ATTRIBUTES',
@@ -111,34 +115,30 @@ def __convert_keyframes(obj_uuid, keyframes, action_name: str, export_settings):
         binary_data,
         gltf2_io_constants.ComponentType.Float,
         len(times),
-        tuple([max(times)]),
-        tuple([min(times)]),
+        tuple([float(seconds.max())]),
+        tuple([float(seconds.min())]),
         gltf2_io_constants.DataType.Scalar,
         None,
         export_settings)
 
-    values = []
-    for keyframe in keyframes:
-        keyframe_value = mathutils_to_gltf(keyframe.value)
-        values += keyframe_value
+    # One weight per shape key, for each keyframe
+    values = keyframes.values.astype(np.float32).reshape(-1)
 
     component_type = gltf2_io_constants.ComponentType.Float
     data_type = gltf2_io_constants.DataType.Scalar
 
-    binary_values = gltf2_io_binary_data.BinaryData.from_list(values, component_type)
+    binary_values = gltf2_io_binary_data.BinaryData(values.tobytes())
 
     if export_settings['gltf_meshopt_compression']:
         byteStride = 4
 
-        num_components = gltf2_io_constants.DataType.num_elements(data_type)
-        compressed_values, filter = MeshoptEncoder.encode_attribute(
-            'SK_ANIM', np.array(values, dtype=np.float32).reshape(-1, num_components), byteStride, export_settings)
+        compressed_values, filter = MeshoptEncoder.defer_attribute('SK_ANIM', values.reshape(-1, 1), byteStride)
 
         binary_values.set_extension(export_settings['gltf_meshopt_extension'], {
-            'buffer': compressed_values,  # to be filled in later by the exporter, use data in placeholder for now
+            'buffer': compressed_values,  # to be filled in later by the exporter, use placeholder for now
             'byteOffset': None,  # to be filled in later by the exporter
-            'byteLength': len(compressed_values),
-            'count': len(values) // gltf2_io_constants.DataType.num_elements(data_type),
+            'byteLength': None,  # to be filled in later by the exporter
+            'count': len(values),
             'byteStride': byteStride,
             'mode': 'ATTRIBUTES',
             'filter': filter
@@ -147,7 +147,7 @@ def __convert_keyframes(obj_uuid, keyframes, action_name: str, export_settings):
     output = gather_accessor(
         binary_values,
         component_type,
-        len(values) // gltf2_io_constants.DataType.num_elements(data_type),
+        len(values),
         None,
         None,
         data_type,
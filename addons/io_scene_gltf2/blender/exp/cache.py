@@ -41,9 +41,14 @@ def cached_by_key(key):
                 func.__cache = {}
                 func.__export_settings = export_settings
             # use or fill cache
+            profiler = export_settings.get('profiler')
             if cache_key in func.__cache:
+                if profiler is not None:
+                    profiler.count('cache hits')
                 return func.__cache[cache_key]
             else:
+                if profiler is not None:
+                    profiler.count('cache misses')
                 result = func(*args, **kwargs)
                 func.__cache[cache_key] = result
                 return result
@@ -91,12 +96,27 @@ def _is_driver_baking(val):
     return True
 
 
+def _merge_data(cache, data):
+    # Keys are data[obj_uuid][action_name][slot_identifier]: keep actions and slots already cached
+    for obj_uuid, actions in data.items():
+        cached_actions = cache.setdefault(obj_uuid, {})
+        for action_name, slots in actions.items():
+            cached_actions.setdefault(action_name, {}).update(slots)
+
+
 def datacache(func):
 
     def reset_all_cache():
         func.__cache = {}
 
+    def update_all_cache(data):
+        # Add data sampled outside of the decorated function
+        if not hasattr(func, "__cache"):
+            func.reset_cache()
+        _merge_data(func.__cache, data)
+
     func.reset_cache = reset_all_cache
+    func.update_cache = update_all_cache
 
     @functools.wraps(func)
     def wrapper_objectcache(*args, **kwargs):
@@ -120,7 +140,7 @@ def datacache(func):
         # object is not cached yet
         if cache_key_args[1] not in func.__cache.keys():
             result = func(*args)
-            func.__cache = result
+            _merge_data(func.__cache, result)
             # Here are the key used: result[obj_uuid][action_name][slot_identifier][path][bone][frame]
             return result[cache_key_args[1]][cache_key_args[3]][cache_key_args[6]
                                                                 ][cache_key_args[0]][cache_key_args[2]][cache_key_args[4]]
@@ -130,7 +150,7 @@ def datacache(func):
             result = func(*args, only_gather_provided=True)
             # The result can contains multiples animations, in case this is an armature with drivers
             # Need to create all newly retrieved animations
-            func.__cache.update(result)
+            _merge_data(func.__cache, result)
             # Here are the key used: result[obj_uuid][action_name][slot_identifier][path][bone][frame]
             return result[cache_key_args[1]][cache_key_args[3]][cache_key_args[6]
                                                                 ][cache_key_args[0]][cache_key_args[2]][cache_key_args[4]]
@@ -150,7 +170,7 @@ def datacache(func):
                 result = func(*args, only_gather_provided=True)
                 # The result can contains multiples animations, in case this is an armature with drivers
                 # Need to create all newly retrieved animations
-                func.__cache.update(result)
+                _merge_data(func.__cache, result)
                 # Here are the key used: result[obj_uuid][action_name][slot_identifier][path][bone][frame]
                 return result[cache_key_args[1]][cache_key_args[3]][cache_key_args[6]
                                                                     ][cache_key_args[0]][cache_key_args[2]][cache_key_args[4]]
@@ -23,9 +23,11 @@ import traceback
 from ...io.exp import export as gltf2_io_export
 from ...io.exp import draco as gltf2_io_draco_compression_extension
 from ...io.exp.user_extensions import export_user_extensions
+from ...io.com.debug import get_peak_memory, get_profiler
 from ..com import json_util
 from . import gather as gltf2_blender_gather
 from .exporter import GlTF2Exporter
+from .primitive_pipeline import PrimitiveExtractPipeline
 
 
 def save(context, export_settings):
@@ -40,19 +42,24 @@ def save(context, export_settings):
 
     __notify_start(context, export_settings)
     start_time = time.time()
-    pre_export_callbacks = export_settings["pre_export_callbacks"]
-    for callback in pre_export_callbacks:
-        callback(export_settings)
+    profiler = get_profiler(export_settings)
+    with profiler.span('export'):
+        pre_export_callbacks = export_settings["pre_export_callbacks"]
+        for callback in pre_export_callbacks:
+            callback(export_settings)
 
-    json, buffer = __export(export_settings)
+        json, buffer = __export(export_settings)
 
-    post_export_callbacks = export_settings["post_export_callbacks"]
-    for callback in post_export_callbacks:
-        callback(export_settings)
-    __write_file(json, buffer, export_settings)
+        post_export_callbacks = export_settings["post_export_callbacks"]
+        for callback in post_export_callbacks:
+            callback(export_settings)
+        with profiler.span('write file'):
+            __write_file(json, buffer, export_settings)
 
     end_time = time.time()
     __notify_end(context, end_time - start_time, export_settings)
+    if export_settings['gltf_profile_report']:
+        __write_profile_report(end_time - start_time, export_settings)
 
     if not export_settings['gltf_current_frame']:
         bpy.context.scene.frame_set(int(original_frame))
@@ -61,8 +68,13 @@ def save(context, export_settings):
 
 
 def __export(export_settings):
+    profiler = get_profiler(export_settings)
     exporter = GlTF2Exporter(export_settings)
     __gather_gltf(exporter, export_settings)
+    if export_settings.get('primitive_cache') is not None:
+        export_settings['primitive_cache'].report(export_settings)
+    export_settings['log'].info("Root properties deduplicated during traversal: {}".format(exporter.dedup_hits))
+    profiler.count('deduplicated root properties', exporter.dedup_hits)
 
     # If the directory does not exist, create it
     if not os.path.isdir(export_settings['gltf_filedirectory']):
@@ -71,41 +83,39 @@ def __export(export_settings):
             and not os.path.isdir(export_settings['gltf_texturedirectory']):
         os.makedirs(export_settings['gltf_texturedirectory'])
 
-    buffer = __create_buffer(exporter, export_settings)
-    exporter.finalize_images()
+    with profiler.span('buffers'):
+        buffer = __create_buffer(exporter, export_settings)
+    with profiler.span('images'):
+        exporter.finalize_images()
+        if export_settings.get('image_encoder') is not None:
+            export_settings['image_encoder'].finish()
+        if export_settings.get('image_cache') is not None:
+            export_settings['image_cache'].report(export_settings)
+    __count_properties(exporter.glTF, profiler)
 
     export_user_extensions('gather_gltf_extensions_hook', export_settings, exporter.glTF)
     exporter.traverse_extensions()
     passthrough_extensions = []
     export_user_extensions('passthrough_extension_data', export_settings, passthrough_extensions, exporter.glTF)
-    # Detect extensions that are animated
-    # If they are not animated, we can remove the extension if it is empty (all default values), and if default values don't change the shader
-    # But if they are animated, we need to keep the extension, even if it is empty
-    __detect_animated_extensions(exporter.glTF.to_dict(), export_settings)
 
-    # now that addons possibly add some fields in json, we can fix if needed
-    # Also deleting no more needed extensions, based on what we detected above
-    json = __fix_json(exporter.glTF.to_dict(), export_settings, passthrough_extensions)
+    with profiler.span('json finalization'):
+        json = exporter.glTF.to_dict()
 
-    # IOR is a special case where we need to export only if some other extensions are used
-    __check_ior(json, export_settings)
+        # Detect extensions that are animated
+        # If they are not animated, we can remove the extension if it is empty (all default values), and if default values don't change the shader
+        # But if they are animated, we need to keep the extension, even if it is empty
+        __detect_animated_extensions(json, export_settings)
 
-    # Volume is a special case where we need to export only if transmission is used
-    __check_volume(json, export_settings)
+        # now that addons possibly add some fields in json, we can fix if needed
+        # Also deleting no more needed extensions, based on what we detected above
+        # The json is fixed in place, in a single walk
+        __fix_json(json, export_settings, passthrough_extensions)
 
-    # Iridescence is a special case where we we have multiple fields that can make the extension
-    # not exported (factor, thickness)
-    __check_iridescence(json, export_settings)
+        # IOR, volume, iridescence and dispersion are special cases, exported depending on
+        # other extensions or on their values
+        __check_material_extensions(json, export_settings)
 
-    # Dispersion is a special case where we need to export only if volume is used
-    __check_dispersion(json, export_settings)
-
-    __manage_extension_declaration(json, export_settings)
-
-    # We need to run it again, as we can now have some "extensions" dict that are empty
-    # Or extensionsUsed / extensionsRequired that are empty
-    # (because we removed some extensions)
-    json = __fix_json(json, export_settings, passthrough_extensions)
+        __manage_extension_declaration(json, export_settings)
 
     # Convert additional data if needed
     if export_settings['gltf_unused_textures'] is True:
@@ -126,238 +136,129 @@ def __export(export_settings):
     return json, buffer
 
 
-def __check_iridescence(json, export_settings):
+def __check_material_extensions(json, export_settings):
     if 'materials' not in json.keys():
         return
-    animation_pointer_deleted = False
-    for mat_idx, mat in enumerate(json['materials']):
-        if 'extensions' not in mat.keys():
-            continue
-        if 'KHR_materials_iridescence' not in mat['extensions'].keys():
-            continue
 
-        # Check if the factor is animated or not for this material
-        # If not animated and 0.0 => remove the entire extension, because it is not changing the shader
-        # If animated => keep the extension, but we will remove the default value
-        factor_animated = False
-        if 'KHR_materials_iridescence' in export_settings['gltf_animated_extensions'].keys() and \
-                'iridescenceFactor' in export_settings['gltf_animated_extensions']['KHR_materials_iridescence']:
-            # We need to chec for this specific material, as it seems that some material can have animated factor
-            for anim in json['animations']:
-                for channel in anim['channels']:
-                    if not channel['target']['path'] == "pointer":
-                        continue
-                    pointer = channel['target']['extensions']['KHR_animation_pointer']['pointer']
-                    if pointer == f"/materials/{mat_idx}/extensions/KHR_materials_iridescence/iridescenceFactor":
-                        factor_animated = True
-                        break
-                if factor_animated:
-                    break
-
-        # Check if the thickness is animated or not for this material
-        # If not animated and 0.0 => remove the entire extension, because it is not changing the shader
-        # If animated => keep the extension, but we will remove the default value
-        thickness_animated = False
-        if 'KHR_materials_iridescence' in export_settings['gltf_animated_extensions'].keys(
-        ) and 'iridescenceThicknessMaximum' in export_settings['gltf_animated_extensions']['KHR_materials_iridescence']:
-            # We need to chec for this specific material, as it seems that some material can have animated thickness
-            for anim in json['animations']:
-                for channel in anim['channels']:
-                    if not channel['target']['path'] == "pointer":
-                        continue
-                    pointer = channel['target']['extensions']['KHR_animation_pointer']['pointer']
-                    if pointer == f"/materials/{mat_idx}/extensions/KHR_materials_iridescence/iridescenceThicknessMaximum":
-                        thickness_animated = True
-                        break
-                if thickness_animated:
-                    break
-
-        if (not factor_animated and mat['extensions']['KHR_materials_iridescence'].get('iridescenceFactor', 0.0) == 0.0) or (
-                not thickness_animated and mat['extensions']['KHR_materials_iridescence'].get('iridescenceThicknessMaximum', 400.0) == 0.0):
-            # We can remove the entire extension, as no material animates the factor
-            # or the thickness, and default values are not changing the shader
-            del mat['extensions']['KHR_materials_iridescence']
-            # We can remove any animation pointer on this extension for this material,
-            # because it is not animating anything
-            for anim in json.get('animations', []):
-                channels_to_keep = []
-                samplers_to_keep = []
-                for channel_idx, channel in enumerate(anim['channels']):
-                    pointer_matches = (
-                        channel['target']['path'] == "pointer"
-                        and channel['target']['extensions']['KHR_animation_pointer']['pointer']
-                        .startswith(f"/materials/{mat_idx}/extensions/KHR_materials_iridescence/")
-                    )
-                    if pointer_matches:
-                        # We found an animation for this extension, but as no material animates
-                        # the factor or the thickness, and default values are not changing the
-                        # shader, we can remove this animation, as it is not animating anything
-                        animation_pointer_deleted = True
-                    else:
-                        channels_to_keep.append(channel)
-                        samplers_to_keep.append(anim['samplers'][channel['sampler']])
-                anim['channels'] = channels_to_keep
-                anim['samplers'] = samplers_to_keep
-            # If no more channel in this animation, we can remove the entire animation
-            json['animations'] = [anim for anim in json.get('animations', []) if len(anim['channels']) > 0]
-
-            continue
+    animated_pointers = set()
+    for anim in json.get('animations', []):
+        for channel in anim['channels']:
+            if channel['target']['path'] == "pointer":
+                animated_pointers.add(channel['target']['extensions']['KHR_animation_pointer']['pointer'])
+
+    # We keep IOR only if some other extensions are used
+    need_to_export_ior = [
+        'KHR_materials_transmission',
+        'KHR_materials_volume',
+        'KHR_materials_specular'
+    ]
+
+    removed_iridescence = set()
+    removed_dispersion = set()
+    found = {
+        'KHR_materials_ior': False,
+        'KHR_materials_volume': False,
+        'KHR_materials_iridescence': False,
+        'KHR_materials_dispersion': False,
+    }
 
-    # As we may have deleted some animation pointer, we need to check if the extension is still needed
-    if animation_pointer_deleted:
-        animation_pointer_found = False
-        for anim in json.get('animations', []):
-            for channel in anim['channels']:
-                if channel['target']['path'] == "pointer":
-                    animation_pointer_found = True
-                    break
-            if animation_pointer_found:
-                break
-        if not animation_pointer_found:
-            # We have deleted all animation pointer, so we can remove the extension declaration for animation pointer
-            export_settings['gltf_need_to_keep_extension_declaration'] = [
-                e for e in export_settings['gltf_need_to_keep_extension_declaration'] if e != 'KHR_animation_pointer']
-
-    # Check if we need to keep the extension declaration
-    iridescence_found = False
-    for mat in json.get('materials', []):
-        if 'extensions' not in mat.keys():
-            continue
-        if 'KHR_materials_iridescence' not in mat['extensions'].keys():
+    for mat_idx, mat in enumerate(json['materials']):
+        extensions = mat.get('extensions')
+        if not extensions:
             continue
-        iridescence_found = True
-        break
-    if not iridescence_found:
-        export_settings['gltf_need_to_keep_extension_declaration'] = [
-            e for e in export_settings['gltf_need_to_keep_extension_declaration'] if e != 'KHR_materials_iridescence']
 
+        # IOR is a special case where we need to export only if some other extensions are used
+        if 'KHR_materials_ior' in extensions.keys():
+            if not any([e in extensions.keys() for e in need_to_export_ior]):
+                del extensions['KHR_materials_ior']
 
-def __check_ior(json, export_settings):
-    if 'materials' not in json.keys():
-        return
-    for mat in json['materials']:
-        if 'extensions' not in mat.keys():
-            continue
-        if 'KHR_materials_ior' not in mat['extensions'].keys():
-            continue
-        # We keep IOR only if some other extensions are used
-        # And because we may have deleted some extensions, we need to check again
-        need_to_export_ior = [
-            'KHR_materials_transmission',
-            'KHR_materials_volume',
-            'KHR_materials_specular'
-        ]
+        # Volume is a special case where we need to export only if transmission is used
+        if 'KHR_materials_volume' in extensions.keys():
+            if 'KHR_materials_transmission' not in extensions.keys():
+                del extensions['KHR_materials_volume']
 
-        if not any([e in mat['extensions'].keys() for e in need_to_export_ior]):
-            del mat['extensions']['KHR_materials_ior']
+        # Iridescence is a special case where we we have multiple fields that can make the extension
+        # not exported (factor, thickness)
+        # If not animated and 0.0 => remove the entire extension, because it is not changing the shader
+        # If animated => keep the extension, but we will remove the default value
+        if 'KHR_materials_iridescence' in extensions.keys():
+            iridescence = extensions['KHR_materials_iridescence']
+            pointer = f"/materials/{mat_idx}/extensions/KHR_materials_iridescence/"
+            factor_animated = pointer + "iridescenceFactor" in animated_pointers
+            thickness_animated = pointer + "iridescenceThicknessMaximum" in animated_pointers
+            if (not factor_animated and iridescence.get('iridescenceFactor', 0.0) == 0.0) or (
+                    not thickness_animated and iridescence.get('iridescenceThicknessMaximum', 400.0) == 0.0):
+                del extensions['KHR_materials_iridescence']
+                removed_iridescence.add(mat_idx)
+
+        # Dispersion is a special case where we need to export only if volume is used
+        if 'KHR_materials_dispersion' in extensions.keys():
+            if 'KHR_materials_volume' not in extensions.keys():
+                del extensions['KHR_materials_dispersion']
+                removed_dispersion.add(mat_idx)
+
+        for ext in found.keys():
+            if ext in extensions.keys():
+                found[ext] = True
+
+        if len(extensions) == 0:
+            del mat['extensions']
 
     # Check if we need to keep the extension declaration
-    ior_found = False
-    for mat in json.get('materials', []):
-        if 'extensions' not in mat.keys():
-            continue
-        if 'KHR_materials_ior' not in mat['extensions'].keys():
-            continue
-        ior_found = True
-        break
-    if not ior_found:
-        export_settings['gltf_need_to_keep_extension_declaration'] = [
-            e for e in export_settings['gltf_need_to_keep_extension_declaration'] if e != 'KHR_materials_ior']
+    for ext, ext_found in found.items():
+        if not ext_found:
+            export_settings['gltf_need_to_keep_extension_declaration'].discard(ext)
 
-
-def __check_volume(json, export_settings):
-    if 'materials' not in json.keys():
+    if len(removed_iridescence) == 0 and len(removed_dispersion) == 0:
         return
-    for mat in json['materials']:
-        if 'extensions' not in mat.keys():
-            continue
-        if 'KHR_materials_volume' not in mat['extensions'].keys():
-            continue
-        # We keep volume only if transmission is used
-        # And because we may have deleted some extensions, we need to check again
-        if 'KHR_materials_transmission' not in mat['extensions'].keys():
-            del mat['extensions']['KHR_materials_volume']
-
-    # Check if we need to keep the extension declaration
-    volume_found = False
-    for mat in json.get('materials', []):
-        if 'extensions' not in mat.keys():
-            continue
-        if 'KHR_materials_volume' not in mat['extensions'].keys():
-            continue
-        volume_found = True
-        break
-    if not volume_found:
-        export_settings['gltf_need_to_keep_extension_declaration'] = [
-            e for e in export_settings['gltf_need_to_keep_extension_declaration'] if e != 'KHR_materials_volume']
 
+    # We can remove any animation pointer on removed iridescence,
+    # and on materials where dispersion was removed,
+    # because it is not animating anything
+    for anim in json.get('animations', []):
+        channels_to_keep = []
+        for channel in anim['channels']:
+            if channel['target']['path'] == "pointer":
+                tab = channel['target']['extensions']['KHR_animation_pointer']['pointer'].split("/")
+                if len(tab) >= 3 and tab[1] == "materials":
+                    try:
+                        mat_idx = int(tab[2])
+                    except ValueError:
+                        mat_idx = None
+                    if mat_idx in removed_dispersion:
+                        continue
+                    if mat_idx in removed_iridescence and len(tab) >= 6 and \
+                            tab[3] == "extensions" and tab[4] == "KHR_materials_iridescence":
+                        continue
+            channels_to_keep.append(channel)
 
-def __check_dispersion(json, export_settings):
-    if 'materials' not in json.keys():
-        return
-    removed_materials = []
-    for idx_mat, mat in enumerate(json['materials']):
-        if 'extensions' not in mat.keys():
-            continue
-        if 'KHR_materials_dispersion' not in mat['extensions'].keys():
+        if len(channels_to_keep) == len(anim['channels']):
             continue
-        # We keep dispersion only if volume is used
-        # And because we may have deleted some extensions, we need to check again
-        if 'KHR_materials_volume' not in mat['extensions'].keys():
-            del mat['extensions']['KHR_materials_dispersion']
-            removed_materials.append(idx_mat)
 
-    # Check if we need to keep the extension declaration
-    dispersion_found = False
-    for mat in json['materials']:
-        if 'extensions' not in mat.keys():
-            continue
-        if 'KHR_materials_dispersion' not in mat['extensions'].keys():
-            continue
-        dispersion_found = True
-        break
-    if not dispersion_found:
-        export_settings['gltf_need_to_keep_extension_declaration'] = [
-            e for e in export_settings['gltf_need_to_keep_extension_declaration'] if e != 'KHR_materials_dispersion']
-
-    # Remove animation of dispersion if dispersion was removed
-    if len(removed_materials) > 0 and 'animations' in json.keys():
-        remove_animations = []
-        for anim in json['animations']:
-            if 'channels' not in anim.keys():
-                continue
-            removed_channels = []
-            for idx_channel, channel in enumerate(anim['channels']):
-                if channel['target']['path'] != "pointer":
-                    continue
-                if 'extensions' not in channel['target'].keys():
-                    continue
-                if 'KHR_animation_pointer' not in channel['target']['extensions'].keys():
-                    continue
-                pointer = channel['target']['extensions']['KHR_animation_pointer']['pointer']
-                if not pointer.startswith("/materials/"):
-                    continue
-                tab = pointer.split("/")
-                if len(tab) < 3:
-                    continue
-                try:
-                    mat_idx = int(tab[2])
-                except ValueError:
-                    continue
-                if mat_idx in removed_materials:
-                    removed_channels.append(idx_channel)
-            for idx in reversed(removed_channels):
-                del anim['channels'][idx]
+        # Keep only samplers still used, and update channels accordingly
+        sampler_indices = {}
+        for channel in channels_to_keep:
+            sampler_indices.setdefault(channel['sampler'], len(sampler_indices))
+        anim['samplers'] = [anim['samplers'][idx] for idx in sampler_indices.keys()]
+        for channel in channels_to_keep:
+            channel['sampler'] = sampler_indices[channel['sampler']]
+        anim['channels'] = channels_to_keep
 
-            if len(anim['channels']) == 0:
-                remove_animations.append(anim)
-        for anim in reversed(remove_animations):
-            json['animations'].remove(anim)
+    # If no more channel in this animation, we can remove the entire animation
+    if 'animations' in json.keys():
+        json['animations'] = [anim for anim in json['animations'] if len(anim['channels']) > 0]
+        if len(json['animations']) == 0:
+            del json['animations']
+
+        # As we may have deleted some animation pointer, we need to check if the extension is still needed
+        if not any([channel['target']['path'] == "pointer"
+                    for anim in json.get('animations', []) for channel in anim['channels']]):
+            export_settings['gltf_need_to_keep_extension_declaration'].discard('KHR_animation_pointer')
 
 
 def __detect_animated_extensions(obj, export_settings):
     export_settings['gltf_animated_extensions'] = {}
-    export_settings['gltf_need_to_keep_extension_declaration'] = []
+    export_settings['gltf_need_to_keep_extension_declaration'] = set()
     if 'animations' not in obj.keys():
         return
     for anim in obj['animations']:
@@ -379,29 +280,32 @@ def __detect_animated_extensions(obj, export_settings):
 
 
 def __manage_extension_declaration(json, export_settings):
-    if 'extensionsUsed' in json.keys():
-        new_ext_used = []
-        for ext in json['extensionsUsed']:
-            if ext not in export_settings['gltf_need_to_keep_extension_declaration']:
-                continue
-            new_ext_used.append(ext)
-        json['extensionsUsed'] = new_ext_used
-    if 'extensionsRequired' in json.keys():
-        new_ext_required = []
-        for ext in json['extensionsRequired']:
-            if ext not in export_settings['gltf_need_to_keep_extension_declaration']:
-                continue
-            new_ext_required.append(ext)
-        json['extensionsRequired'] = new_ext_required
+    # KHR_mesh_quantization has no data in the json, only a declaration
+    if 'KHR_mesh_quantization' in json.get('extensionsUsed', []):
+        export_settings['gltf_need_to_keep_extension_declaration'].add('KHR_mesh_quantization')
+
+    # Extensions declarations that are no more used are removed, and also the lists if they are now empty
+    for key in ['extensionsUsed', 'extensionsRequired']:
+        if key not in json.keys():
+            continue
+        json[key] = [ext for ext in json[key] if ext in export_settings['gltf_need_to_keep_extension_declaration']]
+        if len(json[key]) == 0:
+            del json[key]
 
 
 def __gather_gltf(exporter, export_settings):
-    active_scene_idx, scenes, animations = gltf2_blender_gather.gather_gltf2(export_settings)
+    profiler = get_profiler(export_settings)
+    with profiler.span('gather'):
+        try:
+            active_scene_idx, scenes, animations = gltf2_blender_gather.gather_gltf2(export_settings)
+        finally:
+            PrimitiveExtractPipeline.stop(export_settings)
 
     unused_skins = export_settings['vtree'].get_unused_skins()
 
     if export_settings['gltf_draco_mesh_compression']:
-        gltf2_io_draco_compression_extension.encode_scene_primitives(scenes, export_settings)
+        with profiler.span('draco'):
+            gltf2_io_draco_compression_extension.encode_scene_primitives(scenes, export_settings)
         exporter.add_draco_extension()
 
     if export_settings['gltf_meshopt_compression']:
@@ -409,17 +313,23 @@ def __gather_gltf(exporter, export_settings):
 
     export_user_extensions('gather_gltf_hook', export_settings, active_scene_idx, scenes, animations)
 
-    for idx, scene in enumerate(scenes):
-        exporter.add_scene(scene, idx == active_scene_idx, export_settings=export_settings)
-    for animation in animations:
-        exporter.add_animation(animation)
-    exporter.manage_gpu_instancing_nodes(export_settings)
-    exporter.traverse_unused_skins(unused_skins)
-    exporter.traverse_additional_textures()
-    exporter.traverse_additional_images()
+    with profiler.span('traversal'):
+        for idx, scene in enumerate(scenes):
+            exporter.add_scene(scene, idx == active_scene_idx, export_settings=export_settings)
+        for animation in animations:
+            exporter.add_animation(animation)
+        exporter.manage_gpu_instancing_nodes(export_settings)
+        exporter.traverse_unused_skins(unused_skins)
+        exporter.traverse_additional_textures()
+        exporter.traverse_additional_images()
 
 
 def __create_buffer(exporter, export_settings):
+    if export_settings['gltf_meshopt_compression']:
+        # Meshopt data is only recorded while gathering, and encoded all at once here
+        with get_profiler(export_settings).span('meshopt'):
+            exporter.encode_meshopt_data()
+
     buffer = bytes()
     if export_settings['gltf_format'] == 'GLB':
         buffer = exporter.finalize_buffer(export_settings['gltf_filedirectory'], is_glb=True)
@@ -433,6 +343,36 @@ def __create_buffer(exporter, export_settings):
     return buffer
 
 
+def __count_properties(gltf, profiler):
+    for name, properties in [
+        ('accessors', gltf.accessors),
+        ('animations', gltf.animations),
+        ('buffer views', gltf.buffer_views),
+        ('images', gltf.images),
+        ('materials', gltf.materials),
+        ('meshes', gltf.meshes),
+        ('nodes', gltf.nodes),
+        ('skins', gltf.skins),
+        ('textures', gltf.textures),
+    ]:
+        profiler.count(name, len(properties))
+    profiler.count('buffer bytes', sum(buffer.byte_length for buffer in gltf.buffers))
+
+
+def __write_profile_report(elapsed, export_settings):
+    path = os.path.splitext(export_settings['gltf_filepath'])[0] + '.profile.json'
+    try:
+        get_profiler(export_settings).write_report(
+            path,
+            file=os.path.basename(export_settings['gltf_filepath']),
+            format=export_settings['gltf_format'],
+            total_time=round(elapsed, 6),
+        )
+        export_settings['log'].info('Profiling report written to {}'.format(path))
+    except OSError as e:
+        export_settings['log'].warning('Unable to write profiling report {}: {}'.format(path, e))
+
+
 def __postprocess_with_gltfpack(export_settings):
 
     gltfpack_binary_file_path = bpy.context.preferences.addons['io_scene_gltf2'].preferences.gltfpack_path_ui
@@ -502,29 +442,41 @@ def __postprocess_with_gltfpack(export_settings):
 
 
 def __fix_json(obj, export_settings, passthrough_extensions=[]):
+    """
+    Fix the json in place, in a single walk, and return it.
+
+    None values and empty collections are removed, once their own content is fixed.
+    Floats are forced to int when they are integers.
+    """
     # TODO: move to custom JSON encoder
-    fixed = obj
     if isinstance(obj, dict):
-        fixed = {}
+        to_remove = []
         for key, value in obj.items():
             if key == 'extras' and value is not None:
-                fixed[key] = value
-                continue
-            if not __should_include_json_value(key, value, export_settings):
                 continue
             if key in passthrough_extensions and value is not None:
-                fixed[key] = value
+                if not __should_include_json_value(key, value, export_settings):
+                    to_remove.append(key)
                 continue
-            fixed[key] = __fix_json(value, export_settings, passthrough_extensions)
+            if isinstance(value, (dict, list)):
+                __fix_json(value, export_settings, passthrough_extensions)
+            elif isinstance(value, float):
+                obj[key] = value = __fix_json(value, export_settings, passthrough_extensions)
+            if not __should_include_json_value(key, value, export_settings):
+                to_remove.append(key)
+        for key in to_remove:
+            del obj[key]
     elif isinstance(obj, list):
-        fixed = []
-        for value in obj:
-            fixed.append(__fix_json(value, export_settings, passthrough_extensions))
+        for idx, value in enumerate(obj):
+            if isinstance(value, (dict, list)):
+                __fix_json(value, export_settings, passthrough_extensions)
+            elif isinstance(value, float):
+                obj[idx] = __fix_json(value, export_settings, passthrough_extensions)
     elif isinstance(obj, float):
         # force floats to int, if they are integers (prevent INTEGER_WRITTEN_AS_FLOAT validator warnings)
         if int(obj) == obj:
             return int(obj)
-    return fixed
+    return obj
 
 
 def __should_include_json_value(key, value, export_settings):
@@ -554,7 +506,7 @@ def __should_include_json_value(key, value, export_settings):
                 # There is an animation, so we can keep this empty collection, and store
                 # that this extension declaration needs to be kept
                 # TODO: this should be detected material by material, not globally
-                export_settings['gltf_need_to_keep_extension_declaration'].append(key)
+                export_settings['gltf_need_to_keep_extension_declaration'].add(key)
                 return True
             else:
                 # There is no animation, so we will not keep this empty collection
@@ -564,11 +516,11 @@ def __should_include_json_value(key, value, export_settings):
     elif not __is_empty_collection(value):
         # If extensions is not empty, export it, always
         # This can be an official extension, or a user extension
-        export_settings['gltf_need_to_keep_extension_declaration'].append(key)
+        export_settings['gltf_need_to_keep_extension_declaration'].add(key)
     elif __is_empty_collection(value) and key in allowed_empty_collections:
         # We can have this empty collection for this extension. So keeping it, and
         # store that this extension declaration needs to be kept
-        export_settings['gltf_need_to_keep_extension_declaration'].append(key)
+        export_settings['gltf_need_to_keep_extension_declaration'].add(key)
     return True
 
 
@@ -604,5 +556,8 @@ def __notify_start(context, export_settings):
 
 def __notify_end(context, elapsed, export_settings):
     export_settings['log'].info('Finished glTF 2.0 export in {} s'.format(elapsed))
+    peak_memory = get_peak_memory()
+    if peak_memory is not None:
+        export_settings['log'].info('Peak memory usage: {:.1f} MB'.format(peak_memory / (1024 * 1024)))
     context.window.cursor_set('DEFAULT')
     print()
@@ -89,6 +89,10 @@ class GlTF2Exporter:
                 buffer_index=1)
         self.__images = {}
 
+        # Hash index of each root level array, so that registering a property does not need to scan the whole list
+        self.__root_indices = {}
+        self.dedup_hits = 0
+
         # mapping of all glTFChildOfRootProperty types to their corresponding root level arrays
         self.__childOfRootPropertyTypeLookup = {
             gltf2_io.Accessor: self.__gltf.accessors,
@@ -123,6 +127,12 @@ class GlTF2Exporter:
             gltf2_io.MaterialOcclusionTextureInfoClass
         ]
 
+        self.__textureInfoTypes = [
+            gltf2_io.TextureInfo,
+            gltf2_io.MaterialNormalTextureInfoClass,
+            gltf2_io.MaterialOcclusionTextureInfoClass
+        ]
+
         self.__traverse(asset)
 
     @property
@@ -131,6 +141,11 @@ class GlTF2Exporter:
             raise RuntimeError("glTF requested, but buffers are not finalized yet")
         return self.__gltf
 
+    def encode_meshopt_data(self):
+        """Encode meshopt data recorded while gathering, and add it to the compressed buffer."""
+        MeshoptEncoder.encode_deferred(self.__additional_buffer.deferred_data(), self.export_settings)
+        self.__additional_buffer.resolve_deferred()
+
     def finalize_buffer(self, output_path=None, buffer_name=None, is_glb=False):
         """Finalize the glTF and write buffers."""
         if self.__finalized:
@@ -144,7 +159,7 @@ class GlTF2Exporter:
                 uri = None
             elif output_path and buffer_name:
                 with open(output_path + uri_to_path(buffer_name), 'wb') as f:
-                    f.write(buffer_to_use.to_bytes())
+                    buffer_to_use.write_to(f)
                 uri = buffer_name
             else:
                 uri = buffer_to_use.to_embed_string()
@@ -184,7 +199,8 @@ class GlTF2Exporter:
         self.__finalized = True
 
         if is_glb:
-            return buffer_to_use.to_bytes()
+            # The BIN chunk is written blob by blob, without laying out the whole buffer in memory
+            return buffer_to_use
 
     def add_draco_extension(self):
         """
@@ -218,27 +234,14 @@ class GlTF2Exporter:
             with open(dst_path, 'wb') as f:
                 f.write(image.data)
 
-    def manage_gpu_instancing(self, node, also_mesh=False):
-        instances = {}
-        for child_idx in node.children:
-            child = self.__gltf.nodes[child_idx]
-            if child.children:
-                continue
-            if child.mesh is not None and child.mesh not in instances.keys():
-                instances[child.mesh] = []
-            if child.mesh is not None:
-                instances[child.mesh].append(child_idx)
-
-        # For now, manage instances only if there are all children of same object
-        # And this instances don't have any children
-        instances = {k: v for k, v in instances.items() if len(v) > 1}
+    def manage_gpu_instancing(self, node_idx, instances):
+        node = self.__gltf.nodes[node_idx]
 
         holders = []
-        if len(instances.keys()) == 1 and also_mesh is False:
+        if len(instances.keys()) == 1 and node.mesh is None:
             # There is only 1 set of instances. So using the parent as instance holder
-            holder = node
             holders = [node]
-        elif len(instances.keys()) > 1 or (len(instances.keys()) == 1 and also_mesh is True):
+        else:
             for h in range(len(instances.keys())):
                 # Create a new node
                 n = gltf2_io.Node(
@@ -267,111 +270,21 @@ class GlTF2Exporter:
             holder = holders[idx]
 
             # Let's retrieve TRS of instances
-            translation = []
-            rotation = []
-            scale = []
-            for inst_node_idx in insts:
-                inst_node = self.__gltf.nodes[inst_node_idx]
-                t = inst_node.translation if inst_node.translation is not None else [0, 0, 0]
-                r = inst_node.rotation if inst_node.rotation is not None else [0, 0, 0, 1]
-                s = inst_node.scale if inst_node.scale is not None else [1, 1, 1]
-                for i in t:
-                    translation.append(i)
-                for i in r:
-                    rotation.append(i)
-                for i in s:
-                    scale.append(i)
+            translation, rotation, scale = self.__gather_gpu_instances_trs(insts)
 
             # Create Accessors for the extension
-
-            binary_data_translation = gltf2_io_binary_data.BinaryData.from_list(translation, ComponentType.Float)
-            binary_data_rotation = gltf2_io_binary_data.BinaryData.from_list(rotation, ComponentType.Float)
-            binary_data_scale = gltf2_io_binary_data.BinaryData.from_list(scale, ComponentType.Float)
-            normalized_rotation = None
-            filter_rotation = None
-            if self.export_settings['gltf_meshopt_compression']:
-
-                byteStride_translation = 12
-                byteStride_rotation = 8
-                byteStride_scale = 12
-
-                num_components_translation = DataType.num_elements(DataType.Vec3)
-                num_components_rotation = DataType.num_elements(DataType.Vec4)
-                num_components_scale = DataType.num_elements(DataType.Vec3)
-                compressed_translation, filter_translation = MeshoptEncoder.encode_attribute('GPU_TRANSLATION', np.array(
-                    translation, dtype=np.float32).reshape(-1, num_components_translation), byteStride_translation, self.export_settings)
-                compressed_rotation, filter_rotation = MeshoptEncoder.encode_attribute('GPU_ROTATION', np.array(
-                    rotation, dtype=np.float32).reshape(-1, num_components_rotation), byteStride_rotation, self.export_settings)
-                compressed_scale, filter_scale = MeshoptEncoder.encode_attribute('GPU_SCALE', np.array(
-                    scale, dtype=np.float32).reshape(-1, num_components_scale), byteStride_scale, self.export_settings)
-
-                binary_data_translation.set_extension(self.export_settings['gltf_meshopt_extension'], {
-                    'buffer': compressed_translation,  # to be filled in later by the exporter, use data in placeholder for now
-                    'byteOffset': None,  # to be filled in later by the exporter
-                    'byteLength': len(compressed_translation),
-                    'count': len(translation) // DataType.num_elements(DataType.Vec3),
-                    'byteStride': byteStride_translation,
-                    'mode': 'ATTRIBUTES',
-                    'filter': filter_translation
-                })
-
-                binary_data_rotation.set_extension(self.export_settings['gltf_meshopt_extension'], {
-                    'buffer': compressed_rotation,  # to be filled in later by the exporter, use data in placeholder for now
-                    'byteOffset': None,  # to be filled in later by the exporter
-                    'byteLength': len(compressed_rotation),
-                    'count': len(rotation) // DataType.num_elements(DataType.Vec4),
-                    'byteStride': byteStride_rotation,
-                    'mode': 'ATTRIBUTES',
-                    'filter': filter_rotation
-                })
-
-                binary_data_scale.set_extension(self.export_settings['gltf_meshopt_extension'], {
-                    'buffer': compressed_scale,  # to be filled in later by the exporter, use data in placeholder for now
-                    'byteOffset': None,  # to be filled in later by the exporter
-                    'byteLength': len(compressed_scale),
-                    'count': len(scale) // DataType.num_elements(DataType.Vec3),
-                    'byteStride': byteStride_scale,
-                    'mode': 'ATTRIBUTES',
-                    'filter': filter_scale
-                })
-
-                normalized_rotation = True if filter_rotation == 'QUATERNION' else None
-
             ext = {}
             ext['attributes'] = {}
-            ext['attributes']['TRANSLATION'] = gather_accessor(
-                binary_data_translation,
-                ComponentType.Float,
-                len(translation) // 3,
-                None,
-                None,
-                DataType.Vec3,
-                None,
-                self.export_settings
-            )
-            rotation_accessor = gather_accessor(
-                binary_data_rotation,
-                ComponentType.Short if filter_rotation == 'QUATERNION' else ComponentType.Float,
-                len(rotation) // 4,
-                None,
-                None,
-                DataType.Vec4,
-                normalized_rotation,
-                self.export_settings
-            )
-            if filter_rotation == 'QUATERNION':
-                rotation_accessor.normalized = True
-            ext['attributes']['ROTATION'] = rotation_accessor
-            ext['attributes']['SCALE'] = gather_accessor(
-                binary_data_scale,
-                ComponentType.Float,
-                len(scale) // 3,
-                None,
-                None,
-                DataType.Vec3,
-                None,
-                self.export_settings
-            )
+            ext['attributes']['TRANSLATION'] = self.__gather_gpu_instancing_accessor(
+                'GPU_TRANSLATION', translation, DataType.Vec3)
+            # All attributes are optional. When quantizing, also skip the ones with only default values
+            quantize = self.export_settings['gltf_gpu_instances_quantization']
+            if not quantize or np.any(rotation != [0.0, 0.0, 0.0, 1.0]):
+                ext['attributes']['ROTATION'] = self.__gather_gpu_instancing_accessor(
+                    'GPU_ROTATION', rotation, DataType.Vec4)
+            if not quantize or np.any(scale != 1.0):
+                ext['attributes']['SCALE'] = self.__gather_gpu_instancing_accessor(
+                    'GPU_SCALE', scale, DataType.Vec3)
 
             # Add extension to the Node, and traverse it
             if not holder.extensions:
@@ -382,70 +295,175 @@ class GlTF2Exporter:
             self.__traverse(holder.extensions)
 
             # Remove children from original Empty
-            new_children = []
-            for child_idx in node.children:
-                if child_idx not in insts:
-                    new_children.append(child_idx)
-            node.children = new_children
+            insts_set = set(insts)
+            node.children = [child_idx for child_idx in node.children if child_idx not in insts_set]
 
             self.nodes_idx_to_remove.extend(insts)
 
-        for child_idx in node.children:
-            child = self.__gltf.nodes[child_idx]
-            self.manage_gpu_instancing(child, also_mesh=child.mesh is not None)
+    def __gather_gpu_instances_trs(self, insts):
+        translation = np.empty((len(insts), 3), dtype=np.float32)
+        rotation = np.empty((len(insts), 4), dtype=np.float32)
+        scale = np.empty((len(insts), 3), dtype=np.float32)
+        translation[:] = [0.0, 0.0, 0.0]
+        rotation[:] = [0.0, 0.0, 0.0, 1.0]
+        scale[:] = [1.0, 1.0, 1.0]
+
+        # Only instances with a non default value are written
+        nodes = [self.__gltf.nodes[inst_node_idx] for inst_node_idx in insts]
+        for data, attr in [(translation, 'translation'), (rotation, 'rotation'), (scale, 'scale')]:
+            rows = [i for i, n in enumerate(nodes) if getattr(n, attr) is not None]
+            if rows:
+                data[rows] = [getattr(nodes[i], attr) for i in rows]
+
+        return translation, rotation, scale
+
+    def __gather_gpu_instancing_accessor(self, attribute_name, data, data_type):
+        component_type = ComponentType.Float
+        normalized = None
+
+        if self.export_settings['gltf_meshopt_compression']:
+            byteStride = 8 if data_type == DataType.Vec4 else 12
+            compressed, filter = MeshoptEncoder.defer_attribute(attribute_name, data, byteStride)
+            if filter == 'QUATERNION':
+                # The quaternion filter decodes to normalized shorts
+                component_type = ComponentType.Short
+                normalized = True
+                fallback = np.round(np.clip(data, -1.0, 1.0) * 32767).astype(np.int16)
+            else:
+                fallback = data
+            binary_data = gltf2_io_binary_data.BinaryData(fallback.tobytes())
+            binary_data.set_extension(self.export_settings['gltf_meshopt_extension'], {
+                'buffer': compressed,  # to be filled in later by the exporter, use placeholder for now
+                'byteOffset': None,  # to be filled in later by the exporter
+                'byteLength': None,  # to be filled in later by the exporter
+                'count': len(data),
+                'byteStride': byteStride,
+                'mode': 'ATTRIBUTES',
+                'filter': filter
+            })
+
+        elif self.export_settings['gltf_gpu_instances_quantization'] and (
+                attribute_name == 'GPU_ROTATION' or (attribute_name == 'GPU_SCALE' and np.all(np.abs(data) <= 1.0))):
+            # Normalized shorts. Allowed for rotation by EXT_mesh_gpu_instancing,
+            # and for scale by KHR_mesh_quantization
+            component_type = ComponentType.Short
+            normalized = True
+            quantized = np.round(np.clip(data, -1.0, 1.0) * 32767).astype(np.int16)
+            byteStride = None
+            if data_type == DataType.Vec3:
+                # Each element must be aligned to 4 bytes, so pad it
+                quantized = np.pad(quantized, ((0, 0), (0, 1)))
+                byteStride = 8
+                self.__append_unique_and_get_index(self.__gltf.extensions_used, 'KHR_mesh_quantization')
+                self.__append_unique_and_get_index(self.__gltf.extensions_required, 'KHR_mesh_quantization')
+            binary_data = gltf2_io_binary_data.BinaryData(quantized.tobytes(), byteStride=byteStride)
+
+        else:
+            binary_data = gltf2_io_binary_data.BinaryData(data.tobytes())
+
+        return gather_accessor(
+            binary_data,
+            component_type,
+            len(data),
+            None,
+            None,
+            data_type,
+            normalized,
+            self.export_settings
+        )
+
+    def __detect_gpu_instances(self):
+        """
+        Find, in a single sweep over nodes used by scenes, the parents holding instances.
+
+        Instances are leaf children of a same parent sharing the same mesh.
+        Return a list of (parent node index, {mesh index: [instance node indices]}).
+        """
+        nodes = self.__gltf.nodes
+        is_leaf_mesh = [n.mesh is not None and not n.children for n in nodes]
+
+        candidates = []
+        visited = set()
+        stack = [node_idx for scene in reversed(self.__gltf.scenes) for node_idx in reversed(scene.nodes)]
+        while stack:
+            node_idx = stack.pop()
+            if node_idx in visited:
+                continue
+            visited.add(node_idx)
+            children = nodes[node_idx].children or []
+
+            instances = {}
+            for child_idx in children:
+                if is_leaf_mesh[child_idx]:
+                    instances.setdefault(nodes[child_idx].mesh, []).append(child_idx)
+            # For now, manage instances only if there are all children of same object
+            # And this instances don't have any children
+            instances = {k: v for k, v in instances.items() if len(v) > 1}
+            if instances:
+                candidates.append((node_idx, instances))
+
+            stack.extend(reversed(children))
+
+        return candidates
 
     def manage_gpu_instancing_nodes(self, export_settings):
-        if export_settings['gltf_gpu_instances'] is True:
-            for scene_num in range(len(self.__gltf.scenes)):
-                # Modify the scene data in case of EXT_mesh_gpu_instancing export
-
-                self.nodes_idx_to_remove = []
-                for node_idx in self.__gltf.scenes[scene_num].nodes:
-                    node = self.__gltf.nodes[node_idx]
-                    if node.mesh is None:
-                        self.manage_gpu_instancing(node)
-                    else:
-                        self.manage_gpu_instancing(node, also_mesh=True)
-
-                # Slides other nodes index
-
-                self.nodes_idx_to_remove.sort()
-                for node_idx in self.__gltf.scenes[scene_num].nodes:
-                    self.recursive_slide_node_idx(node_idx)
-
-                new_node_list = []
-                for node_idx in self.__gltf.scenes[scene_num].nodes:
-                    len_ = len([i for i in self.nodes_idx_to_remove if i < node_idx])
-                    new_node_list.append(node_idx - len_)
-                self.__gltf.scenes[scene_num].nodes = new_node_list
-
-                for skin in self.__gltf.skins:
-                    new_joint_list = []
-                    for node_idx in skin.joints:
-                        len_ = len([i for i in self.nodes_idx_to_remove if i < node_idx])
-                        new_joint_list.append(node_idx - len_)
-                    skin.joints = new_joint_list
-                    if skin.skeleton is not None:
-                        len_ = len([i for i in self.nodes_idx_to_remove if i < skin.skeleton])
-                        skin.skeleton = skin.skeleton - len_
-
-            # Remove animation channels that was targeting a node that will be removed
-            new_animation_list = []
-            for animation in self.__gltf.animations:
-                new_channel_list = []
-                for channel in animation.channels:
-                    if channel.target.node not in self.nodes_idx_to_remove:
-                        new_channel_list.append(channel)
-                animation.channels = new_channel_list
-                if len(animation.channels) > 0:
-                    new_animation_list.append(animation)
-            self.__gltf.animations = new_animation_list
-
-            # TODO: remove unused animation accessors?
-
-            # And now really remove nodes
-            self.__gltf.nodes = [node for idx, node in enumerate(
-                self.__gltf.nodes) if idx not in self.nodes_idx_to_remove]
+        if export_settings['gltf_gpu_instances'] is not True:
+            return
+
+        # Modify the scene data in case of EXT_mesh_gpu_instancing export
+        self.nodes_idx_to_remove = []
+        for node_idx, instances in self.__detect_gpu_instances():
+            self.manage_gpu_instancing(node_idx, instances)
+
+        if len(self.nodes_idx_to_remove) == 0:
+            return
+
+        # New index of each node, once instance nodes are removed
+        removed = np.zeros(len(self.__gltf.nodes), dtype=bool)
+        removed[self.nodes_idx_to_remove] = True
+        new_idx = (np.arange(len(removed)) - np.cumsum(removed)).tolist()
+        removed = removed.tolist()
+
+        # Slides other nodes index
+        for node in self.__gltf.nodes:
+            if node.children:
+                node.children = [new_idx[child_idx] for child_idx in node.children]
+
+        for scene in self.__gltf.scenes:
+            scene.nodes = [new_idx[node_idx] for node_idx in scene.nodes]
+
+        for skin in self.__gltf.skins:
+            skin.joints = [new_idx[node_idx] for node_idx in skin.joints]
+            if skin.skeleton is not None:
+                skin.skeleton = new_idx[skin.skeleton]
+
+        # Remove animation channels that was targeting a node that will be removed
+        new_animation_list = []
+        for animation in self.__gltf.animations:
+            new_channel_list = []
+            for channel in animation.channels:
+                target = channel.target
+                if target.node is not None:
+                    if removed[target.node]:
+                        continue
+                    target.node = new_idx[target.node]
+                elif target.extensions and "KHR_animation_pointer" in target.extensions:
+                    pointer = target.extensions["KHR_animation_pointer"]["pointer"].split("/")
+                    if len(pointer) > 2 and pointer[1] == "nodes":
+                        if removed[int(pointer[2])]:
+                            continue
+                        pointer[2] = str(new_idx[int(pointer[2])])
+                        target.extensions["KHR_animation_pointer"]["pointer"] = "/".join(pointer)
+                new_channel_list.append(channel)
+            animation.channels = new_channel_list
+            if len(animation.channels) > 0:
+                new_animation_list.append(animation)
+        self.__gltf.animations = new_animation_list
+
+        # TODO: remove unused animation accessors?
+
+        # And now really remove nodes
+        self.__gltf.nodes = [node for node, r in zip(self.__gltf.nodes, removed) if not r]
 
     def add_scene(self, scene: gltf2_io.Scene, active: bool = False, export_settings=None):
         """
@@ -463,19 +481,6 @@ class GlTF2Exporter:
         if active:
             self.__gltf.scene = scene_num
 
-    def recursive_slide_node_idx(self, node_idx):
-        node = self.__gltf.nodes[node_idx]
-
-        new_node_children = []
-        for child_idx in node.children:
-            len_ = len([i for i in self.nodes_idx_to_remove if i < child_idx])
-            new_node_children.append(child_idx - len_)
-
-        for child_idx in node.children:
-            self.recursive_slide_node_idx(child_idx)
-
-        node.children = new_node_children
-
     def traverse_unused_skins(self, skins):
         for s in skins:
             self.__traverse(s)
@@ -484,6 +489,8 @@ class GlTF2Exporter:
         if self.export_settings['gltf_unused_textures'] is True:
             tab = []
             for tex in self.export_settings['additional_texture_export']:
+                if self.__has_empty_image(tex):
+                    continue
                 res = self.__traverse(tex)
                 tab.append(res)
 
@@ -494,7 +501,10 @@ class GlTF2Exporter:
             for img in [img for img in bpy.data.images if img.source != "VIEWER"]:
                 # TODO manage full / partial / custom via hook ...
                 if img.name not in self.export_settings['exported_images'].keys():
-                    self.__traverse(get_gltf_image_from_blender_image(img.name, self.export_settings))
+                    image = get_gltf_image_from_blender_image(img.name, self.export_settings)
+                    if self.__is_empty_image(image):
+                        continue
+                    self.__traverse(image)
 
     def add_animation(self, animation: gltf2_io.Animation):
         """
@@ -523,14 +533,73 @@ class GlTF2Exporter:
 
         return self.__append_unique_and_get_index(gltf_list, property)
 
-    @staticmethod
-    def __append_unique_and_get_index(target: list, obj):
-        if obj in target:
-            return target.index(obj)
-        else:
-            index = len(target)
+    def __append_unique_and_get_index(self, target: list, obj):
+        index = self.__get_root_index(target)
+        key = self.__root_index_key(obj)
+        if key is None:
+            # Unhashable object (for example a dict in a root extension list): keep linear lookup
+            if obj in target:
+                self.dedup_hits += 1
+                return target.index(obj)
             target.append(obj)
-            return index
+            index['count'] = len(target)
+            return len(target) - 1
+
+        idx = index['keys'].get(key)
+        if idx is not None:
+            self.dedup_hits += 1
+            return idx
+
+        idx = len(target)
+        target.append(obj)
+        index['keys'][key] = idx
+        index['count'] = len(target)
+        return idx
+
+    def __get_root_index(self, target: list):
+        """Get the hash index of a root level array, updating it if the list was modified outside the exporter."""
+        index = self.__root_indices.get(id(target))
+        if index is None or index['list'] is not target or index['count'] > len(target):
+            # Keep a reference to the list, so that its id can't be reused by another list
+            index = {'list': target, 'keys': {}, 'count': 0}
+            self.__root_indices[id(target)] = index
+
+        # Some lists can be filled directly (extensionsUsed, ...). Index the items we don't know yet
+        for idx in range(index['count'], len(target)):
+            key = self.__root_index_key(target[idx])
+            if key is not None:
+                index['keys'].setdefault(key, idx)
+        index['count'] = len(target)
+
+        return index
+
+    @staticmethod
+    def __root_index_key(obj):
+        # glTF properties don't define __eq__, so they are compared by identity
+        if type(obj).__eq__ is object.__eq__:
+            return ('id', id(obj))
+        try:
+            hash(obj)
+        except TypeError:
+            return None
+        return ('value', type(obj), obj)
+
+    @staticmethod
+    def __has_empty_image(texture):
+        # Textures already traversed reference their image by index, and are not empty
+        if not isinstance(texture, gltf2_io.Texture):
+            return False
+        return GlTF2Exporter.__is_empty_image(texture.source)
+
+    @staticmethod
+    def __is_empty_image(image):
+        if not isinstance(image, gltf2_io.Image):
+            return False
+        if isinstance(image.buffer_view, gltf2_io_binary_data.BinaryData):
+            return image.buffer_view.byte_length == 0
+        if isinstance(image.uri, gltf2_io_image_data.ImageData):
+            return image.uri.byte_length == 0
+        return False
 
     def __add_image(self, image: gltf2_io_image_data.ImageData):
         self.__images[image.adjusted_name] = image
@@ -624,6 +693,11 @@ class GlTF2Exporter:
                 node[key] = self.__traverse(node[key])
             return node
 
+        # Images encoded after gathering can be empty, if encoding failed. They are not exported,
+        # as empty images are not when gathering
+        if type(node) in self.__textureInfoTypes and self.__has_empty_image(node.index):
+            return None
+
         # traverse into any other property
         if type(node) in self.__propertyTypeLookup:
             return self.__traverse_property(node)
@@ -15,12 +15,14 @@
 import bpy
 
 from ...io.com import gltf2_io
+from ...io.com.debug import get_profiler
 from ...io.exp.user_extensions import export_user_extensions
 from ..com.extras import generate_extras
 from .cache import cached
 from . import nodes as gltf2_blender_gather_nodes
 from . import joints as gltf2_blender_gather_joints
 from . import tree as gltf2_blender_gather_tree
+from .primitive_pipeline import PrimitiveExtractPipeline
 from .animation.sampled.object.keyframes import get_cache_data
 from .animation.animations import gather_animations
 
@@ -55,7 +57,8 @@ def gather_gltf2(export_settings):
         if export_settings['gltf_animations']:
             # resetting object cache
             get_cache_data.reset_cache()
-            animations += gather_animations(export_settings)
+            with get_profiler(export_settings).span('animations'):
+                animations += gather_animations(export_settings)
         if bpy.context.scene.name == store_user_scene.name:
             active_scene = len(scenes) - 1
 
@@ -100,39 +103,43 @@ def __gather_scene(blender_scene, export_settings):
         else:
             export_settings['KHR_animation_pointer']['extras']['objects'][id(blender_scene)]['glTF_extras'] = scene
 
-    vtree = gltf2_blender_gather_tree.VExportTree(export_settings)
-    vtree.construct(blender_scene)
-    vtree.search_missing_armature()  # In case armature are no parented correctly
-    if export_settings['gltf_armature_object_remove'] is True:
-        vtree.check_if_we_can_remove_armature()  # Check if we can remove the armatures objects
+    with get_profiler(export_settings).span('vtree'):
+        vtree = gltf2_blender_gather_tree.VExportTree(export_settings)
+        vtree.construct(blender_scene)
+        vtree.search_missing_armature()  # In case armature are no parented correctly
+        if export_settings['gltf_armature_object_remove'] is True:
+            vtree.check_if_we_can_remove_armature()  # Check if we can remove the armatures objects
 
-    export_user_extensions('vtree_before_filter_hook', export_settings, vtree)
+        export_user_extensions('vtree_before_filter_hook', export_settings, vtree)
 
-    # Now, we can filter tree if needed
-    vtree.filter()
+        # Now, we can filter tree if needed
+        vtree.filter()
 
-    if export_settings['gltf_flatten_bones_hierarchy'] is True:
-        vtree.break_bone_hierarchy()
+        if export_settings['gltf_flatten_bones_hierarchy'] is True:
+            vtree.break_bone_hierarchy()
 
-    vtree.bake_armature_bone_list()  # Used in case we remove the armature. Doing it after filter, as filter can remove some bones
-    # And ater breaking bone hierarchy, as this changed the root list
+        vtree.bake_armature_bone_list()  # Used in case we remove the armature. Doing it after filter, as filter can remove some bones
+        # And ater breaking bone hierarchy, as this changed the root list
 
-    if export_settings['gltf_flatten_obj_hierarchy'] is True:
-        vtree.break_obj_hierarchy()
+        if export_settings['gltf_flatten_obj_hierarchy'] is True:
+            vtree.break_obj_hierarchy()
 
-    # Now we filtered the tree, in case of Collection Export,
-    # We need to calculate the collection center,
-    # In order to set the scene center to the collection center
-    # Using object center barycenter for now (another option could be to use bounding box center)
-    if export_settings['gltf_collection'] and export_settings['gltf_at_collection_center']:
-        vtree.calculate_collection_center()
+        # Now we filtered the tree, in case of Collection Export,
+        # We need to calculate the collection center,
+        # In order to set the scene center to the collection center
+        # Using object center barycenter for now (another option could be to use bounding box center)
+        if export_settings['gltf_collection'] and export_settings['gltf_at_collection_center']:
+            vtree.calculate_collection_center()
 
-    vtree.variants_reset_to_original()
+        vtree.variants_reset_to_original()
 
-    export_user_extensions('vtree_after_filter_hook', export_settings, vtree)
+        export_user_extensions('vtree_after_filter_hook', export_settings, vtree)
 
     export_settings['vtree'] = vtree
 
+    # Primitives of meshes can be created in worker processes, while nodes are gathered
+    PrimitiveExtractPipeline.start(vtree, export_settings)
+
     # If we don't remove armature object, we can't have bones directly at root of scene
     # So looping only on root nodes, as they are all nodes, not bones
     if export_settings['gltf_armature_object_remove'] is False:
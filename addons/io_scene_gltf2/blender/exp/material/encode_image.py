@@ -18,6 +18,9 @@ from typing import Optional, Tuple
 import numpy as np
 import tempfile
 import enum
+from ....io.com.debug import profiled
+from ....io.exp.image_encoder import ImageEncoder
+from ....io.exp.image_cache import ImageCache
 
 
 class Channel(enum.IntEnum):
@@ -225,7 +228,13 @@ class ExportImage:
             all(fill.tile == self.fills[list(self.fills.keys())[0]].tile for fill in self.fills.values())
         )
 
+    @profiled('image encoding')
     def encode(self, mime_type: Optional[str], export_settings) -> Tuple[bytes, bool]:
+        """Encode the image.
+
+        PNG images composed from channels are encoded by worker threads, when enabled.
+        Their bytes are then a placeholder, resolved when buffers or files are written.
+        """
         self.file_format = {
             "image/jpeg": "JPEG",
             "image/png": "PNG",
@@ -345,6 +354,25 @@ class ExportImage:
             pixels = np.array([1.0, 1.0, 1.0, 1.0], np.float32)
             return self.__encode_from_numpy_array(pixels, (1, 1), export_settings)
 
+        # Same sources composed the same way were already sent to the encoder
+        key = self.__recipe_key(lambda image: image.name_full)
+        encoder = ImageEncoder.get(export_settings) if self.file_format == 'PNG' else None
+        if encoder is not None:
+            deferred = encoder.lookup(key)
+            if deferred is not None:
+                return deferred
+
+        # Or encoded by a previous export
+        cache = ImageCache.get(export_settings)
+        cache_key = None
+        if cache is not None:
+            recipe = self.__recipe_key(lambda image: _image_source_id(cache, image))
+            if recipe is not None:
+                cache_key = cache.key(recipe, self.file_format, export_settings['gltf_image_quality'])
+                data = cache.load(cache_key)
+                if data is not None:
+                    return data
+
         width = max(image.size[0] for image in images)
         height = max(image.size[1] for image in images)
 
@@ -375,9 +403,46 @@ class ExportImage:
 
         tmp_buf = None  # GC this
 
-        return self.__encode_from_numpy_array(out_buf, (width, height), export_settings)
+        return self.__encode_from_numpy_array(
+            out_buf, (width, height), export_settings, key=key, cache_key=cache_key)
+
+    def __recipe_key(self, image_id):
+        """Describe how the image is composed from Blender images, identified by image_id.
+
+        Return None if an image can't be identified.
+        """
+        fills = []
+        for dst_chan, fill in sorted(self.fills.items()):
+            if isinstance(fill, (FillImage, FillImageRGB2BW)):
+                source = image_id(fill.image)
+                if source is None:
+                    return None
+            if isinstance(fill, FillImage):
+                fills.append((int(dst_chan), 'image', source, int(fill.src_chan)))
+            elif isinstance(fill, FillImageRGB2BW):
+                fills.append((int(dst_chan), 'bw', source))
+            elif isinstance(fill, FillWith):
+                fills.append((int(dst_chan), 'value', fill.value))
+            elif isinstance(fill, FillWhite):
+                fills.append((int(dst_chan), 'white'))
+            else:
+                return None
+        return (self.file_format, tuple(fills))
+
+    def __encode_from_numpy_array(self, pixels: np.ndarray, dim: Tuple[int, int], export_settings,
+                                  key=None, cache_key=None) -> bytes:
+        # PNG can be encoded without Blender, on worker threads.
+        # Other formats need Blender to save a temporary image.
+        encoder = ImageEncoder.get(export_settings) if self.file_format == 'PNG' else None
+        if encoder is not None:
+            deferred = encoder.submit(key, pixels, dim[0], dim[1], Channel.A in self.fills)
+            if cache_key is not None:
+                cache = ImageCache.get(export_settings)
+                # Failed encodings are not stored
+                deferred.future.add_done_callback(
+                    lambda future: cache.store(cache_key, future.result()) if future.exception() is None else None)
+            return deferred
 
-    def __encode_from_numpy_array(self, pixels: np.ndarray, dim: Tuple[int, int], export_settings) -> bytes:
         with TmpImageGuard() as guard:
             guard.image = bpy.data.images.new(
                 "##gltf-export:tmp-image##",
@@ -389,7 +454,11 @@ class ExportImage:
 
             tmp_image.pixels.foreach_set(pixels)
 
-            return _encode_temp_image(tmp_image, self.file_format, export_settings)
+            data = _encode_temp_image(tmp_image, self.file_format, export_settings)
+
+        if cache_key is not None:
+            ImageCache.get(export_settings).store(cache_key, data)
+        return data
 
     def __encode_from_image(self, image: bpy.types.Image, export_settings) -> bytes:
         # See if there is an existing file we can use.
@@ -416,11 +485,26 @@ class ExportImage:
                 if data[8:12] == b'WEBP':
                     return data
 
+        # Converting the file to another format may have been done by a previous export
+        cache = ImageCache.get(export_settings)
+        cache_key = None
+        if cache is not None:
+            source = _image_source_id(cache, image)
+            if source is not None:
+                cache_key = cache.key(('copy', source), self.file_format, export_settings['gltf_image_quality'])
+                data = cache.load(cache_key)
+                if data is not None:
+                    return data
+
         # Copy to a temp image and save.
         with TmpImageGuard() as guard:
             make_temp_image_copy(guard, src_image=image)
             tmp_image = guard.image
-            return _encode_temp_image(tmp_image, self.file_format, export_settings)
+            data = _encode_temp_image(tmp_image, self.file_format, export_settings)
+
+        if cache_key is not None:
+            cache.store(cache_key, data)
+        return data
 
     def __encode_from_image_tile(self, udim_image, tile, export_settings):
         data = None
@@ -448,6 +532,30 @@ class ExportImage:
         return b''
 
 
+def _image_source_id(cache: ImageCache, image: bpy.types.Image):
+    """Identify a Blender image by the hash of its file or packed data, for the image cache.
+
+    Images with unsaved changes, or not coming from a file, can't be identified.
+    """
+    if image.source != 'FILE' or image.is_dirty:
+        return None
+
+    def read_source():
+        if image.packed_file is not None:
+            return image.packed_file.data
+        src_path = bpy.path.abspath(image.filepath_raw, library=image.library)
+        if not os.path.isfile(src_path):
+            return None
+        with open(src_path, 'rb') as f:
+            return f.read()
+
+    source_hash = cache.source_hash(image.name_full, read_source)
+    if source_hash is None:
+        return None
+    # Settings used when reading pixels change the result too
+    return (source_hash, image.colorspace_settings.name, image.alpha_mode, tuple(image.size))
+
+
 def _encode_temp_image(tmp_image: bpy.types.Image, file_format: str, export_settings) -> bytes:
     with tempfile.TemporaryDirectory() as tmpdirname:
         tmpfilename = tmpdirname + '/img'
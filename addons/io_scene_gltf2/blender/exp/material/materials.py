@@ -16,6 +16,7 @@ from copy import deepcopy
 import bpy
 
 from ....io.com import gltf2_io
+from ....io.com.debug import profiled
 from ....io.com.gltf2_io_extensions import Extension
 from ....io.exp.user_extensions import export_user_extensions
 from ..cache import cached, cached_by_key
@@ -305,6 +306,7 @@ def get_material_cache_key(blender_material, export_settings):
 
 
 @cached_by_key(key=get_material_cache_key)
+@profiled('materials')
 def gather_material(bmat, export_settings):
     """
     Gather the material used by the blender primitive.
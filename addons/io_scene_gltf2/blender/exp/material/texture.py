@@ -106,7 +106,7 @@ def __gather_extensions(blender_shader_sockets, source, webp_image, image_data,
 
         new_mime_type = "image/webp"
         new_data, _ = image_data.encode(new_mime_type, export_settings)
-        if len(new_data) == 0:
+        if not new_data:
             export_settings['log'].warning("Image data is empty, not exporting image")
             return None, False
 
@@ -56,6 +56,11 @@ def gather_node(vnode, export_settings):
     else:
         mesh = None
 
+    # Primitives prefetched for this node, and not taken, are not needed anymore
+    pipeline = export_settings.get('primitive_pipeline')
+    if pipeline is not None:
+        pipeline.release(vnode.uuid)
+
     # If blender data is skined, but failed to export
     # We should ignore the skin too,
     # As it will generate a not valid glTF file
@@ -312,91 +317,67 @@ def __gather_mesh(vnode, blender_object, export_settings):
         # For duplis instancer, when show is off -> export as empty
         if vnode.force_as_empty is True:
             return None
-        # Be sure that object is valid (no NaN for example)
-        if blender_object.type == "MESH":
-            res = blender_object.data.validate()
-            if res is True:
-                export_settings['log'].warning("Mesh " + blender_object.data.name +
-                                               " is not valid, and may be exported wrongly")
+
+        # Meshes prefetched by the primitive pipeline are already validated, with their inputs computed
+        pipeline = export_settings.get('primitive_pipeline')
+        inputs = pipeline.prefetched_inputs(vnode.uuid) if pipeline is not None else None
+        if inputs is None:
+            __validate_mesh(blender_object, export_settings)
 
         modifiers = blender_object.modifiers
         if len(modifiers) == 0:
             modifiers = None
 
-        if export_settings['gltf_apply']:
-            if modifiers is None:  # If no modifier, use original data, it will instance all shared data in a single glTF mesh
-                blender_data = blender_object.data
-                # Keep materials from object, as no modifiers are applied, so no risk that
-                # modifiers changed them
+        if export_settings['gltf_apply'] and modifiers is not None:
+            armature_modifiers = {}
+            if export_settings['gltf_skins']:
+                # temporarily disable Armature modifiers if exporting skins
+                for idx, modifier in enumerate(blender_object.modifiers):
+                    if modifier.type == 'ARMATURE':
+                        armature_modifiers[idx] = modifier.show_viewport
+                        modifier.show_viewport = False
+
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+            blender_data_owner = blender_object.evaluated_get(depsgraph)
+            blender_data = blender_data_owner.to_mesh(preserve_all_data_layers=True, depsgraph=depsgraph)
+            # Seems now (from 4.2) the custom properties are Statically Typed
+            # so no need to copy them in that case, because overwriting them will crash
+            if len(blender_data.keys()) == 0:
+                # Copy custom properties
+                for prop in [p for p in blender_object.data.keys() if (
+                        (p not in BLACK_LIST) or p.startswith("gltf"))]:
+                    blender_data[prop] = blender_object.data[prop]
+            else:
+                # But we need to remove some properties that are not needed
+                for prop in [p for p in blender_object.data.keys() if (
+                        p in BLACK_LIST and not p.startswith("gltf"))]:
+                    del blender_data[prop]
+            # Store the fact that this evaluated data has been created by the
+            # exporter, and is not a GN instance data
+            blender_data['gltf2_mesh_applied'] = True
+
+            if export_settings['gltf_skins']:
+                # restore Armature modifiers
+                for idx, show_viewport in armature_modifiers.items():
+                    blender_object.modifiers[idx].show_viewport = show_viewport
+
+            # Keep materials from the newly created tmp data, but if no materials, keep from object
+            materials = tuple(mat for mat in blender_data.materials)
+            # We need to store link between the original material and the tmp data material,
+            # Because of animation pointer NLA that will still have the original
+            __keep_material_info(materials, False, export_settings)
+            __keep_mesh_info(blender_object.data, blender_data, export_settings)
+            if len(materials) == 1 and materials[0] is None:
                 materials = tuple(ms.material for ms in blender_object.material_slots)
                 __keep_material_info(materials, True, export_settings)
-                __keep_mesh_info(blender_object.data, blender_data, export_settings)
-            else:
-                armature_modifiers = {}
-                if export_settings['gltf_skins']:
-                    # temporarily disable Armature modifiers if exporting skins
-                    for idx, modifier in enumerate(blender_object.modifiers):
-                        if modifier.type == 'ARMATURE':
-                            armature_modifiers[idx] = modifier.show_viewport
-                            modifier.show_viewport = False
-
-                depsgraph = bpy.context.evaluated_depsgraph_get()
-                blender_data_owner = blender_object.evaluated_get(depsgraph)
-                blender_data = blender_data_owner.to_mesh(preserve_all_data_layers=True, depsgraph=depsgraph)
-                # Seems now (from 4.2) the custom properties are Statically Typed
-                # so no need to copy them in that case, because overwriting them will crash
-                if len(blender_data.keys()) == 0:
-                    # Copy custom properties
-                    for prop in [p for p in blender_object.data.keys() if (
-                            (p not in BLACK_LIST) or p.startswith("gltf"))]:
-                        blender_data[prop] = blender_object.data[prop]
-                else:
-                    # But we need to remove some properties that are not needed
-                    for prop in [p for p in blender_object.data.keys() if (
-                            p in BLACK_LIST and not p.startswith("gltf"))]:
-                        del blender_data[prop]
-                # Store the fact that this evaluated data has been created by the
-                # exporter, and is not a GN instance data
-                blender_data['gltf2_mesh_applied'] = True
-
-                if export_settings['gltf_skins']:
-                    # restore Armature modifiers
-                    for idx, show_viewport in armature_modifiers.items():
-                        blender_object.modifiers[idx].show_viewport = show_viewport
-
-                # Keep materials from the newly created tmp data, but if no materials, keep from object
-                materials = tuple(mat for mat in blender_data.materials)
-                # We need to store link between the original material and the tmp data material,
-                # Because of animation pointer NLA that will still have the original
-                __keep_material_info(materials, False, export_settings)
-                __keep_mesh_info(blender_object.data, blender_data, export_settings)
-                if len(materials) == 1 and materials[0] is None:
-                    materials = tuple(ms.material for ms in blender_object.material_slots)
-                    __keep_material_info(materials, True, export_settings)
 
+        elif inputs is not None:
+            blender_data, uuid_for_skined_data, _, modifiers, materials = inputs
         else:
-            blender_data = blender_object.data
-            if not export_settings['gltf_skins']:
-                modifiers = None
-            else:
-                # Check if there is an armature modidier
-                if len([mod for mod in blender_object.modifiers if mod.type == "ARMATURE"]) == 0:
-                    modifiers = None
+            blender_data, modifiers, materials = __original_mesh_data(blender_object, export_settings)
 
-            # Keep materials from object, as no modifiers are applied, so no risk that
-            # modifiers changed them
-            materials = tuple(ms.material for ms in blender_object.material_slots)
-            __keep_material_info(materials, True, export_settings)
-            __keep_mesh_info(blender_object.data, blender_data, export_settings)
-
-        # retrieve armature
-        # Because data will be transforms to skeleton space,
-        # we can't instantiate multiple object at different location, skined by same armature
-        uuid_for_skined_data = None
-        if export_settings['gltf_skins']:
-            for idx, modifier in enumerate(blender_object.modifiers):
-                if modifier.type == 'ARMATURE':
-                    uuid_for_skined_data = vnode.uuid
+        if inputs is None:
+            uuid_for_skined_data = __uuid_for_skined_data(vnode, blender_object, export_settings)
 
     result = gltf2_blender_gather_mesh.gather_mesh(blender_data,
                                                    uuid_for_skined_data,
@@ -412,6 +393,64 @@ def __gather_mesh(vnode, blender_object, export_settings):
     return result
 
 
+def get_mesh_extraction_inputs(vnode, export_settings):
+    """Data, skinning uuid, vertex groups, modifiers and materials the primitives of a node are extracted from.
+
+    Only for mesh objects exported with their original data, as evaluated data is
+    created while gathering the node. None otherwise.
+    """
+    blender_object = vnode.blender_object
+    if vnode.blender_type == VExportNode.COLLECTION or blender_object is None:
+        return None
+    if blender_object.type != "MESH" or vnode.force_as_empty is True:
+        return None
+    if export_settings['gltf_apply'] and len(blender_object.modifiers) > 0:
+        return None
+
+    __validate_mesh(blender_object, export_settings)
+    blender_data, modifiers, materials = __original_mesh_data(blender_object, export_settings)
+    uuid_for_skined_data = __uuid_for_skined_data(vnode, blender_object, export_settings)
+    return blender_data, uuid_for_skined_data, blender_object.vertex_groups, modifiers, materials
+
+
+def __validate_mesh(blender_object, export_settings):
+    # Be sure that object is valid (no NaN for example)
+    if blender_object.type == "MESH":
+        res = blender_object.data.validate()
+        if res is True:
+            export_settings['log'].warning("Mesh " + blender_object.data.name +
+                                           " is not valid, and may be exported wrongly")
+
+
+def __original_mesh_data(blender_object, export_settings):
+    # Use original data, it will instance all shared data in a single glTF mesh
+    blender_data = blender_object.data
+
+    # No modifier is applied, only Armature modifiers are needed, for skinning
+    modifiers = None
+    if export_settings['gltf_skins'] and any(mod.type == "ARMATURE" for mod in blender_object.modifiers):
+        modifiers = blender_object.modifiers
+
+    # Keep materials from object, as no modifiers are applied, so no risk that
+    # modifiers changed them
+    materials = tuple(ms.material for ms in blender_object.material_slots)
+    __keep_material_info(materials, True, export_settings)
+    __keep_mesh_info(blender_object.data, blender_data, export_settings)
+    return blender_data, modifiers, materials
+
+
+def __uuid_for_skined_data(vnode, blender_object, export_settings):
+    # retrieve armature
+    # Because data will be transforms to skeleton space,
+    # we can't instantiate multiple object at different location, skined by same armature
+    uuid_for_skined_data = None
+    if export_settings['gltf_skins']:
+        for modifier in blender_object.modifiers:
+            if modifier.type == 'ARMATURE':
+                uuid_for_skined_data = vnode.uuid
+    return uuid_for_skined_data
+
+
 def __keep_mesh_info(original, mesh, export_settings):
     if 'mesh_identifiers' not in export_settings.keys():
         export_settings['mesh_identifiers'] = {}
@@ -135,7 +135,7 @@ def __gather_skins(blender_primitive, export_settings):
         joint_id = 'JOINTS_' + str(s)
         internal_joint = blender_primitive["attributes"][joint_id]
         component_type = gltf2_io_constants.ComponentType.UnsignedShort
-        if max(internal_joint) < 256:
+        if np.max(internal_joint) < 256:
             component_type = gltf2_io_constants.ComponentType.UnsignedByte
         joints = np.array(internal_joint, dtype=gltf2_io_constants.ComponentType.to_numpy_dtype(component_type))
         joints = joints.reshape(-1, 4)
@@ -12,21 +12,63 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import numpy as np
 from copy import deepcopy
-from mathutils import Vector
 from ...blender.com.data_path import get_sk_exported
 from ...io.com.constants import ROUNDING_DIGIT
+from ...io.com.debug import profiled
+from ...io.exp.primitive_cache import PrimitiveCache
 from ...io.exp.user_extensions import export_user_extensions
 from ...io.com import constants as gltf2_io_constants
 from ..com import conversion as gltf2_blender_conversion
-from ..com.gltf2_blender_utils import fast_structured_np_unique
+from ..com.gltf2_blender_primitive_creation import create_primitives
 from .material.materials import get_base_material, get_new_material_texture_shared
 from .material.texture_info import gather_udim_texture_info
 from . import skins as gltf2_blender_gather_skins
 from . attribute_utils import extract_attribute_data
 
 
+# Export settings used by the extraction, part of the fingerprint of cached primitives
+FINGERPRINT_SETTINGS = [
+    'gltf_active_vertex_color_when_no_material',
+    'gltf_all_vertex_colors',
+    'gltf_attributes',
+    'gltf_loose_edges',
+    'gltf_loose_points',
+    'gltf_materials',
+    'gltf_morph',
+    'gltf_morph_normal',
+    'gltf_morph_tangent',
+    'gltf_normals',
+    'gltf_shared_accessors',
+    'gltf_skins',
+    'gltf_tangents',
+    'gltf_texcoords',
+    'gltf_vertex_color',
+    'gltf_vertex_color_name',
+    'gltf_yup',
+]
+
+# foreach_get property, number of values and type used to read attributes, for fingerprints
+FINGERPRINT_ATTRIBUTE_TYPES = {
+    "FLOAT": ('value', 1, np.float32),
+    "INT": ('value', 1, np.int32),
+    "INT8": ('value', 1, np.int8),
+    "BOOLEAN": ('value', 1, np.bool_),
+    "FLOAT2": ('vector', 2, np.float32),
+    "INT32_2D": ('value', 2, np.int32),
+    "FLOAT_VECTOR": ('vector', 3, np.float32),
+    "FLOAT_COLOR": ('color', 4, np.float32),
+    "BYTE_COLOR": ('color', 4, np.float32),
+    "QUATERNION": ('value', 4, np.float32),
+    "FLOAT4X4": ('value', 16, np.float32),
+}
+
+VERTEX_GROUP_ELEMENT = np.dtype([('vertex', np.int64), ('group', np.int64), ('weight', np.float64)])
+
+
+@profiled('primitive extraction')
 def extract_primitives(
         materials,
         blender_mesh,
@@ -35,6 +77,13 @@ def extract_primitives(
         modifiers,
         export_settings):
     """Extract primitives from a mesh."""
+    # Meshes of the scene can already be extracted, in worker processes
+    pipeline = export_settings.get('primitive_pipeline')
+    if pipeline is not None:
+        result = pipeline.take(materials, blender_mesh, uuid_for_skined_data, modifiers)
+        if result is not None:
+            return result
+
     export_settings['log'].info("Extracting primitive: " + blender_mesh.name)
 
     primitive_creator = PrimitiveCreator(
@@ -44,16 +93,11 @@ def extract_primitives(
         blender_vertex_groups,
         modifiers,
         export_settings)
-    primitive_creator.prepare_data()
-    primitive_creator.define_attributes()
-    primitive_creator.create_dots_data_structure()
-    primitive_creator.populate_dots_data()
-    primitive_creator.primitive_split()
-    primitive_creator.manage_material_info()  # UVMap & Vertex Color
-    if export_settings['gltf_shared_accessors'] is False:
-        return primitive_creator.primitive_creation_not_shared(), primitive_creator.additional_materials, None
-    else:
-        return primitive_creator.primitive_creation_shared()
+    result = primitive_creator.load_cached()
+    if result is None:
+        primitive_creator.read()
+        result = primitive_creator.finish(create_primitives(primitive_creator.snapshot()))
+    return result
 
 
 class PrimitiveCreator:
@@ -76,6 +120,7 @@ class PrimitiveCreator:
         self.material_idxs_using_vc = {}
 
         self.export_settings = export_settings
+        self.vertex_group_elements = None
 
     @classmethod
     def apply_mat_to_all(cls, matrix, vectors):
@@ -99,7 +144,35 @@ class PrimitiveCreator:
         array[:, [1, 2]] = array[:, [2, 1]]  # x,z,y
         array[:, 2] *= -1  # x,z,-y
 
-    def prepare_data(self):
+    def load_cached(self):
+        """Prepare options, and return primitives reused from the primitive cache, if any."""
+        self.prepare_options()
+
+        # Primitives of a mesh that did not change since a previous export are reused
+        self.cache_key = None
+        cache = PrimitiveCache.get(self.export_settings)
+        if cache is None:
+            return None
+        fingerprint = self.fingerprint()
+        if fingerprint is None:
+            return None
+        self.cache_key = cache.key(fingerprint)
+        cached = cache.load(self.cache_key)
+        if cached is None:
+            return None
+        self.export_settings['log'].info("Reusing cached primitive: " + self.blender_mesh.name)
+        return self.restore(cached)
+
+    def read(self):
+        """Read everything needed from Blender, up to the snapshot. Must run on the main thread."""
+        self.prepare_data()
+        self.define_attributes()
+        self.create_dots_data_structure()
+        self.populate_dots_data()
+        self.primitive_split()
+        self.manage_material_info()  # UVMap & Vertex Color
+
+    def prepare_options(self):
         self.blender_object = None
         if self.uuid_for_skined_data:
             self.blender_object = self.export_settings['vtree'].nodes[self.uuid_for_skined_data].blender_object
@@ -167,6 +240,7 @@ class PrimitiveCreator:
                 (self.blender_mesh.is_evaluated is True and self.blender_mesh.get('gltf2_mesh_applied') is not None) or self.blender_mesh.is_evaluated is False):
             self.key_blocks = get_sk_exported(self.blender_mesh.shape_keys.key_blocks)
 
+    def prepare_data(self):
         # Fetch vert positions and bone data (joint,weights)
 
         self.locs = None
@@ -176,12 +250,107 @@ class PrimitiveCreator:
         if self.skin:
             self.__get_bone_data()
             if self.need_neutral_bone is True:
-                # Need to create a fake joint at root of armature
-                # In order to assign not assigned vertices to it
-                # But for now, this is not yet possible, we need to wait the armature node is created
-                # Just store this, to be used later
-                armature_uuid = self.export_settings['vtree'].nodes[self.uuid_for_skined_data].armature
-                self.export_settings['vtree'].nodes[armature_uuid].need_neutral_bone = True
+                self.__request_neutral_bone()
+
+    def __request_neutral_bone(self):
+        # Need to create a fake joint at root of armature
+        # In order to assign not assigned vertices to it
+        # But for now, this is not yet possible, we need to wait the armature node is created
+        # Just store this, to be used later
+        armature_uuid = self.export_settings['vtree'].nodes[self.uuid_for_skined_data].armature
+        self.export_settings['vtree'].nodes[armature_uuid].need_neutral_bone = True
+
+    def fingerprint(self):
+        """Digest of the evaluated mesh, export settings and materials the extraction depends on.
+
+        Returns None when primitives can't be reused: for meshes split by UDIM tiles,
+        and when extensions can change the exported attributes.
+        """
+        for extension in self.export_settings['gltf_user_extensions']:
+            if hasattr(extension, 'gather_attribute_keep') or hasattr(extension, 'gather_attributes_change'):
+                return None
+
+        digest = hashlib.blake2b(digest_size=20)
+
+        def add(*values):
+            digest.update(repr(values).encode('utf-8'))
+
+        def add_array(array):
+            digest.update(np.ascontiguousarray(array))
+
+        add(*(self.export_settings.get(k) for k in FINGERPRINT_SETTINGS))
+        add(self.use_tangents, self.tex_coord_max)
+
+        # All attributes, including internal ones (.corner_vert, .edge_verts...), so topology is included
+        mesh = self.blender_mesh
+        add(len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons))
+        for attribute in mesh.attributes:
+            add(attribute.name, attribute.domain, attribute.data_type)
+            prop, length, dtype = FINGERPRINT_ATTRIBUTE_TYPES.get(attribute.data_type, (None, 0, None))
+            if prop is None:
+                continue
+            data = np.empty(len(attribute.data) * length, dtype=dtype)
+            attribute.data.foreach_get(prop, data)
+            add_array(data)
+        add(mesh.uv_layers.keys(), mesh.uv_layers.active_render_index)
+        add(mesh.color_attributes.keys(),
+            mesh.color_attributes.render_color_index,
+            mesh.color_attributes.active_color_index)
+
+        # Custom normals are not stored as attributes
+        if self.use_normals:
+            normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+            mesh.corner_normals.foreach_get('vector', normals)
+            add_array(normals)
+
+        for key_block in self.key_blocks:
+            add(key_block.name, key_block.relative_key.name)
+            vs = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            key_block.points.foreach_get('co', vs)
+            add_array(vs)
+        if self.key_blocks:
+            vs = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            self.key_blocks[0].relative_key.points.foreach_get('co', vs)
+            add_array(vs)
+
+        # Skinned meshes are exported in armature space
+        if self.armature and self.blender_object:
+            add([list(row) for row in self.blender_object.matrix_world], [list(row) for row in self.armature.matrix_world])
+        if self.skin:
+            add([joint.name for joint in self.skin.joints], [g.name for g in self.blender_vertex_groups])
+            add_array(self.__get_vertex_group_elements())
+
+        # Materials decide UVMaps and Vertex Colors to export
+        if self.use_materials == "NONE":
+            material_idxs = [-1]
+        else:
+            material_idxs = np.empty(len(mesh.polygons), dtype=np.int32)
+            mesh.polygons.foreach_get('material_index', material_idxs)
+            material_idxs = np.unique(material_idxs).tolist()
+        for material_idx in material_idxs:
+            base_material, material_info = get_base_material(material_idx, self.materials, self.export_settings)
+            if material_info['udim_info']:
+                return None
+            add(material_idx, base_material is None, material_info['uv_info'], material_info['vc_info'])
+
+        return digest.hexdigest()
+
+    def restore(self, cached):
+        """Result of the extraction, from primitives loaded from the cache."""
+        if cached['need_neutral_bone'] is True:
+            self.__request_neutral_bone()
+        primitives = cached['primitives']
+        return primitives, [None] * len(primitives), cached['shared_attributes']
+
+    def store(self, cache, cache_key, result):
+        primitives, additional_materials, shared_attributes = result
+        if any(m is not None for m in additional_materials):
+            return  # UDIM materials are glTF objects, they can't be cached
+        cache.store(cache_key, {
+            'primitives': primitives,
+            'shared_attributes': shared_attributes,
+            'need_neutral_bone': bool(self.skin) and self.need_neutral_bone,
+        })
 
     def define_attributes(self):
 
@@ -245,7 +414,7 @@ class PrimitiveCreator:
         attr['blender_data_type'] = 'FLOAT_VECTOR'
         attr['blender_domain'] = 'POINT'
         attr['gltf_attribute_name'] = 'POSITION'
-        attr['set'] = self.set_function()
+        attr['set'] = 'position'  # Set from vertex positions when creating primitives
         attr['skip_getting_to_dots'] = True
         self.blender_attributes.append(attr)
 
@@ -285,7 +454,7 @@ class PrimitiveCreator:
             attr['blender_domain'] = 'POINT'
             attr['gltf_attribute_name'] = 'MORPH_POSITION_' + str(morph_i)
             attr['skip_getting_to_dots'] = True
-            attr['set'] = self.set_function()
+            attr['set'] = 'morph_position'
             self.blender_attributes.append(attr)
 
             # Manage MORPH_NORMAL_x
@@ -314,7 +483,7 @@ class PrimitiveCreator:
                     attr['gltf_attribute_name_morph_normal'] = "MORPH_NORMAL_" + str(morph_i)
                     attr['gltf_attribute_name_tangent'] = "TANGENT"
                     attr['skip_getting_to_dots'] = True
-                    attr['set'] = self.set_function()
+                    attr['set'] = 'morph_tangent'
                     self.blender_attributes.append(attr)
 
         for attr in self.blender_attributes:
@@ -859,268 +1028,109 @@ class PrimitiveCreator:
 
         self.prim_indices = new_prim_indices
 
-    def primitive_creation_shared(self):
-        primitives = []
-        self.dots, shared_dot_indices = fast_structured_np_unique(self.dots, return_inverse=True)
-
-        self.blender_idxs = self.dots['vertex_index']
-
-        self.attributes = {}
-
-        next_texcoor_idx = self.tex_coord_max
-        uvmap_attributes_index = {}
-        for attr in self.uvmap_attribute_list:
-            res = np.empty((len(self.dots), 2), dtype=gltf2_blender_conversion.get_numpy_type('FLOAT2'))
-            for i in range(2):
-                res[:, i] = self.dots[attr + str(i)]
-
-            self.attributes["TEXCOORD_" + str(next_texcoor_idx)] = {}
-            self.attributes["TEXCOORD_" + str(next_texcoor_idx)]["data"] = res
-            self.attributes["TEXCOORD_" + str(next_texcoor_idx)
-                            ]["component_type"] = gltf2_io_constants.ComponentType.Float
-            self.attributes["TEXCOORD_" + str(next_texcoor_idx)]["data_type"] = gltf2_io_constants.DataType.Vec2
-            uvmap_attributes_index[attr] = next_texcoor_idx
-            next_texcoor_idx += 1
+    def snapshot(self):
+        """Data primitives are created from, as plain values and numpy arrays.
 
+        Primitives are created from it by create_primitives, without Blender, so that this
+        last step can run in worker processes.
+        """
+        attributes = []
         for attr in self.blender_attributes:
-            if 'set' in attr:
-                attr['set'](attr)
-            else:
-                self.__set_regular_attribute(self.dots, attr)
-
-        if self.skin:
-            joints = [[] for _ in range(self.num_joint_sets)]
-            weights = [[] for _ in range(self.num_joint_sets)]
-
-            for vi in self.blender_idxs:
-                bones = self.vert_bones[vi]
-                for j in range(0, 4 * self.num_joint_sets):
-                    if j < len(bones):
-                        joint, weight = bones[j]
-                    else:
-                        joint, weight = 0, 0.0
-                    joints[j // 4].append(joint)
-                    weights[j // 4].append(weight)
-
-            for i, (js, ws) in enumerate(zip(joints, weights)):
-                self.attributes['JOINTS_%d' % i] = js
-                self.attributes['WEIGHTS_%d' % i] = ws
-
-        for material_idx, dot_indices in self.prim_indices.items():
-            indices = shared_dot_indices[dot_indices]
-
-            if len(indices) == 0:
-                continue
-
-            primitives.append({
-                # No attribute here, as they are shared across all primitives
-                'indices': indices,
-                'material': material_idx,
-                'uvmap_attributes_index': uvmap_attributes_index
-            })
-
-        # Manage edges & points primitives.
-        # One for edges, one for points
-        # No material for them, so only one primitive for each
-        has_triangle_primitive = len(primitives) != 0
-        primitives.extend(self.primitive_creation_edges_and_points())
-
-        self.export_settings['log'].info('Primitives created: %d' % len(primitives))
-
-        return primitives, [None] * len(primitives), self.attributes if has_triangle_primitive else None
-
-    def primitive_creation_not_shared(self):
-        primitives = []
-
-        for (material_idx, dot_indices), uvmap_attribute_list in zip(
-                self.prim_indices.items(), self.uvmap_attribute_lists):
-            # Extract just dots used by this primitive, deduplicate them, and
-            # calculate indices into this deduplicated list.
-            self.prim_dots = self.dots[dot_indices]
-            self.prim_dots, indices = fast_structured_np_unique(self.prim_dots, return_inverse=True)
-
-            if len(self.prim_dots) == 0:
-                continue
-
-            # Now just move all the data for prim_dots into attribute arrays
-
-            self.attributes = {}
-
-            self.blender_idxs = self.prim_dots['vertex_index']
-
-            for attr in self.blender_attributes:
-                if 'set' in attr:
-                    attr['set'](attr)
-                else:  # Regular case
-                    self.__set_regular_attribute(self.prim_dots, attr)
-
-            next_texcoor_idx = self.tex_coord_max
-            uvmap_attributes_index = {}
-            for attr in uvmap_attribute_list:
-                res = np.empty((len(self.prim_dots), 2), dtype=gltf2_blender_conversion.get_numpy_type('FLOAT2'))
-                for i in range(2):
-                    res[:, i] = self.prim_dots[attr + str(i)]
-
-                self.attributes["TEXCOORD_" + str(next_texcoor_idx)] = {}
-                self.attributes["TEXCOORD_" + str(next_texcoor_idx)]["data"] = res
-                self.attributes["TEXCOORD_" +
-                                str(next_texcoor_idx)]["component_type"] = gltf2_io_constants.ComponentType.Float
-                self.attributes["TEXCOORD_" + str(next_texcoor_idx)]["data_type"] = gltf2_io_constants.DataType.Vec2
-                uvmap_attributes_index[attr] = next_texcoor_idx
-                next_texcoor_idx += 1
-
-            if self.skin:
-                joints = [[] for _ in range(self.num_joint_sets)]
-                weights = [[] for _ in range(self.num_joint_sets)]
-
-                for vi in self.blender_idxs:
-                    bones = self.vert_bones[vi]
-                    for j in range(0, 4 * self.num_joint_sets):
-                        if j < len(bones):
-                            joint, weight = bones[j]
-                        else:
-                            joint, weight = 0, 0.0
-                        joints[j // 4].append(joint)
-                        weights[j // 4].append(weight)
-
-                for i, (js, ws) in enumerate(zip(joints, weights)):
-                    self.attributes['JOINTS_%d' % i] = js
-                    self.attributes['WEIGHTS_%d' % i] = ws
-
-            primitives.append({
-                'attributes': self.attributes,
-                'indices': indices,
-                'material': material_idx,
-                'uvmap_attributes_index': uvmap_attributes_index
+            attributes.append({
+                'name': attr['gltf_attribute_name'],
+                'kind': attr.get('set', 'dots'),
+                'domain': attr['blender_domain'],
+                'len': attr['len'],
+                'dtype': np.dtype(attr['type']),
+                'index': attr.get('blender_attribute_index'),
+                'normal': attr.get('gltf_attribute_name_normal'),
+                'morph_normal': attr.get('gltf_attribute_name_morph_normal'),
+                'tangent': attr.get('gltf_attribute_name_tangent'),
+                'types': self.__attribute_types(attr, edges_points=False),
+                'edges_points_types': self.__attribute_types(attr, edges_points=True),
             })
 
-        # Manage edges & points primitives.
-        # One for edges, one for points
-        # No material for them, so only one primitive for each
-        primitives.extend(self.primitive_creation_edges_and_points())
+        skin = bool(self.skin)
+        loose_edges = self.export_settings['gltf_loose_edges']
+        loose_points = self.export_settings['gltf_loose_points']
+        return {
+            'shared': self.export_settings['gltf_shared_accessors'],
+            'dots': self.dots,
+            'prim_indices': list(self.prim_indices.items()),
+            'uvmap_attribute_list': self.uvmap_attribute_list,
+            'uvmap_attribute_lists': self.uvmap_attribute_lists,
+            'tex_coord_max': self.tex_coord_max,
+            'texcoord_component_type': int(gltf2_io_constants.ComponentType.Float),
+            'texcoord_data_type': gltf2_io_constants.DataType.Vec2,
+            'attributes': attributes,
+            'locs': self.locs,
+            'morph_locs': self.morph_locs,
+            'skin': skin,
+            'vert_joints': self.vert_joints if skin else None,
+            'vert_weights': self.vert_weights if skin else None,
+            'num_joint_sets': self.num_joint_sets if skin else 0,
+            'loose_edges': loose_edges,
+            'dots_edges': self.dots_edges if loose_edges else None,
+            'blender_idxs_edges': self.blender_idxs_edges if loose_edges else None,
+            'loose_points': loose_points,
+            'dots_points': self.dots_points if loose_points else None,
+            'blender_idxs_points': self.blender_idxs_points if loose_points else None,
+        }
+
+    @staticmethod
+    def __attribute_types(attr, edges_points):
+        # Component type (as int, constants are not available in worker processes) and data type of an attribute
+        if attr.get('set') == 'position':
+            types = gltf2_io_constants.ComponentType.Float, gltf2_io_constants.DataType.Vec3
+        elif 'set' in attr:
+            return None
+        elif edges_points is True:
+            if attr['gltf_attribute_name'].startswith('COLOR_'):
+                # Because we can have remove the alpha channel, we need to check the
+                # length of the data, and not be based on the Blender data type
+                data_type = gltf2_io_constants.DataType.Vec3 if attr['len'] == 3 else gltf2_io_constants.DataType.Vec4
+            else:
+                data_type = gltf2_blender_conversion.get_data_type(attr['blender_data_type'])
+            types = gltf2_blender_conversion.get_component_type(attr['blender_data_type']), data_type
+        elif attr['gltf_attribute_name'] == "NORMAL":
+            types = gltf2_io_constants.ComponentType.Float, gltf2_io_constants.DataType.Vec3
+        elif attr['gltf_attribute_name'] == "TANGENT":
+            types = gltf2_io_constants.ComponentType.Float, gltf2_io_constants.DataType.Vec4
+        elif attr['gltf_attribute_name'].startswith('TEXCOORD_'):
+            types = gltf2_io_constants.ComponentType.Float, gltf2_io_constants.DataType.Vec2
+        elif attr['gltf_attribute_name'].startswith('COLOR_'):
+            # This is already managed, we only have to copy
+            types = attr['component_type'], attr['data_type']
+        else:
+            types = gltf2_blender_conversion.get_component_type(
+                attr['blender_data_type']), gltf2_blender_conversion.get_data_type(attr['blender_data_type'])
+        return int(types[0]), types[1]
+
+    def finish(self, created):
+        """Result of the extraction, from primitives created by create_primitives."""
+        primitives = created['primitives']
+        for primitive in primitives:
+            PrimitiveCreator.__restore_component_types(primitive.get('attributes', {}))
+        if created['shared_attributes'] is not None:
+            PrimitiveCreator.__restore_component_types(created['shared_attributes'])
+
+        if self.export_settings['gltf_shared_accessors'] is False:
+            additional_materials = self.additional_materials + [None] * created['edges_points']
+        else:
+            additional_materials = [None] * len(primitives)
 
         self.export_settings['log'].info('Primitives created: %d' % len(primitives))
 
-        return primitives
-
-    def primitive_creation_edges_and_points(self):
-        primitives_edges_points = []
-
-        if self.export_settings['gltf_loose_edges']:
-
-            if self.blender_idxs_edges.shape[0] > 0:
-                # Export one glTF vert per unique Blender vert in a loose edge
-                self.blender_idxs = self.blender_idxs_edges
-                dots_edges, indices = fast_structured_np_unique(self.dots_edges, return_inverse=True)
-                self.blender_idxs = np.unique(self.blender_idxs_edges)
-
-                self.attributes_edges_points = {}
-
-                for attr in self.blender_attributes:
-                    if attr['blender_domain'] != 'POINT':
-                        continue
-                    if 'set' in attr:
-                        attr['set'](attr, edges_points=True)
-                    else:
-                        res = np.empty((len(dots_edges), attr['len']), dtype=attr['type'])
-                        for i in range(attr['len']):
-                            res[:, i] = dots_edges[attr['gltf_attribute_name'] + str(i)]
-                        self.attributes_edges_points[attr['gltf_attribute_name']] = {}
-                        self.attributes_edges_points[attr['gltf_attribute_name']]["data"] = res
-                        self.attributes_edges_points[attr['gltf_attribute_name']]["component_type"] = gltf2_blender_conversion.get_component_type(
-                            attr['blender_data_type'])
-                        if attr['gltf_attribute_name'].startswith('COLOR_'):
-                            # Because we can have remove the alpha channel, we need to check the
-                            # length of the data, and not be based on the Blender data type
-                            self.attributes_edges_points[attr['gltf_attribute_name']
-                                                         ]["data_type"] = gltf2_io_constants.DataType.Vec3 if attr['len'] == 3 else gltf2_io_constants.DataType.Vec4
-                        else:
-                            self.attributes_edges_points[attr['gltf_attribute_name']]["data_type"] = gltf2_blender_conversion.get_data_type(
-                                attr['blender_data_type'])
-
-                if self.skin:
-                    joints = [[] for _ in range(self.num_joint_sets)]
-                    weights = [[] for _ in range(self.num_joint_sets)]
-
-                    for vi in self.blender_idxs:
-                        bones = self.vert_bones[vi]
-                        for j in range(0, 4 * self.num_joint_sets):
-                            if j < len(bones):
-                                joint, weight = bones[j]
-                            else:
-                                joint, weight = 0, 0.0
-                            joints[j // 4].append(joint)
-                            weights[j // 4].append(weight)
-
-                    for i, (js, ws) in enumerate(zip(joints, weights)):
-                        self.attributes_edges_points['JOINTS_%d' % i] = js
-                        self.attributes_edges_points['WEIGHTS_%d' % i] = ws
-
-                primitives_edges_points.append({
-                    'attributes': self.attributes_edges_points,
-                    'indices': indices,
-                    'mode': 1,  # LINES
-                    'material': 0,
-                    'uvmap_attributes_index': {}
-                })
-                self.additional_materials.append(None)
-
-        if self.export_settings['gltf_loose_points']:
-
-            if self.blender_idxs_points.shape[0] > 0:
-                self.blender_idxs = self.blender_idxs_points
+        result = primitives, additional_materials, created['shared_attributes']
+        if self.cache_key is not None:
+            self.store(PrimitiveCache.get(self.export_settings), self.cache_key, result)
+        return result
 
-                self.attributes_edges_points = {}
-
-                for attr in self.blender_attributes:
-                    if attr['blender_domain'] != 'POINT':
-                        continue
-                    if 'set' in attr:
-                        attr['set'](attr, edges_points=True)
-                    else:
-                        res = np.empty((len(self.blender_idxs), attr['len']), dtype=attr['type'])
-                        for i in range(attr['len']):
-                            res[:, i] = self.dots_points[attr['gltf_attribute_name'] + str(i)]
-                        self.attributes_edges_points[attr['gltf_attribute_name']] = {}
-                        self.attributes_edges_points[attr['gltf_attribute_name']]["data"] = res
-                        self.attributes_edges_points[attr['gltf_attribute_name']]["component_type"] = gltf2_blender_conversion.get_component_type(
-                            attr['blender_data_type'])
-                        if attr['gltf_attribute_name'].startswith('COLOR_'):
-                            # Because we can have remove the alpha channel, we need to check the
-                            # length of the data, and not be based on the Blender data type
-                            self.attributes_edges_points[attr['gltf_attribute_name']
-                                                         ]["data_type"] = gltf2_io_constants.DataType.Vec3 if attr['len'] == 3 else gltf2_io_constants.DataType.Vec4
-                        else:
-                            self.attributes_edges_points[attr['gltf_attribute_name']]["data_type"] = gltf2_blender_conversion.get_data_type(
-                                attr['blender_data_type'])
-
-                if self.skin:
-                    joints = [[] for _ in range(self.num_joint_sets)]
-                    weights = [[] for _ in range(self.num_joint_sets)]
-
-                    for vi in self.blender_idxs:
-                        bones = self.vert_bones[vi]
-                        for j in range(0, 4 * self.num_joint_sets):
-                            if j < len(bones):
-                                joint, weight = bones[j]
-                            else:
-                                joint, weight = 0, 0.0
-                            joints[j // 4].append(joint)
-                            weights[j // 4].append(weight)
-
-                    for i, (js, ws) in enumerate(zip(joints, weights)):
-                        self.attributes_edges_points['JOINTS_%d' % i] = js
-                        self.attributes_edges_points['WEIGHTS_%d' % i] = ws
-
-                primitives_edges_points.append({
-                    'attributes': self.attributes_edges_points,
-                    'mode': 0,  # POINTS
-                    'material': 0,
-                    'uvmap_attributes_index': {}
-                })
-                self.additional_materials.append(None)
-
-        return primitives_edges_points
+    @staticmethod
+    def __restore_component_types(attributes):
+        for attribute in attributes.values():
+            if isinstance(attribute, dict) and 'component_type' in attribute:
+                attribute['component_type'] = gltf2_io_constants.ComponentType(attribute['component_type'])
 
 ################################## Get ##################################################
 
@@ -1563,130 +1573,69 @@ class PrimitiveCreator:
 
         # No change for Zup -> Yup
 
+    def __get_vertex_group_elements(self):
+        """All (vertex, group, weight) elements of the mesh, read once for the fingerprint and bone data."""
+        if self.vertex_group_elements is None:
+            vertices = self.blender_mesh.vertices
+            # Vertex groups can't be read for all vertices at once, so read each vertex elements in bulk
+            counts = np.fromiter((len(vertex.groups) for vertex in vertices), dtype=np.int64, count=len(vertices))
+            ends = np.cumsum(counts)
+            groups = np.empty(int(ends[-1]) if len(ends) else 0, dtype=np.int32)
+            weights = np.empty(len(groups), dtype=np.float32)
+            for vertex, end, count in zip(vertices, ends.tolist(), counts.tolist()):
+                if count > 0:
+                    vertex.groups.foreach_get('group', groups[end - count:end])
+                    vertex.groups.foreach_get('weight', weights[end - count:end])
+
+            elements = np.empty(len(groups), dtype=VERTEX_GROUP_ELEMENT)
+            elements['vertex'] = np.repeat(np.arange(len(vertices)), counts)
+            elements['group'] = groups
+            elements['weight'] = weights
+            self.vertex_group_elements = elements
+        return self.vertex_group_elements
+
     def __get_bone_data(self):
 
-        self.need_neutral_bone = False
         min_influence = 0.0001
 
         joint_name_to_index = {joint.name: index for index, joint in enumerate(self.skin.joints)}
-        group_to_joint = [joint_name_to_index.get(g.name) for g in self.blender_vertex_groups]
-
-        # List of (joint, weight) pairs for each vert
-        self.vert_bones = []
-        max_num_influences = 0
-
-        for vertex in self.blender_mesh.vertices:
-            bones = []
-            if vertex.groups:
-                for group_element in vertex.groups:
-                    weight = group_element.weight
-                    if weight <= min_influence:
-                        continue
-                    try:
-                        joint = group_to_joint[group_element.group]
-                    except Exception:
-                        continue
-                    if joint is None:
-                        continue
-                    bones.append((joint, weight))
-            bones.sort(key=lambda x: x[1], reverse=True)
-            if not bones:
-                # Is not assign to any bone
-                bones = ((len(self.skin.joints), 1.0),)  # Assign to a joint that will be created later
-                self.need_neutral_bone = True
-            self.vert_bones.append(bones)
-            if len(bones) > max_num_influences:
-                max_num_influences = len(bones)
+        group_to_joint = np.array([joint_name_to_index.get(g.name, -1)
+                                  for g in self.blender_vertex_groups] + [-1], dtype=np.int64)
+
+        num_verts = len(self.blender_mesh.vertices)
+        elements = self.__get_vertex_group_elements().copy()
+
+        # Groups not linked to a joint, or out of range, map to -1 and are ignored, like low weights
+        groups = elements['group']
+        groups[(groups < 0) | (groups >= len(group_to_joint) - 1)] = len(group_to_joint) - 1
+        elements_joints = group_to_joint[groups]
+        keep = (elements['weight'] > min_influence) & (elements_joints >= 0)
+        verts = elements['vertex'][keep]
+        elements_joints = elements_joints[keep]
+        elements_weights = elements['weight'][keep]
+
+        # Sort by vertex, then by decreasing weight. Sort is stable, so equal weights keep their group order
+        order = np.lexsort((-elements_weights, verts))
+        verts = verts[order]
+        elements_joints = elements_joints[order]
+        elements_weights = elements_weights[order]
+
+        counts = np.bincount(verts, minlength=num_verts)
+        unassigned = counts == 0
+        self.need_neutral_bone = bool(unassigned.any())
+        max_num_influences = max(int(counts.max()), 1) if num_verts > 0 else 0
 
         # How many joint sets do we need? 1 set = 4 influences
         self.num_joint_sets = (max_num_influences + 3) // 4
 
-##################################### Set ###################################
-    def set_function(self):
-
-        def setting_function(attr, edges_points=False):
-            if attr['gltf_attribute_name'] == "POSITION":
-                self.__set_positions_attribute(attr, edges_points=edges_points)
-            elif attr['gltf_attribute_name'].startswith("MORPH_POSITION_"):
-                self.__set_morph_locs_attribute(attr, edges_points=edges_points)
-            elif attr['gltf_attribute_name'].startswith("MORPH_TANGENT_"):
-                self.__set_morph_tangent_attribute(attr, edges_points=edges_points)
-
-        return setting_function
-
-    def __set_positions_attribute(self, attr, edges_points=False):
-        if edges_points is False:
-            self.attributes[attr['gltf_attribute_name']] = {}
-            self.attributes[attr['gltf_attribute_name']]["data"] = self.locs[self.blender_idxs]
-            self.attributes[attr['gltf_attribute_name']]["data_type"] = gltf2_io_constants.DataType.Vec3
-            self.attributes[attr['gltf_attribute_name']]["component_type"] = gltf2_io_constants.ComponentType.Float
-        else:
-            self.attributes_edges_points[attr['gltf_attribute_name']] = {}
-            self.attributes_edges_points[attr['gltf_attribute_name']]["data"] = self.locs[self.blender_idxs]
-            self.attributes_edges_points[attr['gltf_attribute_name']]["data_type"] = gltf2_io_constants.DataType.Vec3
-            self.attributes_edges_points[attr['gltf_attribute_name']
-                                         ]["component_type"] = gltf2_io_constants.ComponentType.Float
-
-    def __set_morph_locs_attribute(self, attr, edges_points=False):
-        if edges_points is False:
-            self.attributes[attr['gltf_attribute_name']] = {}
-            self.attributes[attr['gltf_attribute_name']
-                            ]["data"] = self.morph_locs[attr['blender_attribute_index']][self.blender_idxs]
-        else:
-            self.attributes_edges_points[attr['gltf_attribute_name']] = {}
-            self.attributes_edges_points[attr['gltf_attribute_name']
-                                         ]["data"] = self.morph_locs[attr['blender_attribute_index']][self.blender_idxs]
-
-    def __set_morph_tangent_attribute(self, attr, edges_points=False):
-        # Morph tangent are after these 3 others, so, they are already calculated
-        self.normals = self.attributes[attr['gltf_attribute_name_normal']]["data"]
-        self.morph_normals = self.attributes[attr['gltf_attribute_name_morph_normal']]["data"]
-        self.tangents = self.attributes[attr['gltf_attribute_name_tangent']]["data"]
-
-        self.__calc_morph_tangents()
-        if edges_points is False:
-            self.attributes[attr['gltf_attribute_name']] = {}
-            self.attributes[attr['gltf_attribute_name']]["data"] = self.morph_tangents
-        else:
-            self.attributes_edges_points[attr['gltf_attribute_name']] = {}
-            self.attributes_edges_points[attr['gltf_attribute_name']]["data"] = self.morph_tangents
-
-    def __calc_morph_tangents(self):
-        # TODO: check if this works
-        self.morph_tangents = np.empty((len(self.normals), 3), dtype=np.float32)
-
-        for i in range(len(self.normals)):
-            n = Vector(self.normals[i])
-            morph_n = n + Vector(self.morph_normals[i])  # convert back to non-delta
-            t = Vector(self.tangents[i, :3])
-
-            rotation = morph_n.rotation_difference(n)
-
-            t_morph = Vector(t)
-            t_morph.rotate(rotation)
-            self.morph_tangents[i] = t_morph - t  # back to delta
-
-    def __set_regular_attribute(self, dots, attr):
-        res = np.empty((len(dots), attr['len']), dtype=attr['type'])
-        for i in range(attr['len']):
-            res[:, i] = dots[attr['gltf_attribute_name'] + str(i)]
-        self.attributes[attr['gltf_attribute_name']] = {}
-        self.attributes[attr['gltf_attribute_name']]["data"] = res
-        if attr['gltf_attribute_name'] == "NORMAL":
-            self.attributes[attr['gltf_attribute_name']]["component_type"] = gltf2_io_constants.ComponentType.Float
-            self.attributes[attr['gltf_attribute_name']]["data_type"] = gltf2_io_constants.DataType.Vec3
-        elif attr['gltf_attribute_name'] == "TANGENT":
-            self.attributes[attr['gltf_attribute_name']]["component_type"] = gltf2_io_constants.ComponentType.Float
-            self.attributes[attr['gltf_attribute_name']]["data_type"] = gltf2_io_constants.DataType.Vec4
-        elif attr['gltf_attribute_name'].startswith('TEXCOORD_'):
-            self.attributes[attr['gltf_attribute_name']]["component_type"] = gltf2_io_constants.ComponentType.Float
-            self.attributes[attr['gltf_attribute_name']]["data_type"] = gltf2_io_constants.DataType.Vec2
-        elif attr['gltf_attribute_name'].startswith('COLOR_'):
-            # This is already managed, we only have to copy
-            self.attributes[attr['gltf_attribute_name']]["component_type"] = attr['component_type']
-            self.attributes[attr['gltf_attribute_name']]["data_type"] = attr['data_type']
-        else:
-            self.attributes[attr['gltf_attribute_name']
-                            ]["component_type"] = gltf2_blender_conversion.get_component_type(attr['blender_data_type'])
-            self.attributes[attr['gltf_attribute_name']
-                            ]["data_type"] = gltf2_blender_conversion.get_data_type(attr['blender_data_type'])
+        # Padded (vertex x influences) arrays, sorted by decreasing weight
+        width = 4 * self.num_joint_sets
+        self.vert_joints = np.zeros((num_verts, width), dtype=np.uint32)
+        self.vert_weights = np.zeros((num_verts, width), dtype=np.float32)
+        ranks = np.arange(len(verts)) - (np.cumsum(counts) - counts)[verts]
+        self.vert_joints[verts, ranks] = elements_joints
+        self.vert_weights[verts, ranks] = elements_weights
+        if self.need_neutral_bone:
+            # Not assigned to any bone: assign to a joint that will be created later
+            self.vert_joints[unassigned, 0] = len(self.skin.joints)
+            self.vert_weights[unassigned, 0] = 1.0
@@ -0,0 +1,292 @@
+# Copyright 2018-2026 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import pickle
+import queue
+import subprocess
+import sys
+import threading
+from collections import deque
+
+from ..com import gltf2_blender_primitive_creation
+from ..com.debug import get_profiler
+from .nodes import get_mesh_extraction_inputs
+from .primitive_extract import PrimitiveCreator
+
+# Worker processes run this script, that imports the creation module as a top level module,
+# as the add-on package needs bpy
+WORKER_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'com', 'gltf2_blender_primitive_worker.py')
+
+
+class PrimitiveWorker():
+    """Worker process, creating primitives for the messages it receives, one at a time, in order."""
+
+    def __init__(self):
+        self.process = subprocess.Popen(
+            [sys.executable, WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self.keys = deque()  # Keys of the messages sent, and not received yet
+        # Responses are read as soon as they are written, so that a worker writing a large result
+        # never blocks while the main thread is waiting to send it the next message
+        self.responses = queue.Queue()
+        self.reader = threading.Thread(target=self.__read_responses, daemon=True)
+        self.reader.start()
+
+    def __read_responses(self):
+        while True:
+            try:
+                response = pickle.load(self.process.stdout)
+            except (EOFError, OSError, ValueError, pickle.UnpicklingError):
+                # Exited, or killed
+                self.responses.put(None)
+                return
+            self.responses.put(response)
+
+    def send(self, key, message):
+        pickle.dump(message, self.process.stdin, protocol=pickle.HIGHEST_PROTOCOL)
+        self.process.stdin.flush()
+        self.keys.append(key)
+
+    def receive(self):
+        """Key and result of the oldest message sent. Errors of the worker are raised here."""
+        key = self.keys.popleft()
+        response = self.responses.get()
+        if response is None:
+            # Let next calls fail too, instead of waiting for responses that won't come
+            self.responses.put(None)
+            raise RuntimeError("Primitive worker process exited unexpectedly")
+        status, value = response
+        if status == 'error':
+            raise RuntimeError("Primitive creation failed in worker process:\n" + value)
+        return key, value
+
+    def kill(self):
+        self.process.kill()
+        self.process.wait()
+        self.process.stdin.close()
+        # The reader stops at the end of stdout, once the process is killed
+        self.reader.join()
+        self.process.stdout.close()
+
+
+class PrimitiveExtractPipeline():
+    """Create primitives in worker processes, ahead of node gathering.
+
+    Mesh data of all exported mesh objects of a scene is read on the main thread, as bpy
+    can only be used there, and copied to shared memory. Worker processes deduplicate
+    vertices, split primitives and build attribute arrays from it, while the main thread
+    reads the next meshes. Node gathering then takes the mesh inputs computed here, and
+    mesh gathering the created primitives.
+    Meshes evaluated while gathering (applied modifiers, curves, geometry nodes instances)
+    are still extracted on the main thread.
+    """
+
+    def __init__(self, num_processes, export_settings):
+        self.export_settings = export_settings
+        self.workers = []
+        try:
+            for _ in range(num_processes):
+                self.workers.append(PrimitiveWorker())
+        except OSError:
+            for worker in self.workers:
+                worker.kill()
+            raise
+
+        # Snapshots are kept in shared memory until created, so the number of meshes waiting is bounded
+        self.max_pending = 2 * num_processes
+        self.pending = deque()
+        self.submitted = {}  # key -> (PrimitiveCreator, shared memory, PrimitiveWorker)
+        self.results = {}  # key -> extracted primitives
+        self.inputs = {}  # vnode uuid -> (mesh extraction inputs, key)
+        self.users = {}  # key -> uuids of the vnodes not gathered yet
+        self.created = 0
+        self.reused = 0
+        self.taken = 0
+        self.dropped = 0
+
+    @staticmethod
+    def start(vtree, export_settings):
+        """Start extracting primitives of all meshes of the vtree, if the pipeline is enabled."""
+        if 'primitive_pipeline' not in export_settings:
+            export_settings['primitive_pipeline'] = None
+
+            num_processes = export_settings.get('gltf_primitive_processes', 1)
+            if num_processes == 0:
+                num_processes = os.cpu_count() or 1
+            if num_processes <= 1:
+                return
+            # User extensions hooks can change meshes and attributes, and can't run in workers
+            if export_settings['gltf_user_extensions']:
+                return
+
+            try:
+                export_settings['primitive_pipeline'] = PrimitiveExtractPipeline(num_processes, export_settings)
+            except OSError as e:
+                export_settings['log'].warning("Primitive extraction processes disabled: {}".format(e))
+
+        pipeline = export_settings['primitive_pipeline']
+        if pipeline is not None:
+            with get_profiler(export_settings).span('primitive prefetch'):
+                pipeline.prefetch(vtree)
+
+    @staticmethod
+    def __key(materials, blender_mesh, uuid_for_skined_data, modifiers):
+        # Same arguments as extract_primitives. Only Armature modifiers are used, when skinned
+        return (
+            blender_mesh.as_pointer(),
+            uuid_for_skined_data,
+            modifiers is not None,
+            tuple(m.as_pointer() if m is not None else None for m in materials),
+        )
+
+    @staticmethod
+    def __exported_nodes(vtree):
+        # Nodes reachable from the roots, in the order they are gathered
+        stack = list(reversed(vtree.roots))
+        while stack:
+            vnode = vtree.nodes[stack.pop()]
+            yield vnode
+            stack.extend(reversed(vnode.children))
+
+    def prefetch(self, vtree):
+        for vnode in PrimitiveExtractPipeline.__exported_nodes(vtree):
+            inputs = get_mesh_extraction_inputs(vnode, self.export_settings)
+            if inputs is None:
+                continue
+            blender_mesh, uuid_for_skined_data, vertex_groups, modifiers, materials = inputs
+            key = PrimitiveExtractPipeline.__key(materials, blender_mesh, uuid_for_skined_data, modifiers)
+            self.inputs[vnode.uuid] = inputs, key
+            if key in self.users:
+                self.users[key].add(vnode.uuid)
+                continue
+            self.users[key] = {vnode.uuid}
+
+            self.export_settings['log'].info("Extracting primitive: " + blender_mesh.name)
+            creator = PrimitiveCreator(
+                materials,
+                blender_mesh,
+                uuid_for_skined_data,
+                vertex_groups,
+                modifiers,
+                self.export_settings)
+            result = creator.load_cached()
+            if result is not None:
+                self.results[key] = result
+                self.reused += 1
+                continue
+
+            creator.read()
+            self.__submit(key, creator)
+
+    def __submit(self, key, creator):
+        while len(self.pending) >= self.max_pending:
+            self.__wait(self.pending[0])
+
+        shm, message = gltf2_blender_primitive_creation.share_snapshot(creator.snapshot())
+        worker = min(self.workers, key=lambda w: len(w.keys))
+        try:
+            worker.send(key, message)
+        except OSError:
+            shm.close()
+            shm.unlink()
+            raise
+        self.submitted[key] = (creator, shm, worker)
+        self.pending.append(key)
+
+    def __wait(self, key):
+        # Workers answer in order, so results of the meshes sent before are received first
+        worker = self.submitted[key][2]
+        while self.__receive(worker) != key:
+            pass
+
+    def __receive(self, worker):
+        key = worker.keys[0]
+        creator, shm, _ = self.submitted.pop(key)
+        self.pending.remove(key)
+        try:
+            _, created = worker.receive()
+        finally:
+            shm.close()
+            shm.unlink()
+        self.created += 1
+        if key in self.users:
+            self.results[key] = creator.finish(created)
+        else:
+            self.dropped += 1
+        return key
+
+    def prefetched_inputs(self, uuid):
+        """Mesh extraction inputs computed by prefetch for a node, or None if not prefetched.
+
+        The mesh is already validated, and its materials and data kept in export settings.
+        """
+        inputs = self.inputs.get(uuid)
+        return inputs[0] if inputs is not None else None
+
+    def take(self, materials, blender_mesh, uuid_for_skined_data, modifiers):
+        """Primitives extracted for these extract_primitives arguments, or None if not prefetched.
+
+        Errors from workers are raised here, on the main thread.
+        """
+        key = PrimitiveExtractPipeline.__key(materials, blender_mesh, uuid_for_skined_data, modifiers)
+        if key in self.submitted:
+            self.__wait(key)
+        result = self.results.pop(key, None)
+        if result is not None:
+            self.taken += 1
+        return result
+
+    def release(self, uuid):
+        """Called once a node is gathered. Primitives that no node left can take are dropped."""
+        inputs = self.inputs.pop(uuid, None)
+        if inputs is None:
+            return
+        key = inputs[1]
+        users = self.users[key]
+        users.discard(uuid)
+        if len(users) > 0:
+            return
+        del self.users[key]
+        # Primitives still created by a worker are dropped when received
+        if self.results.pop(key, None) is not None:
+            self.dropped += 1
+
+    @staticmethod
+    def stop(export_settings):
+        pipeline = export_settings.get('primitive_pipeline')
+        if pipeline is not None:
+            pipeline.shutdown()
+
+    def shutdown(self):
+        for worker in self.workers:
+            worker.kill()
+        self.workers = []
+        for _, shm, _ in self.submitted.values():
+            shm.close()
+            shm.unlink()
+        self.submitted = {}
+        self.pending.clear()
+
+        self.export_settings['log'].info(
+            'Primitive pipeline: {} meshes created in worker processes, {} reused from cache, '
+            '{} used, {} dropped.'.format(self.created, self.reused, self.taken, self.dropped + len(self.results)))
+        get_profiler(self.export_settings).count('meshes created in processes', self.created)
+        self.results = {}
+        self.inputs = {}
+        self.users = {}
+        self.export_settings['primitive_pipeline'] = None
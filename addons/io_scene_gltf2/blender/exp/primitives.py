@@ -246,8 +246,8 @@ def __gather_indices(blender_primitive, blender_data, modifiers, export_settings
 
         byteStride = 4 if component_type == gltf2_io_constants.ComponentType.UnsignedInt else 2
 
-        compressed_indices, filter = MeshoptEncoder.encode_indices(
-            blender_primitive.get('mode'), indices, export_settings)
+        compressed_indices, filter = MeshoptEncoder.defer_indices(
+            blender_primitive.get('mode'), indices)
 
     element_type = gltf2_io_constants.DataType.Scalar
     binary_data = gltf2_io_binary_data.BinaryData(
@@ -256,9 +256,9 @@ def __gather_indices(blender_primitive, blender_data, modifiers, export_settings
     if export_settings['gltf_meshopt_compression']:
         mode = 'TRIANGLES' if blender_primitive.get('mode') in [4, None] else 'INDICES'
         binary_data.set_extension(export_settings['gltf_meshopt_extension'], {
-            'buffer': compressed_indices,  # to be filled in later by the exporter, use data in placeholder for now
+            'buffer': compressed_indices,  # to be filled in later by the exporter, use placeholder for now
             'byteOffset': None,  # to be filled in later by the exporter
-            'byteLength': len(compressed_indices),
+            'byteLength': None,  # to be filled in later by the exporter
             'byteStride': byteStride,
             'count': len(indices),
             'mode': mode,
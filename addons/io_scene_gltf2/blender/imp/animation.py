@@ -56,7 +56,7 @@ class BlenderAnimation():
                         continue
                     BlenderPointerAnim.anim(gltf, anim_idx, light, light_idx, 'LIGHT')
 
-            for mat_idx, mat in enumerate(gltf.data.materials if gltf.data.materials else []):
+            for mat_idx, mat in gltf.selected('materials'):
                 if len(mat.blender_material) == 0:
                     # The animated material is not used in Blender, so do not animate it
                     continue
@@ -148,7 +148,7 @@ class BlenderAnimation():
                         BlenderPointerAnim.anim(gltf, anim_idx, mat.extensions[ext], mat_idx, 'EXT', name=mat.name)
 
             # Extras Node
-            for node_idx, node in enumerate(gltf.data.nodes if gltf.data.nodes else []):
+            for node_idx, node in gltf.selected('nodes'):
                 if node.extras is not None and "gltf_tmp_data_animations" in node.extras:
                     BlenderPointerAnim.anim(
                         gltf,
@@ -160,7 +160,7 @@ class BlenderAnimation():
                         target_id_type='OBJECT')
 
             # Extras Mesh
-            for mesh_idx, mesh in enumerate(gltf.data.meshes if gltf.data.meshes else []):
+            for mesh_idx, mesh in gltf.selected('meshes'):
                 if mesh.extras is not None and "gltf_tmp_data_animations" in mesh.extras:
                     BlenderPointerAnim.anim(
                         gltf,
@@ -172,7 +172,7 @@ class BlenderAnimation():
                         target_id_type='MESH')
 
             # Extras Material
-            for mat_idx, mat in enumerate(gltf.data.materials if gltf.data.materials else []):
+            for mat_idx, mat in gltf.selected('materials'):
                 if mat.extras is not None and "gltf_tmp_data_animations" in mat.extras:
                     BlenderPointerAnim.anim(
                         gltf,
@@ -241,14 +241,16 @@ class BlenderAnimation():
                 restore_animation_on_object(obj.data.shape_keys, animation_name)
 
         if gltf.data.extensions_used is not None and "KHR_animation_pointer" in gltf.data.extensions_used:
-            for cam in gltf.data.cameras if gltf.data.cameras else []:
+            for _, cam in gltf.selected('cameras'):
                 restore_animation_on_object(cam.blender_object_data, animation_name)
 
             if gltf.data.extensions and "KHR_lights_punctual" in gltf.data.extensions:
-                for light in gltf.data.extensions['KHR_lights_punctual']['lights']:
+                for light_idx, light in enumerate(gltf.data.extensions['KHR_lights_punctual']['lights']):
+                    if gltf.selection is not None and light_idx not in gltf.selection.lights:
+                        continue
                     restore_animation_on_object(light['blender_object_data'], animation_name)
 
-            for mat in gltf.data.materials if gltf.data.materials else []:
+            for _, mat in gltf.selected('materials'):
                 if len(mat.blender_material) == 0:
                     # The animated material is not used in Blender, so do not animate it
                     continue
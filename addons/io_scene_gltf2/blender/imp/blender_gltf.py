@@ -28,8 +28,15 @@ class BlenderGlTF():
 
     @staticmethod
     def create(gltf):
-        """Create glTF main method, with optional profiling"""
+        """Create glTF main method, with optional profiling. Mapped files are released if creation fails."""
+        try:
+            BlenderGlTF.__create(gltf)
+        except BaseException:
+            gltf.close()
+            raise
 
+    @staticmethod
+    def __create(gltf):
         import_user_extensions('gather_import_gltf_before_hook', gltf)
 
         profile = bpy.app.debug_value == 102
@@ -57,8 +64,9 @@ class BlenderGlTF():
         BlenderGlTF.pre_compute(gltf)
         BlenderScene.create(gltf)
 
-        # If needed, create not used materials
-        if gltf.import_settings['import_unused_materials']:
+        # If needed, create not used materials.
+        # Filtered imports only create what the selection needs.
+        if gltf.import_settings['import_unused_materials'] and gltf.selection is None:
             for mat_idx in [i for i in range(len(gltf.data.materials)) if len(
                     gltf.data.materials[i].blender_material) == 0]:
                 BlenderMaterial.create(gltf, mat_idx, None)
@@ -104,6 +112,14 @@ class BlenderGlTF():
                 ns[:, [1, 2]] = ns[:, [2, 1]]
                 ns[:, 1] *= -1
 
+            def convert_quats_batch(qs):
+                # x,y,z,w -> w,x,-z,y
+                qs[:] = qs[:, [3, 0, 2, 1]]
+                qs[:, 2] *= -1
+
+            def convert_scales_batch(ss):
+                ss[:, [1, 2]] = ss[:, [2, 1]]
+
             # Correction for cameras and lights.
             # glTF: right = +X, forward = -Z, up = +Y
             # glTF after Yup2Zup: right = +X, forward = +Y, up = +Z
@@ -121,6 +137,8 @@ class BlenderGlTF():
 
             def convert_locs_batch(_locs): return
             def convert_normals_batch(_ns): return
+            def convert_quats_batch(qs): qs[:] = qs[:, [3, 0, 1, 2]]
+            def convert_scales_batch(_ss): return
 
             # Same convention, no correction needed.
             gltf.camera_correction = None
@@ -128,8 +146,10 @@ class BlenderGlTF():
         gltf.loc_gltf_to_blender = convert_loc
         gltf.locs_batch_gltf_to_blender = convert_locs_batch
         gltf.quaternion_gltf_to_blender = convert_quat
+        gltf.quaternions_batch_gltf_to_blender = convert_quats_batch
         gltf.normals_batch_gltf_to_blender = convert_normals_batch
         gltf.scale_gltf_to_blender = convert_scale
+        gltf.scales_batch_gltf_to_blender = convert_scales_batch
         gltf.matrix_gltf_to_blender = convert_matrix
 
     @staticmethod
@@ -138,30 +158,36 @@ class BlenderGlTF():
         # default scene used
         gltf.blender_scene = None
 
+        # Geometry nodes group used to import EXT_mesh_gpu_instancing, created when needed
+        gltf.instancer_node_group = None
+
         # Check if there is animation on object
         # Init is to False, and will be set to True during creation
         gltf.animation_object = False
 
+        # With import filters, only the selected nodes, meshes and materials
+        # are initialized (and decoded, for lazy documents)
+
         # Blender material
-        for material in gltf.data.materials if gltf.data.materials is not None else []:
+        for _, material in gltf.selected('materials'):
             material.blender_material = {}
 
         # images
         for img in gltf.data.images if gltf.data.images is not None else []:
             img.blender_image_name = None
 
-        for node in gltf.data.nodes if gltf.data.nodes is not None else []:
+        for _, node in gltf.selected('nodes'):
             # Weight animation management
             node.weight_animation = False
 
         # Meshes initialization
-        for mesh in gltf.data.meshes if gltf.data.meshes is not None else []:
+        for _, mesh in gltf.selected('meshes'):
             mesh.blender_name = {}  # caches Blender mesh name
 
         if gltf.data.extensions_used is not None and "KHR_animation_pointer" in gltf.data.extensions_used:
             # Meshes initialization
             if gltf.data.meshes:
-                for mesh in gltf.data.meshes:
+                for _, mesh in gltf.selected('meshes'):
                     mesh.blender_name = {}  # caches Blender mesh name
                     mesh.weight_animation_on_mesh = None  # For KHR_animation_pointer, weights on mesh
                     if mesh.extras is not None:
@@ -172,7 +198,7 @@ class BlenderGlTF():
                 if cam.extras is not None:
                     cam.extras["gltf_tmp_data_animations"] = {}
 
-            for mat in gltf.data.materials if gltf.data.materials is not None else []:
+            for _, mat in gltf.selected('materials'):
                 if mat.extras is not None:
                     mat.extras["gltf_tmp_data_animations"] = {}
                 mat.animations = {}
@@ -252,13 +278,13 @@ class BlenderGlTF():
                 if "extras" in light:
                     light["extras"]["gltf_tmp_data_animations"] = {}
 
-            for node in gltf.data.nodes if gltf.data.nodes is not None else []:
+            for _, node in gltf.selected('nodes'):
                 if node.extras is not None:
                     node.extras["gltf_tmp_data_animations"] = {}
 
         # Dispatch animation
         if gltf.data.animations:
-            for node in gltf.data.nodes if gltf.data.nodes is not None else []:
+            for _, node in gltf.selected('nodes'):
                 node.animations = {}
 
             track_names = set()
@@ -271,6 +297,11 @@ class BlenderGlTF():
                 track_names.add(anim.track_name)
 
                 for channel_idx, channel in enumerate(anim.channels):
+                    if gltf.selection is not None:
+                        if not BlenderGlTF.selection_keeps_channel(gltf, channel):
+                            continue
+                        gltf.selection.animations.add(anim_idx)
+
                     if channel.target.node is None:
                         # Manage KHR_animation_pointer for node TRS and weights
                         BlenderGlTF.dispatch_animation_pointer(gltf, anim, anim_idx, channel, channel_idx)
@@ -287,7 +318,9 @@ class BlenderGlTF():
         # For KHR_animation_pointer, weight on meshes
         # We broadcast mesh weight animations to corresponding nodes
         if gltf.data.extensions_used is not None and "KHR_animation_pointer" in gltf.data.extensions_used:
-            for node in gltf.data.nodes if gltf.data.nodes is not None else []:
+            for node_idx, node in gltf.selected('nodes'):
+                if gltf.selection is not None and node_idx not in gltf.selection.content_nodes:
+                    continue
                 if node.mesh is not None and gltf.data.meshes[node.mesh].weight_animation_on_mesh is not None:
                     anim_idx, channel_idx = gltf.data.meshes[node.mesh].weight_animation_on_mesh
                     if anim_idx not in node.animations.keys():
@@ -296,7 +329,7 @@ class BlenderGlTF():
                     node.weight_animation = True
 
         # Calculate names for each mesh's shapekeys
-        for mesh in gltf.data.meshes or []:
+        for _, mesh in gltf.selected('meshes'):
             mesh.shapekey_names = []
             used_names = set(['Basis'])  # Be sure to not use 'Basis' name at import, this is a reserved name
 
@@ -350,6 +383,15 @@ class BlenderGlTF():
         # Because this may be used  for KHR_animation_pointer, to know which socket is animated
         gltf.socket_infos = {}
 
+    @staticmethod
+    def selection_keeps_channel(gltf, channel):
+        if channel.target.node is not None:
+            return channel.target.node in gltf.selection.nodes
+        if channel.target.path != "pointer" or channel.target.extensions is None or \
+                "KHR_animation_pointer" not in channel.target.extensions:
+            return False
+        return gltf.selection.keeps_pointer(channel.target.extensions["KHR_animation_pointer"]["pointer"])
+
     @staticmethod
     def dispatch_animation_pointer(gltf, anim, anim_idx, channel, channel_idx):
         if channel.target.path != "pointer":
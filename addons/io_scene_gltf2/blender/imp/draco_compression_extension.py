@@ -19,13 +19,11 @@ from ...io.imp.gltf2_io_binary import BinaryData
 from ...io.com.library import dll_path
 
 
-def decode_primitive(gltf, prim):
-    """
-    Handles draco compression.
-    Moves decoded data into new buffers and buffer views held by the accessors of the given primitive.
-    """
+def load_library(gltf):
+    """Load the Draco decoder library once per import, and setup function signatures."""
+    if hasattr(gltf, 'draco_decoder'):
+        return gltf.draco_decoder
 
-    # Load DLL and setup function signatures.
     dll = cdll.LoadLibrary(str(dll_path('bf_intern_draco_bridge', 'Draco').resolve()))
 
     dll.decoderCreate.restype = c_void_p
@@ -64,6 +62,23 @@ def decode_primitive(gltf, prim):
     dll.decoderCopyIndices.restype = None
     dll.decoderCopyIndices.argtypes = [c_void_p, c_void_p]
 
+    # Only expose the library once signatures are set, as primitives can be decoded from worker threads
+    gltf.draco_decoder = dll
+    return dll
+
+
+def decode_primitive(gltf, prim):
+    """
+    Handles draco compression.
+    Moves decoded data into new buffers and buffer views held by the accessors of the given primitive.
+    Can be called from worker threads: decoding runs unlocked, registering new buffers is serialized.
+    """
+    if getattr(prim, 'draco_decoded', False):
+        # Already decoded, for example by the decode pipeline
+        return
+
+    dll = load_library(gltf)
+
     decoder = dll.decoderCreate()
     extension = prim.extensions['KHR_draco_mesh_compression']
 
@@ -75,41 +90,21 @@ def decode_primitive(gltf, prim):
         gltf.log.error('Draco Decoder: Unable to decode. Skipping primitive {}.'.format(name))
         return
 
-    # Choose a buffer index which does not yet exist, skipping over existing glTF buffers yet to be loaded
-    # and buffers which were generated and did not exist in the initial glTF file, like this decoder does.
-    base_buffer_idx = len(gltf.data.buffers)
-    for existing_buffer_idx in gltf.buffers:
-        if base_buffer_idx <= existing_buffer_idx:
-            base_buffer_idx = existing_buffer_idx + 1
-
     # Read indices.
     index_accessor = gltf.data.accessors[prim.indices]
-    if dll.decoderGetIndexCount(decoder) != index_accessor.count:
-        gltf.log.warning(
-            'Draco Decoder: Index count of accessor and decoded index count does not match. Updating accessor.')
-        index_accessor.count = dll.decoderGetIndexCount(decoder)
+    index_count = dll.decoderGetIndexCount(decoder)
     if not dll.decoderReadIndices(decoder, index_accessor.component_type):
         gltf.log.error('Draco Decoder: Unable to decode indices. Skipping primitive {}.'.format(name))
         return
 
     indices_byte_length = dll.decoderGetIndicesByteLength(decoder)
-    decoded_data = bytes(indices_byte_length)
-    dll.decoderCopyIndices(decoder, decoded_data)
-
-    # Generate a new buffer holding the decoded indices.
-    gltf.buffers[base_buffer_idx] = decoded_data
-
-    # Create a buffer view referencing the new buffer.
-    gltf.data.buffer_views.append(BufferView.from_dict({
-        'buffer': base_buffer_idx,
-        'byteLength': indices_byte_length
-    }))
-
-    # Update accessor to point to the new buffer view.
-    index_accessor.buffer_view = len(gltf.data.buffer_views) - 1
+    decoded_indices = bytes(indices_byte_length)
+    dll.decoderCopyIndices(decoder, decoded_indices)
 
     # Read each attribute.
-    for attr_idx, attr in enumerate(extension['attributes']):
+    vertex_count = dll.decoderGetVertexCount(decoder)
+    decoded_attributes = []
+    for attr in extension['attributes']:
         dracoId = extension['attributes'][attr]
         if attr not in prim.attributes:
             gltf.log.error(
@@ -118,12 +113,6 @@ def decode_primitive(gltf, prim):
             return
 
         accessor = gltf.data.accessors[prim.attributes[attr]]
-        if dll.decoderGetVertexCount(decoder) != accessor.count:
-            gltf.log.warning(
-                'Draco Decoder: Vertex count of accessor and decoded vertex count does not match for attribute {}. Updating accessor.'.format(
-                    attr,
-                    name))
-            accessor.count = dll.decoderGetVertexCount(decoder)
         if not dll.decoderReadAttribute(decoder, dracoId, accessor.component_type, accessor.type.encode()):
             gltf.log.error('Draco Decoder: Could not decode attribute {}. Skipping primitive {}.'.format(attr, name))
             return
@@ -131,18 +120,54 @@ def decode_primitive(gltf, prim):
         byte_length = dll.decoderGetAttributeByteLength(decoder, dracoId)
         decoded_data = bytes(byte_length)
         dll.decoderCopyAttribute(decoder, dracoId, decoded_data)
+        decoded_attributes.append((attr, accessor, decoded_data))
 
-        # Generate a new buffer holding the decoded vertex data.
-        buffer_idx = base_buffer_idx + 1 + attr_idx
-        gltf.buffers[buffer_idx] = decoded_data
+    dll.decoderRelease(decoder)
+
+    with gltf.data_lock:
+        # Choose a buffer index which does not yet exist, skipping over existing glTF buffers yet to be loaded
+        # and buffers which were generated and did not exist in the initial glTF file, like this decoder does.
+        base_buffer_idx = len(gltf.data.buffers)
+        for existing_buffer_idx in gltf.buffers:
+            if base_buffer_idx <= existing_buffer_idx:
+                base_buffer_idx = existing_buffer_idx + 1
+
+        if index_count != index_accessor.count:
+            gltf.log.warning(
+                'Draco Decoder: Index count of accessor and decoded index count does not match. Updating accessor.')
+            index_accessor.count = index_count
+
+        # Generate a new buffer holding the decoded indices.
+        gltf.buffers[base_buffer_idx] = decoded_indices
 
         # Create a buffer view referencing the new buffer.
         gltf.data.buffer_views.append(BufferView.from_dict({
-            'buffer': buffer_idx,
-            'byteLength': byte_length
+            'buffer': base_buffer_idx,
+            'byteLength': indices_byte_length
         }))
 
         # Update accessor to point to the new buffer view.
-        accessor.buffer_view = len(gltf.data.buffer_views) - 1
-
-    dll.decoderRelease(decoder)
+        index_accessor.buffer_view = len(gltf.data.buffer_views) - 1
+
+        for attr_idx, (attr, accessor, decoded_data) in enumerate(decoded_attributes):
+            if vertex_count != accessor.count:
+                gltf.log.warning(
+                    'Draco Decoder: Vertex count of accessor and decoded vertex count does not match for attribute {}. Updating accessor.'.format(
+                        attr,
+                        name))
+                accessor.count = vertex_count
+
+            # Generate a new buffer holding the decoded vertex data.
+            buffer_idx = base_buffer_idx + 1 + attr_idx
+            gltf.buffers[buffer_idx] = decoded_data
+
+            # Create a buffer view referencing the new buffer.
+            gltf.data.buffer_views.append(BufferView.from_dict({
+                'buffer': buffer_idx,
+                'byteLength': len(decoded_data)
+            }))
+
+            # Update accessor to point to the new buffer view.
+            accessor.buffer_view = len(gltf.data.buffer_views) - 1
+
+        prim.draco_decoded = True
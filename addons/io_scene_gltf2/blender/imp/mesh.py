@@ -49,6 +49,9 @@ COLOR_MAX = 8
 def create_mesh(gltf, mesh_idx, skin_idx):
     pymesh = gltf.data.meshes[mesh_idx]
 
+    if gltf.decode_pipeline is not None:
+        gltf.decode_pipeline.wait(mesh_idx)
+
     import_user_extensions('gather_import_mesh_before_hook', gltf, pymesh)
 
     name = pymesh.name or 'Mesh_%d' % mesh_idx
@@ -75,6 +78,9 @@ def create_mesh(gltf, mesh_idx, skin_idx):
 
 def create_pointcloud(gltf, mesh_idx):
     pypc = gltf.data.meshes[mesh_idx]
+
+    if gltf.decode_pipeline is not None:
+        gltf.decode_pipeline.wait(mesh_idx)
     import_user_extensions('gather_import_pointcloud_before_hook', gltf, pypc)
 
     name = pypc.name or 'PointCloud_%d' % mesh_idx
@@ -199,7 +205,6 @@ def do_primitives(gltf, mesh_idx, skin_idx, mesh, ob):
     num_cols = 0
     num_joint_sets = 0
     attributes = {}
-    attribute_data = []
     attribute_type = {}
     attribute_component_type = {}
 
@@ -233,47 +238,12 @@ def do_primitives(gltf, mesh_idx, skin_idx, mesh, ob):
             if attr not in attributes:
                 attribute_type[attr] = gltf.data.accessors[prim.attributes[attr]].type
                 attribute_component_type[attr] = gltf.data.accessors[prim.attributes[attr]].component_type
-                attribute_data.append(
-                    np.empty(
-                        dtype=ComponentType.to_numpy_dtype(attribute_component_type[attr]),
-                        shape=(0, DataType.num_elements(attribute_type[attr])))
-                )
         # Make sure all attributes are in the dict, even those not in the first primitive(s)
         # And make sure the order of attributes is the same for all primitives
         attributes.update(dict.fromkeys(custom_attrs))
 
     num_shapekeys = sum(sk_name is not None for sk_name in pymesh.shapekey_names)
 
-    # -------------
-    # We'll process all the primitives gathering arrays to feed into the
-    # various foreach_set function that create the mesh data.
-
-    num_faces = 0  # total number of faces
-    vert_locs = np.empty(dtype=np.float32, shape=(0, 3))  # coordinate for each vert
-    vert_normals = np.empty(dtype=np.float32, shape=(0, 3))  # normal for each vert
-    edge_vidxs = np.array([], dtype=np.uint32)  # vertex_index for each loose edge
-    loop_vidxs = np.array([], dtype=np.uint32)  # vertex_index for each loop
-    loop_uvs = [
-        np.empty(dtype=np.float32, shape=(0, 2))  # UV for each loop for each layer
-        for _ in range(num_uvs)
-    ]
-    loop_cols = [
-        np.empty(dtype=np.float32, shape=(0, 4))  # color for each loop for each layer
-        for _ in range(num_cols)
-    ]
-    vert_joints = [
-        np.empty(dtype=np.uint32, shape=(0, 4))  # 4 joints for each vert for each set
-        for _ in range(num_joint_sets)
-    ]
-    vert_weights = [
-        np.empty(dtype=np.float32, shape=(0, 4))  # 4 weights for each vert for each set
-        for _ in range(num_joint_sets)
-    ]
-    sk_vert_locs = [
-        np.empty(dtype=np.float32, shape=(0, 3))  # coordinate for each vert for each shapekey
-        for _ in range(num_shapekeys)
-    ]
-
     # We need to detect if some non-tri primitives have some VC.
     # (Because, in that case, we will need to create vertex domain VC, instead of corner domain VC)
     has_non_tri_vcs = []
@@ -283,14 +253,23 @@ def do_primitives(gltf, mesh_idx, skin_idx, mesh, ob):
             ['COLOR_' + str(i) in attr for attr in prim.attributes]) for prim in pymesh.primitives]))
         vc_domains.append('POINT' if has_non_tri_vcs[i] else 'CORNER')
 
-    for prim in pymesh.primitives:
+    # -------------
+    # First pass: decode the indices of all primitives, to know the final size
+    # of the arrays feeding the various foreach_set functions.
+
+    prim_infos = []  # (prim, indices, unique_indices, inv_indices, has_edges, has_tris) for each primitive
+    num_faces = 0  # total number of faces
+    num_verts = 0
+    num_loops = 0
+    num_edge_vidxs = 0
+    num_col_elems = [0] * num_cols
+
+    for prim_idx, prim in enumerate(pymesh.primitives):
         prim.num_faces = 0
 
         if 'POSITION' not in prim.attributes:
             continue
 
-        vert_index_base = len(vert_locs)
-
         if prim.extensions is not None and 'KHR_draco_mesh_compression' in prim.extensions:
 
             gltf.log.info('Draco Decoder: Decode primitive {}'.format(pymesh.name or '[unnamed]'))
@@ -298,47 +277,90 @@ def do_primitives(gltf, mesh_idx, skin_idx, mesh, ob):
 
         import_user_extensions('gather_import_decode_primitive', gltf, pymesh, prim, skin_idx)
 
-        if prim.indices is not None:
-            indices = BinaryData.decode_accessor(gltf, prim.indices)
-            indices = indices.reshape(len(indices))
-        else:
-            num_verts = gltf.data.accessors[prim.attributes['POSITION']].count
-            indices = np.arange(0, num_verts, dtype=np.uint32)
-
-        mode = 4 if prim.mode is None else prim.mode
-        points, edges, tris = points_edges_tris(mode, indices)
-        if points is not None:
-            indices = points
-        elif edges is not None:
-            indices = edges
-        else:
-            indices = tris
+        decoded = None
+        if gltf.decode_pipeline is not None:
+            decoded = gltf.decode_pipeline.take_indices(mesh_idx, prim_idx)
+        if decoded is None:
+            decoded = decode_primitive_indices(gltf, prim)
+        indices, unique_indices, inv_indices, has_edges, has_tris = decoded
 
-        # We'll add one vert to the arrays for each index used in indices
-        unique_indices, inv_indices = np.unique(indices, return_inverse=True)
+        prim_infos.append((prim, indices, unique_indices, inv_indices, has_edges, has_tris))
+
+        num_verts += len(unique_indices)
+        if has_edges:
+            num_edge_vidxs += len(indices)
+        if has_tris:
+            prim.num_faces = len(indices) // 3
+            num_faces += prim.num_faces
+            num_loops += len(indices)
+        for col_i in range(num_cols):
+            num_col_elems[col_i] += len(indices) if vc_domains[col_i] == 'CORNER' else len(unique_indices)
+
+    # -------------
+    # Allocate all arrays once
+
+    vert_locs = np.empty(dtype=np.float32, shape=(num_verts, 3))  # coordinate for each vert
+    vert_normals = np.empty(dtype=np.float32, shape=(num_verts if has_normals else 0, 3))  # normal for each vert
+    edge_vidxs = np.empty(num_edge_vidxs, dtype=np.uint32)  # vertex_index for each loose edge
+    loop_vidxs = np.empty(num_loops, dtype=np.uint32)  # vertex_index for each loop
+    loop_uvs = [
+        np.empty(dtype=np.float32, shape=(num_loops, 2))  # UV for each loop for each layer
+        for _ in range(num_uvs)
+    ]
+    loop_cols = [
+        np.empty(dtype=np.float32, shape=(num_col_elems[col_i], 4))  # color for each loop for each layer
+        for col_i in range(num_cols)
+    ]
+    vert_joints = [
+        np.empty(dtype=np.uint32, shape=(num_verts, 4))  # 4 joints for each vert for each set
+        for _ in range(num_joint_sets)
+    ]
+    vert_weights = [
+        np.empty(dtype=np.float32, shape=(num_verts, 4))  # 4 weights for each vert for each set
+        for _ in range(num_joint_sets)
+    ]
+    sk_vert_locs = [
+        np.empty(dtype=np.float32, shape=(num_verts, 3))  # coordinate for each vert for each shapekey
+        for _ in range(num_shapekeys)
+    ]
+    attribute_data = [
+        np.empty(
+            dtype=ComponentType.to_numpy_dtype(attribute_component_type[attr]),
+            shape=(num_verts, DataType.num_elements(attribute_type[attr])))
+        for attr in attributes
+    ]
+
+    # -------------
+    # Second pass: fill the arrays, primitive by primitive
+
+    vert_index_base = 0
+    loop_base = 0
+    edge_base = 0
+    col_bases = [0] * num_cols
+
+    for prim, indices, unique_indices, inv_indices, has_edges, has_tris in prim_infos:
+        vert_end = vert_index_base + len(unique_indices)
+        verts = slice(vert_index_base, vert_end)
 
         vs = BinaryData.decode_accessor(gltf, prim.attributes['POSITION'], cache=True)
-        vert_locs = np.concatenate((vert_locs, vs[unique_indices]))
+        vert_locs[verts] = vs[unique_indices]
 
         if has_normals:
             if 'NORMAL' in prim.attributes:
                 ns = BinaryData.decode_accessor(gltf, prim.attributes['NORMAL'], cache=True)
-                ns = ns[unique_indices]
+                vert_normals[verts] = ns[unique_indices]
             else:
-                ns = np.zeros((len(unique_indices), 3), dtype=np.float32)
-            vert_normals = np.concatenate((vert_normals, ns))
+                vert_normals[verts] = 0
 
         for i in range(num_joint_sets):
             if ('JOINTS_%d' % i) in prim.attributes and ('WEIGHTS_%d' % i) in prim.attributes:
                 js = BinaryData.decode_accessor(gltf, prim.attributes['JOINTS_%d' % i], cache=True)
                 ws = BinaryData.decode_accessor(gltf, prim.attributes['WEIGHTS_%d' % i], cache=True)
-                js = js[unique_indices]
-                ws = ws[unique_indices]
+                vert_joints[i][verts] = js[unique_indices]
+                vert_weights[i][verts] = ws[unique_indices]
             else:
-                js = np.zeros((len(unique_indices), 4), dtype=np.uint32)
-                ws = np.zeros((len(unique_indices), 4), dtype=np.float32)
-            vert_joints[i] = np.concatenate((vert_joints[i], js))
-            vert_weights[i] = np.concatenate((vert_weights[i], ws))
+                vert_joints[i][verts] = 0
+                vert_weights[i][verts] = 0
 
         sk_i = 0
         for sk, sk_name in enumerate(pymesh.shapekey_names):
@@ -346,10 +368,9 @@ def do_primitives(gltf, mesh_idx, skin_idx, mesh, ob):
                 continue
             if prim.targets and 'POSITION' in prim.targets[sk]:
                 morph_vs = BinaryData.decode_accessor(gltf, prim.targets[sk]['POSITION'], cache=True)
-                morph_vs = morph_vs[unique_indices]
+                sk_vert_locs[sk_i][verts] = morph_vs[unique_indices]
             else:
-                morph_vs = np.zeros((len(unique_indices), 3), dtype=np.float32)
-            sk_vert_locs[sk_i] = np.concatenate((sk_vert_locs[sk_i], morph_vs))
+                sk_vert_locs[sk_i][verts] = 0
             sk_i += 1
 
         # inv_indices are the indices into the verts just for this prim;
@@ -357,55 +378,46 @@ def do_primitives(gltf, mesh_idx, skin_idx, mesh, ob):
         prim_vidxs = inv_indices.astype(np.uint32, copy=False)
         prim_vidxs += vert_index_base  # offset for verts from previous prims
 
-        if edges is not None:
-            edge_vidxs = np.concatenate((edge_vidxs, prim_vidxs))
-
-        if tris is not None:
-            prim.num_faces = len(indices) // 3
-            num_faces += prim.num_faces
+        if has_edges:
+            edge_vidxs[edge_base:edge_base + len(prim_vidxs)] = prim_vidxs
+            edge_base += len(prim_vidxs)
 
-            loop_vidxs = np.concatenate((loop_vidxs, prim_vidxs))
+        if has_tris:
+            loops = slice(loop_base, loop_base + len(indices))
+            loop_vidxs[loops] = prim_vidxs
 
             # UV only if we have a face
             for uv_i in range(num_uvs):
                 if ('TEXCOORD_%d' % uv_i) in prim.attributes:
                     uvs = BinaryData.decode_accessor(gltf, prim.attributes['TEXCOORD_%d' % uv_i], cache=True)
-                    uvs = uvs[indices]
+                    loop_uvs[uv_i][loops] = uvs[indices]
                 else:
-                    uvs = np.zeros((len(indices), 2), dtype=np.float32)
-                loop_uvs[uv_i] = np.concatenate((loop_uvs[uv_i], uvs))
+                    loop_uvs[uv_i][loops] = 0
+
+            loop_base += len(indices)
 
         # We can have VC for points, lines, and tris
         for col_i in range(num_cols):
+            col_indices = indices if vc_domains[col_i] == 'CORNER' else unique_indices
+            cols_slice = slice(col_bases[col_i], col_bases[col_i] + len(col_indices))
             if ('COLOR_%d' % col_i) in prim.attributes:
                 cols = BinaryData.decode_accessor(gltf, prim.attributes['COLOR_%d' % col_i], cache=True)
-                if vc_domains[col_i] == 'CORNER':
-                    cols = cols[indices]
-                else:
-                    cols = cols[unique_indices]
+                cols = cols[col_indices]
                 if cols.shape[1] == 3:
                     cols = colors_rgb_to_rgba(cols)
+                loop_cols[col_i][cols_slice] = cols
             else:
-                if vc_domains[col_i] == 'CORNER':
-                    cols = np.ones((len(indices), 4), dtype=np.float32)
-                else:
-                    cols = np.ones((len(unique_indices), 4), dtype=np.float32)
-            loop_cols[col_i] = np.concatenate((loop_cols[col_i], cols))
+                loop_cols[col_i][cols_slice] = 1
+            col_bases[col_i] += len(col_indices)
 
         for idx, attr in enumerate(attributes):
             if attr in prim.attributes:
                 attr_data = BinaryData.decode_accessor(gltf, prim.attributes[attr], cache=True)
-                attribute_data[idx] = np.concatenate((attribute_data[idx], attr_data[unique_indices]))
+                attribute_data[idx][verts] = attr_data[unique_indices]
             else:
-                attr_data = np.zeros(
-                    (len(unique_indices), DataType.num_elements(attribute_type[attr])),
-                    dtype=ComponentType.to_numpy_dtype(attribute_component_type[attr])
-                )
-                attribute_data[idx] = np.concatenate((attribute_data[idx], attr_data))
+                attribute_data[idx][verts] = 0
 
-    # Accessors are cached in case they are shared between primitives; clear
-    # the cache now that all prims are done.
-    gltf.decode_accessor_cache = {}
+        vert_index_base = vert_end
 
     if gltf.import_settings['merge_vertices']:
         vert_locs, vert_normals, vert_joints, vert_weights, \
@@ -672,6 +684,33 @@ def do_primitives(gltf, mesh_idx, skin_idx, mesh, ob):
         mesh.normals_split_custom_set_from_vertices(vert_normals)
 
 
+def decode_primitive_indices(gltf, prim):
+    """Decode the indices of a primitive, and find the vertices they use.
+
+    Only uses numpy, so it can run on decode worker threads.
+    """
+    if prim.indices is not None:
+        indices = BinaryData.decode_accessor(gltf, prim.indices)
+        indices = indices.reshape(len(indices))
+    else:
+        num_verts = gltf.data.accessors[prim.attributes['POSITION']].count
+        indices = np.arange(0, num_verts, dtype=np.uint32)
+
+    mode = 4 if prim.mode is None else prim.mode
+    points, edges, tris = points_edges_tris(mode, indices)
+    if points is not None:
+        indices = points
+    elif edges is not None:
+        indices = edges
+    else:
+        indices = tris
+
+    # We'll add one vert to the arrays for each index used in indices
+    unique_indices, inv_indices = np.unique(indices, return_inverse=True)
+
+    return indices, unique_indices, inv_indices, edges is not None, tris is not None
+
+
 def points_edges_tris(mode, indices):
     points = None
     edges = None
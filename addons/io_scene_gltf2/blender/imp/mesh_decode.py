@@ -0,0 +1,141 @@
+# Copyright 2018-2021 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from ...io.imp.gltf2_io_binary import BinaryData
+from ...io.imp.gltf2_io_binary_meshopt import MeshoptDecoder
+from .draco_compression_extension import decode_primitive, load_library as load_draco_library
+from .vnode import VNode
+
+
+class MeshDecodePipeline():
+    """Decode mesh data on worker threads, ahead of mesh creation.
+
+    Workers decode Draco primitives, meshopt buffer views, accessors (stored in
+    the accessor cache) and primitive indices. Only numpy and the ctypes
+    decoders are used there, as they release the GIL. All bpy calls stay on
+    the main thread, that waits for a mesh to be decoded before creating it.
+    Only a few meshes are decoded ahead, so that decoded data fits in the accessor
+    cache until used.
+    """
+
+    def __init__(self, gltf, mesh_indices, num_threads):
+        self.gltf = gltf
+        self.indices = {}  # (mesh_idx, prim_idx) -> decoded primitive indices
+
+        # Libraries are loaded on the main thread, as finding them needs bpy
+        if any(prim.extensions is not None and 'KHR_draco_mesh_compression' in prim.extensions
+               for mesh_idx in mesh_indices for prim in gltf.data.meshes[mesh_idx].primitives):
+            load_draco_library(gltf)
+        if any(e in (gltf.data.extensions_used or []) for e in ['EXT_meshopt_compression', 'KHR_meshopt_compression']):
+            MeshoptDecoder.load_library(gltf)
+
+        self.executor = ThreadPoolExecutor(max_workers=num_threads, thread_name_prefix='glTFImportDecode')
+        self.max_pending = 2 * num_threads
+        self.queue = deque(mesh_indices)  # Meshes not submitted yet, in creation order
+        self.futures = {}
+        self.__submit()
+
+    @staticmethod
+    def start(gltf):
+        """Start decoding all meshes used by the vnodes, if the pipeline is enabled."""
+        num_threads = gltf.import_settings.get('import_decode_threads', 0)
+        if num_threads == 0:
+            num_threads = os.cpu_count() or 1
+        if num_threads <= 1:
+            return
+        # User extensions hooks may change primitives before decoding, and may not be thread safe
+        if gltf.import_user_extensions:
+            return
+
+        mesh_indices = {}  # Used as an ordered set
+        for vnode in MeshDecodePipeline.__creation_order(gltf):
+            if vnode.type == VNode.Inst:
+                mesh_idx = vnode.mesh_idx
+            elif vnode.mesh_node_idx is not None:
+                mesh_idx = gltf.data.nodes[vnode.mesh_node_idx].mesh
+            else:
+                continue
+            if mesh_idx is not None and 0 <= mesh_idx < len(gltf.data.meshes):
+                mesh_indices[mesh_idx] = None
+
+        if len(mesh_indices) == 0:
+            return
+
+        gltf.decode_pipeline = MeshDecodePipeline(gltf, list(mesh_indices), num_threads)
+
+    @staticmethod
+    def __creation_order(gltf):
+        # Depth first, from the root, as BlenderNode.create_vnode creates objects
+        stack = ['root']
+        while stack:
+            vnode = gltf.vnodes[stack.pop()]
+            yield vnode
+            stack.extend(reversed(vnode.children))
+
+    def decode_mesh(self, mesh_idx):
+        # Imported here to avoid a circular import
+        from .mesh import decode_primitive_indices
+
+        gltf = self.gltf
+        pymesh = gltf.data.meshes[mesh_idx]
+        is_point_cloud = gltf.import_settings.get('import_point_as_pointcloud', False) and \
+            all([prim.mode == 0 for prim in pymesh.primitives])
+
+        for prim_idx, prim in enumerate(pymesh.primitives):
+            if 'POSITION' not in prim.attributes:
+                continue
+
+            if prim.extensions is not None and 'KHR_draco_mesh_compression' in prim.extensions:
+                decode_primitive(gltf, prim)
+
+            if not is_point_cloud:
+                self.indices[(mesh_idx, prim_idx)] = decode_primitive_indices(gltf, prim)
+
+            accessor_indices = list(prim.attributes.values())
+            for target in prim.targets or []:
+                if 'POSITION' in target:
+                    accessor_indices.append(target['POSITION'])
+            for accessor_idx in accessor_indices:
+                BinaryData.decode_accessor(gltf, accessor_idx, cache=True)
+
+    def __submit(self):
+        while self.queue and len(self.futures) < self.max_pending:
+            mesh_idx = self.queue.popleft()
+            self.futures[mesh_idx] = self.executor.submit(self.decode_mesh, mesh_idx)
+
+    def wait(self, mesh_idx):
+        """Wait until a mesh is decoded. Errors from workers are raised here, on the main thread.
+
+        A mesh not submitted yet is left to the main thread.
+        """
+        future = self.futures.pop(mesh_idx, None)
+        if future is None and mesh_idx in self.queue:
+            self.queue.remove(mesh_idx)
+        self.__submit()
+        if future is not None:
+            future.result()
+
+    def take_indices(self, mesh_idx, prim_idx):
+        return self.indices.pop((mesh_idx, prim_idx), None)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.queue.clear()
+        self.futures = {}
+        self.indices = {}
+        self.gltf.decode_pipeline = None
@@ -64,7 +64,10 @@ class BlenderNode():
             obj = BlenderNode.create_mesh_object(gltf, vnode)
 
         elif vnode.type == VNode.Inst and vnode.mesh_idx is not None:
-            obj = BlenderNode.create_mesh_object(gltf, vnode)
+            if vnode.instances is not None:
+                obj = BlenderNode.create_instancer_object(gltf, vnode)
+            else:
+                obj = BlenderNode.create_mesh_object(gltf, vnode)
 
         elif vnode.camera_node_idx is not None:
             pynode = gltf.data.nodes[vnode.camera_node_idx]
@@ -163,24 +166,29 @@ class BlenderNode():
         if gltf.import_settings['disable_bone_shape'] is True:
             return
 
-        # Create a special collection (if not exists already)
-        # Content of this collection will not be exported
-        if BLENDER_GLTF_SPECIAL_COLLECTION not in bpy.data.collections:
-            bpy.data.collections.new(BLENDER_GLTF_SPECIAL_COLLECTION)
-            bpy.data.scenes[gltf.blender_scene].collection.children.link(
-                bpy.data.collections[BLENDER_GLTF_SPECIAL_COLLECTION])
-            bpy.data.collections[BLENDER_GLTF_SPECIAL_COLLECTION].hide_viewport = True
-            bpy.data.collections[BLENDER_GLTF_SPECIAL_COLLECTION].hide_render = True
-
-        # Create an icosphere, and assign it to the collection
+        # Create an icosphere, and assign it to the special collection
+        special_collection = BlenderNode.get_special_collection(gltf)
         bpy.ops.mesh.primitive_ico_sphere_add(
             radius=1, enter_editmode=False, align='WORLD', location=(
                 0, 0, 0), scale=(
                 1, 1, 1))
-        bpy.data.collections[BLENDER_GLTF_SPECIAL_COLLECTION].objects.link(bpy.context.object)
+        special_collection.objects.link(bpy.context.object)
         gltf.bone_shape = bpy.context.object.name
         bpy.context.collection.objects.unlink(bpy.context.object)
 
+    @staticmethod
+    def get_special_collection(gltf):
+        """Get the hidden collection of helper objects, creating it if needed.
+        Content of this collection will not be exported.
+        """
+        if BLENDER_GLTF_SPECIAL_COLLECTION not in bpy.data.collections:
+            bpy.data.collections.new(BLENDER_GLTF_SPECIAL_COLLECTION)
+            bpy.data.scenes[gltf.blender_scene].collection.children.link(
+                bpy.data.collections[BLENDER_GLTF_SPECIAL_COLLECTION])
+            bpy.data.collections[BLENDER_GLTF_SPECIAL_COLLECTION].hide_viewport = True
+            bpy.data.collections[BLENDER_GLTF_SPECIAL_COLLECTION].hide_render = True
+        return bpy.data.collections[BLENDER_GLTF_SPECIAL_COLLECTION]
+
     @staticmethod
     def calc_empty_display_size(gltf, vnode_id):
         # Use min distance to parent/children to guess size
@@ -344,6 +352,87 @@ class BlenderNode():
 
         return obj
 
+    @staticmethod
+    def create_instancer_object(gltf, vnode):
+        """Create the EXT_mesh_gpu_instancing instances of a mesh as a single object.
+        Each instance is a point, with rotation and scale attributes, and the mesh is
+        instanced on the points by a geometry nodes modifier.
+        """
+        locs, rots, scales = vnode.instances
+
+        # The instanced mesh object is only used by the modifier, so it is hidden and not exported
+        instanced_obj = BlenderNode.create_mesh_object(gltf, vnode)
+        BlenderNode.get_special_collection(gltf).objects.link(instanced_obj)
+
+        name = vnode.name or vnode.default_name
+        mesh = bpy.data.meshes.new(name)
+        mesh.vertices.add(len(locs))
+        mesh.vertices.foreach_set('co', locs.reshape(-1))
+        mesh.attributes.new('rotation', 'QUATERNION', 'POINT').data.foreach_set('value', rots.reshape(-1))
+        mesh.attributes.new('scale', 'FLOAT_VECTOR', 'POINT').data.foreach_set('vector', scales.reshape(-1))
+        mesh.update()
+
+        obj = bpy.data.objects.new(name, mesh)
+        node_group = BlenderNode.get_instancer_node_group(gltf)
+        mod = obj.modifiers.new(name="GPU Instancing", type="NODES")
+        mod.node_group = node_group
+        mod[node_group.interface.items_tree['Instance'].identifier] = instanced_obj
+
+        gltf.log.info("Blender create {} instances of mesh {}".format(len(locs), vnode.mesh_idx))
+
+        return obj
+
+    @staticmethod
+    def get_instancer_node_group(gltf):
+        """Geometry nodes group instancing an object on points, using their rotation and scale attributes.
+        Created once, and shared by all instancers of the import.
+        """
+        if gltf.instancer_node_group is not None:
+            return gltf.instancer_node_group
+
+        node_group = bpy.data.node_groups.new('glTF GPU Instancing', 'GeometryNodeTree')
+        node_group.is_modifier = True
+        node_group.interface.new_socket('Geometry', in_out='INPUT', socket_type='NodeSocketGeometry')
+        node_group.interface.new_socket('Instance', in_out='INPUT', socket_type='NodeSocketObject')
+        node_group.interface.new_socket('Geometry', in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+        nodes = node_group.nodes
+        links = node_group.links
+
+        group_input = nodes.new('NodeGroupInput')
+        group_input.location = (-600, 0)
+
+        object_info = nodes.new('GeometryNodeObjectInfo')
+        object_info.location = (-400, -100)
+        object_info.transform_space = 'ORIGINAL'
+        object_info.inputs['As Instance'].default_value = True
+
+        rotation = nodes.new('GeometryNodeInputNamedAttribute')
+        rotation.location = (-400, -300)
+        rotation.data_type = 'QUATERNION'
+        rotation.inputs['Name'].default_value = 'rotation'
+
+        scale = nodes.new('GeometryNodeInputNamedAttribute')
+        scale.location = (-400, -450)
+        scale.data_type = 'FLOAT_VECTOR'
+        scale.inputs['Name'].default_value = 'scale'
+
+        instance_on_points = nodes.new('GeometryNodeInstanceOnPoints')
+        instance_on_points.location = (-100, 0)
+
+        group_output = nodes.new('NodeGroupOutput')
+        group_output.location = (150, 0)
+
+        links.new(group_input.outputs['Geometry'], instance_on_points.inputs['Points'])
+        links.new(group_input.outputs['Instance'], object_info.inputs['Object'])
+        links.new(object_info.outputs['Geometry'], instance_on_points.inputs['Instance'])
+        links.new(rotation.outputs['Attribute'], instance_on_points.inputs['Rotation'])
+        links.new(scale.outputs['Attribute'], instance_on_points.inputs['Scale'])
+        links.new(instance_on_points.outputs['Instances'], group_output.inputs['Geometry'])
+
+        gltf.instancer_node_group = node_group
+        return node_group
+
     @staticmethod
     def set_morph_weights(gltf, pynode, obj):
         pymesh = gltf.data.meshes[pynode.mesh]
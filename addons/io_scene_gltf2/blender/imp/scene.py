@@ -17,6 +17,7 @@ import bpy
 from .node import BlenderNode
 from .animation import BlenderAnimation
 from .vnode import VNode, compute_vnodes
+from .mesh_decode import MeshDecodePipeline
 from ..com.extras import set_extras
 from ...io.imp.user_extensions import import_user_extensions
 
@@ -45,8 +46,15 @@ class BlenderScene():
 
         compute_vnodes(gltf)
 
+        # Decode meshes on worker threads, while nodes are created
+        MeshDecodePipeline.start(gltf)
+
         gltf.display_current_node = 0  # for debugging
-        BlenderNode.create_vnode(gltf, 'root')
+        try:
+            BlenderNode.create_vnode(gltf, 'root')
+        finally:
+            if gltf.decode_pipeline is not None:
+                gltf.decode_pipeline.shutdown()
 
         # User extensions before scene creation
         gltf_scene = None
@@ -90,17 +98,24 @@ class BlenderScene():
         if gltf.data.animations:
             # NLA tracks are added bottom to top, so create animations in
             # reverse so the first winds up on top
-            for anim_idx in reversed(range(len(gltf.data.animations))):
+            anim_indices = range(len(gltf.data.animations))
+            if gltf.selection is not None:
+                # Skip animations that don't target anything selected
+                anim_indices = sorted(gltf.selection.animations)
+            if not anim_indices:
+                return
+
+            for anim_idx in reversed(anim_indices):
                 BlenderAnimation.anim(gltf, anim_idx)
 
             # Restore first animation
             if animation_options.restore_first_anim:
-                anim_name = gltf.data.animations[0].track_name
+                anim_name = gltf.data.animations[anim_indices[0]].track_name
                 BlenderAnimation.restore_animation(gltf, anim_name)
 
                 if hasattr(bpy.data.scenes[0], "gltf2_animation_applied"):
                     bpy.data.scenes[0].gltf2_animation_applied = bpy.data.scenes[0].gltf2_animation_tracks.find(
-                        gltf.data.animations[0].track_name)
+                        gltf.data.animations[anim_indices[0]].track_name)
 
     @staticmethod
     def select_imported_objects(gltf):
@@ -119,15 +134,17 @@ class BlenderScene():
         """
         vnode = None
 
+        # With import filters, some scene roots may not be imported
+        def first_root(pyscene):
+            return next((gltf.vnodes[node] for node in pyscene.nodes or [] if node in gltf.vnodes), None)
+
         if gltf.data.scene is not None:
-            pyscene = gltf.data.scenes[gltf.data.scene]
-            if pyscene.nodes:
-                vnode = gltf.vnodes[pyscene.nodes[0]]
+            vnode = first_root(gltf.data.scenes[gltf.data.scene])
 
         if not vnode:
             for pyscene in gltf.data.scenes or []:
-                if pyscene.nodes:
-                    vnode = gltf.vnodes[pyscene.nodes[0]]
+                vnode = first_root(pyscene)
+                if vnode:
                     break
 
         if not vnode:
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import bpy
+import numpy as np
 from itertools import chain
 from mathutils import Vector, Quaternion, Matrix
 from ...io.imp.gltf2_io_binary import BinaryData
@@ -116,13 +117,20 @@ def init_vnodes(gltf):
     # Nodes coming from glTF use the index into gltf.data.nodes for an ID.
     gltf.vnodes = {}
 
-    for i, pynode in enumerate(gltf.data.nodes or []):
+    # With import filters, only the selected nodes are created. Nodes kept for
+    # their transform only (ancestors, joints) don't bring their content.
+    selection = gltf.selection
+    for i, pynode in gltf.selected('nodes'):
         vnode = VNode()
         gltf.vnodes[i] = vnode
         vnode.name = pynode.name
         vnode.default_name = 'Node_%d' % i
         vnode.children = list(pynode.children or [])
+        if selection is not None:
+            vnode.children = [child for child in vnode.children if child in selection.nodes]
         vnode.base_trs = get_node_trs(gltf, pynode)
+        if selection is not None and i not in selection.content_nodes:
+            continue
         if pynode.mesh is not None:
             # Check if there is gpu_instancing extension
             if pynode.extensions and "EXT_mesh_gpu_instancing" in pynode.extensions.keys():
@@ -150,7 +158,8 @@ def init_vnodes(gltf):
 
     for idx_scene, scene in enumerate(gltf.data.scenes or []):
         for node in scene.nodes or []:
-            add_nodes_to_scene(idx_scene, node)
+            if node in gltf.vnodes:
+                add_nodes_to_scene(idx_scene, node)
 
     # Create a map of all scene / blender collections
     gltf.blender_collections = {}
@@ -159,6 +168,8 @@ def init_vnodes(gltf):
 
     # Create needed scenes
     for idx_scene, scene in enumerate(gltf.data.scenes or []):
+        if selection is not None and idx_scene not in selection.scenes:
+            continue
         # Create a new scene for all not default scenes
         if idx_scene != (gltf.data.scene or 0):
             new_scene = bpy.data.scenes.new(name=scene.name or "Scene %d" % idx_scene)
@@ -173,6 +184,8 @@ def init_vnodes(gltf):
         gltf.blender_collections[gltf.data.scene or 0] = bpy.context.collection
     elif len(gltf.data.scenes or []) > 1:
         for idx_scene, scene in enumerate(gltf.data.scenes or []):
+            if selection is not None and idx_scene not in selection.scenes:
+                continue
             if gltf.import_settings['import_scene_as_collection'] is True:
                 # Create a new collection for the scene
                 collection = bpy.data.collections.new(gltf.data.scenes[idx_scene].name or "Scene %d" % idx_scene)
@@ -210,6 +223,10 @@ def init_vnodes(gltf):
 def manage_gpu_instancing(gltf, vnode, i, ext, mesh_id):
     attrs = ext.get('attributes', {})
 
+    if gltf.import_settings.get('import_gpu_instancing', 'OBJECTS') == 'INSTANCER':
+        manage_gpu_instancing_instancer(gltf, vnode, i, attrs, mesh_id)
+        return
+
     trans_list = BinaryData.get_data_from_accessor(gltf, attrs.get('TRANSLATION', None)) \
         if attrs.get('TRANSLATION', None) is not None else None
 
@@ -251,11 +268,73 @@ def manage_gpu_instancing(gltf, vnode, i, ext, mesh_id):
         inst_vnode.children = []
         inst_vnode.base_trs = get_inst_trs(gltf, trans_list[inst], rot_list[inst], scale_list[inst])
         inst_vnode.mesh_idx = mesh_id
+        inst_vnode.instances = None
         # Do not set scenes here, this will be handle later by recursive add_nodes_to_scene
 
         vnode.children.append(inst_id)
 
 
+def manage_gpu_instancing_instancer(gltf, vnode, i, attrs, mesh_id):
+    """Create a single vnode holding the TRS of all instances.
+    It will be created as points, instanced by a geometry nodes modifier.
+    """
+    instances = get_instances_trs(gltf, attrs)
+    if instances is None:
+        return
+
+    inst_id = '%d.instances' % i
+    inst_vnode = VNode()
+    inst_vnode.type = VNode.Inst
+    gltf.vnodes[inst_id] = inst_vnode
+    inst_vnode.name = None
+    inst_vnode.default_name = (vnode.name or vnode.default_name) + '_Instances'
+    inst_vnode.children = []
+    inst_vnode.mesh_idx = mesh_id
+    inst_vnode.instances = instances
+    # Do not set scenes here, this will be handle later by recursive add_nodes_to_scene
+
+    vnode.children.append(inst_id)
+
+
+def get_instances_trs(gltf, attrs):
+    """Get the TRS of all instances, as numpy arrays in Blender space.
+    Rotations are (w, x, y, z) quaternions. Returns None if there is no instance.
+    """
+    arrays = {}
+    for attr in ['TRANSLATION', 'ROTATION', 'SCALE']:
+        if attrs.get(attr, None) is not None:
+            arrays[attr] = np.array(BinaryData.decode_accessor(gltf, attrs[attr]), dtype=np.float32)
+
+    # We can't have only custom properties
+    if not arrays:
+        return None
+    length = len(next(iter(arrays.values())))
+    if length == 0:
+        return None
+    assert all(len(array) == length for array in arrays.values())
+
+    if 'TRANSLATION' in arrays:
+        locs = arrays['TRANSLATION']
+        gltf.locs_batch_gltf_to_blender(locs)
+    else:
+        locs = np.zeros((length, 3), dtype=np.float32)
+
+    if 'ROTATION' in arrays:
+        rots = arrays['ROTATION']
+        gltf.quaternions_batch_gltf_to_blender(rots)
+    else:
+        rots = np.zeros((length, 4), dtype=np.float32)
+        rots[:, 0] = 1.0
+
+    if 'SCALE' in arrays:
+        scales = arrays['SCALE']
+        gltf.scales_batch_gltf_to_blender(scales)
+    else:
+        scales = np.ones((length, 3), dtype=np.float32)
+
+    return locs, rots, scales
+
+
 def get_inst_trs(gltf, trans, rot, scale):
     t = gltf.loc_gltf_to_blender(trans or [0, 0, 0])
     r = gltf.quaternion_gltf_to_blender(rot or [0, 0, 0, 1])
@@ -280,7 +359,7 @@ def mark_bones_and_armas(gltf):
     descendant of an armature. Mark everything between an armature and a
     joint as a bone.
     """
-    for skin in gltf.data.skins or []:
+    for _, skin in gltf.selected('skins'):
         descendants = list(skin.joints)
         if skin.skeleton is not None:
             descendants.append(skin.skeleton)
@@ -505,7 +584,7 @@ def pick_bind_pose(gltf):
         # Record inverse bind matrices. We're going to milk them for information
         # about the original bind pose.
         inv_binds = {'root': Matrix.Identity(4)}
-        for skin in gltf.data.skins or []:
+        for _, skin in gltf.selected('skins'):
             if skin.inverse_bind_matrices is None:
                 continue
 
@@ -17,9 +17,12 @@
 #
 
 import time
+import functools
+import json
 import logging
 import logging.handlers
 import sys
+from contextlib import contextmanager
 
 #
 # Globals
@@ -73,6 +76,142 @@ def profile_end(label=None):
     print('PROFILE', output)
 
 
+def get_peak_memory():
+    """Return the peak resident memory of the process, in bytes, or None if it can't be retrieved."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except ImportError:
+        pass
+
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ('cb', wintypes.DWORD),
+                ('PageFaultCount', wintypes.DWORD),
+                ('PeakWorkingSetSize', ctypes.c_size_t),
+                ('WorkingSetSize', ctypes.c_size_t),
+                ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                ('PagefileUsage', ctypes.c_size_t),
+                ('PeakPagefileUsage', ctypes.c_size_t),
+            ]
+
+        try:
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return counters.PeakWorkingSetSize
+        except Exception:
+            pass
+
+    return None
+
+
+class Profiler:
+    """Named, nestable timing spans and counters, that can be written as a JSON report.
+
+    Spans with the same name under the same parent are aggregated.
+    Spans must be opened on the main thread only. When disabled, spans and counters do nothing.
+    """
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.root = Profiler.__new_span('root')
+        self.__stack = [self.root]
+        self.counters = {}
+
+    @staticmethod
+    def __new_span(name):
+        return {'name': name, 'time': 0.0, 'calls': 0, 'children': {}}
+
+    @contextmanager
+    def span(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        parent = self.__stack[-1]
+        span = parent['children'].get(name)
+        if span is None:
+            span = parent['children'][name] = Profiler.__new_span(name)
+
+        self.__stack.append(span)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            span['time'] += time.perf_counter() - start
+            span['calls'] += 1
+            self.__stack.pop()
+
+    def count(self, name, value=1):
+        if not self.enabled:
+            return
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def report(self):
+        def convert(span):
+            return {
+                'name': span['name'],
+                'time': round(span['time'], 6),
+                'calls': span['calls'],
+                'children': [convert(child) for child in span['children'].values()],
+            }
+
+        return {
+            'spans': [convert(span) for span in self.root['children'].values()],
+            'counters': dict(self.counters),
+            'peak_memory': get_peak_memory(),
+        }
+
+    def write_report(self, path, **info):
+        """Write the report as JSON, with additional information at its top level."""
+        report = dict(info)
+        report.update(self.report())
+        with open(path, 'w', encoding='utf8', newline='\n') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+
+
+def get_profiler(export_settings):
+    """Profiler of the export. A disabled one is set when exporting without the operator (from scripts)."""
+    if export_settings.get('profiler') is None:
+        export_settings['profiler'] = Profiler(False)
+    return export_settings['profiler']
+
+
+def profiled(name):
+    """
+    Decorates functions to profile as a span of the export profiler. Use it like:
+        @profiled('span name')
+        def func(..., export_settings):
+            ...
+    As for cached functions, func must always take an "export_settings" arg.
+    """
+    def inner(func):
+        @functools.wraps(func)
+        def wrapper_profiled(*args, **kwargs):
+            export_settings = kwargs["export_settings"] if kwargs.get("export_settings") else args[-1]
+            profiler = export_settings.get('profiler')
+            if profiler is None or not profiler.enabled:
+                return func(*args, **kwargs)
+            with profiler.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper_profiled
+
+    return inner
+
+
 class Log:
     def __init__(self, loglevel):
         self.logger = logging.getLogger('glTFImporter')
@@ -25,8 +25,11 @@
 # NOTE: this file is modified for mix/max accessor value check. See
 # https://github.com/KhronosGroup/glTF-Blender-IO/pull/2338/commits/5178b5f61ab942704b85ff51262a3d595e70d2b5
 
+import inspect
 import sys
+import threading
 import traceback
+from collections.abc import Sequence
 
 
 def from_int(x):
@@ -1217,8 +1220,278 @@ class Gltf:
         return result
 
 
-def gltf_from_dict(s):
-    return Gltf.from_dict(s)
+# Fast decoding
+#
+# from_dict methods above try each converter of a union, and check types with assertions.
+# So an exception is raised and caught for almost each missing optional field.
+# Decoders below are generated from a table of the fields of each class, and check types directly.
+# When a file fails to decode, it is decoded again with from_dict, to report where the error is.
+
+# Fields of each class, in the order of the class constructor.
+# Types are int, float, str, bool, ext (extensions), any (extras, not checked), or a class name.
+# [type] is a list, {type} a dict with str keys. A trailing ? marks an optional field.
+DECODER_SCHEMA = {
+    'AccessorSparseIndices': 'buffer_view:int byte_offset:int? component_type:int extensions:ext? extras:any',
+    'AccessorSparseValues': 'buffer_view:int byte_offset:int? extensions:ext? extras:any',
+    'AccessorSparse': 'count:int extensions:ext? extras:any indices:AccessorSparseIndices values:AccessorSparseValues',
+    'Accessor': 'buffer_view:int? byte_offset:int? component_type:int count:int extensions:ext? extras:any '
+                'max:[float]? min:[float]? name:str? normalized:bool? sparse:AccessorSparse? type:str',
+    'AnimationChannelTarget': 'extensions:ext? extras:any node:int? path:str',
+    'AnimationChannel': 'extensions:ext? extras:any sampler:int target:AnimationChannelTarget',
+    'AnimationSampler': 'extensions:ext? extras:any input:int interpolation:str? output:int',
+    'Animation': 'channels:[AnimationChannel] extensions:ext? extras:any name:str? samplers:[AnimationSampler]',
+    'Asset': 'copyright:str? extensions:ext? extras:any generator:str? min_version:str? version:str',
+    'BufferView': 'buffer:int byte_length:int byte_offset:int? byte_stride:int? extensions:ext? extras:any '
+                  'name:str? target:int?',
+    'Buffer': 'byte_length:int extensions:ext? extras:any name:str? uri:str?',
+    'CameraOrthographic': 'extensions:ext? extras:any xmag:float ymag:float zfar:float znear:float',
+    'CameraPerspective': 'aspect_ratio:float? extensions:ext? extras:any yfov:float zfar:float? znear:float',
+    'Camera': 'extensions:ext? extras:any name:str? orthographic:CameraOrthographic? '
+              'perspective:CameraPerspective? type:str',
+    'Image': 'buffer_view:int? extensions:ext? extras:any mime_type:str? name:str? uri:str?',
+    'TextureInfo': 'extensions:ext? extras:any index:int tex_coord:int?',
+    'MaterialNormalTextureInfoClass': 'extensions:ext? extras:any index:int scale:float? tex_coord:int?',
+    'MaterialOcclusionTextureInfoClass': 'extensions:ext? extras:any index:int strength:float? tex_coord:int?',
+    'MaterialPBRMetallicRoughness': 'base_color_factor:[float]? base_color_texture:TextureInfo? extensions:ext? '
+                                    'extras:any metallic_factor:float? metallic_roughness_texture:TextureInfo? '
+                                    'roughness_factor:float?',
+    'Material': 'alpha_cutoff:float? alpha_mode:str? double_sided:bool? emissive_factor:[float]? '
+                'emissive_texture:TextureInfo? extensions:ext? extras:any name:str? '
+                'normal_texture:MaterialNormalTextureInfoClass? occlusion_texture:MaterialOcclusionTextureInfoClass? '
+                'pbr_metallic_roughness:MaterialPBRMetallicRoughness?',
+    'MeshPrimitive': 'attributes:{int} extensions:ext? extras:any indices:int? material:int? mode:int? '
+                     'targets:[{int}]?',
+    'Mesh': 'extensions:ext? extras:any name:str? primitives:[MeshPrimitive] weights:[float]?',
+    'Node': 'camera:int? children:[int]? extensions:ext? extras:any matrix:[float]? mesh:int? name:str? '
+            'rotation:[float]? scale:[float]? skin:int? translation:[float]? weights:[float]?',
+    'Sampler': 'extensions:ext? extras:any mag_filter:int? min_filter:int? name:str? wrap_s:int? wrap_t:int?',
+    'Scene': 'extensions:ext? extras:any name:str? nodes:[int]?',
+    'Skin': 'extensions:ext? extras:any inverse_bind_matrices:int? joints:[int] name:str? skeleton:int?',
+    'Texture': 'extensions:ext? extras:any name:str? sampler:int? source:int?',
+    'Gltf': 'accessors:[Accessor]? animations:[Animation]? asset:Asset buffers:[Buffer]? '
+            'buffer_views:[BufferView]? cameras:[Camera]? extensions:ext? extensions_required:[str]? '
+            'extensions_used:[str]? extras:any images:[Image]? materials:[Material]? meshes:[Mesh]? '
+            'nodes:[Node]? samplers:[Sampler]? scene:int? scenes:[Scene]? skins:[Skin]? textures:[Texture]?',
+}
+
+
+class DecodeError(Exception):
+    """Raised by fast decoders when the data doesn't match the schema."""
+    pass
+
+
+def decode_int(x):
+    if type(x) is not int:
+        raise DecodeError
+    return x
+
+
+def decode_float(x):
+    if type(x) is float:
+        return x
+    if type(x) is not int:
+        raise DecodeError
+    return float(x)
+
+
+def decode_str(x):
+    if type(x) is not str:
+        raise DecodeError
+    return x
+
+
+def decode_bool(x):
+    if type(x) is not bool:
+        raise DecodeError
+    return x
+
+
+def decode_extensions(x):
+    if type(x) is not dict:
+        raise DecodeError
+    result = {}
+    for k, v in x.items():
+        if type(v) is not dict:
+            raise DecodeError
+        result[k] = dict(v)
+    return result
+
+
+def decode_any(x):
+    return x
+
+
+def make_list_decoder(decoder):
+    def decode_list(x):
+        if type(x) is not list:
+            raise DecodeError
+        return [decoder(y) for y in x]
+    return decode_list
+
+
+def make_dict_decoder(decoder):
+    def decode_dict(x):
+        if type(x) is not dict:
+            raise DecodeError
+        return {k: decoder(v) for (k, v) in x.items()}
+    return decode_dict
+
+
+def make_class_decoder(cls, fields):
+    # Most objects only have a few of their fields, so only loop over the ones present
+    nb_fields = len(fields)
+    field_decoders = {key: (idx, decoder) for idx, (key, decoder, _) in enumerate(fields)}
+    required = [idx for idx, (_, _, optional) in enumerate(fields) if not optional]
+
+    def decode_class(obj):
+        if type(obj) is not dict:
+            raise DecodeError
+        args = [None] * nb_fields
+        for key, x in obj.items():
+            field = field_decoders.get(key)
+            if field is not None and x is not None:
+                args[field[0]] = field[1](x)
+        for idx in required:
+            if args[idx] is None:
+                raise DecodeError
+        return cls(*args)
+    return decode_class
+
+
+def generate_decoders(schema=DECODER_SCHEMA):
+    """Generate a decoder for each class of the schema."""
+    decoders = {}
+    base_decoders = {
+        'int': decode_int,
+        'float': decode_float,
+        'str': decode_str,
+        'bool': decode_bool,
+        'ext': decode_extensions,
+        'any': decode_any,
+    }
+
+    def get_decoder(type_):
+        if type_.startswith('['):
+            return make_list_decoder(get_decoder(type_[1:-1]))
+        if type_.startswith('{'):
+            return make_dict_decoder(get_decoder(type_[1:-1]))
+        if type_ in base_decoders.keys():
+            return base_decoders[type_]
+        # Classes are described after the classes they use
+        return decoders[type_]
+
+    for class_name, description in schema.items():
+        cls = globals()[class_name]
+        fields = []
+        for field in description.split():
+            name, type_ = field.split(':')
+            optional = type_.endswith('?') or type_ == 'any'
+            type_ = type_.rstrip('?')
+            parts = name.split('_')
+            key = parts[0] + ''.join(p.capitalize() for p in parts[1:])
+            fields.append((name, key, get_decoder(type_), optional))
+
+        # Fields must be given in the order of the constructor
+        params = list(inspect.signature(cls.__init__).parameters.keys())[1:]
+        assert params == [f[0] for f in fields], "Decoder schema doesn't match " + class_name
+
+        decoders[class_name] = make_class_decoder(cls, [(key, decoder, optional) for _, key, decoder, optional in fields])
+
+    return decoders
+
+
+DECODERS = generate_decoders()
+
+
+def decode(class_name, obj):
+    try:
+        return DECODERS[class_name](obj)
+    except DecodeError:
+        # Decode again with the slower from_dict, that reports where the error is
+        return globals()[class_name].from_dict(obj)
+
+
+# Lazy decoding
+#
+# For tools that only need a few objects of a document, root arrays listed here can be
+# decoded element by element, on first access.
+
+LAZY_ARRAYS = {
+    'accessors': 'Accessor',
+    'nodes': 'Node',
+    'meshes': 'Mesh',
+    'materials': 'Material',
+    'animations': 'Animation',
+}
+
+NOT_DECODED = object()
+
+
+class LazyList(Sequence):
+    """List of glTF objects, each one decoded from its json on first access, and memoized.
+
+    As elements are decoded after the document is read, decoding errors are raised as the error
+    exception class, when given.
+    """
+
+    def __init__(self, items, class_name, error=None):
+        self.__items = items
+        self.__class_name = class_name
+        self.__error = error
+        self.__decoded = [NOT_DECODED] * len(items)
+        self.__lock = threading.Lock()  # Decoding can happen on import worker threads
+
+    def __len__(self):
+        return len(self.__decoded)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        value = self.__decoded[idx]
+        if value is NOT_DECODED:
+            with self.__lock:
+                value = self.__decoded[idx]
+                if value is NOT_DECODED:
+                    try:
+                        value = decode(self.__class_name, self.__items[idx])
+                    except (AssertionError, TypeError) as e:
+                        if self.__error is None:
+                            raise
+                        traceback.print_exc()
+                        raise self.__error("Couldn't parse glTF {} {}. Check that the file is valid".format(
+                            self.__class_name, idx)) from e
+                    self.__decoded[idx] = value
+        return value
+
+    def raw(self, idx):
+        """Json of an element, as read from the document, without decoding it."""
+        return self.__items[idx]
+
+    def __setitem__(self, idx, value):
+        self.__decoded[idx] = value
+
+    def append(self, value):
+        self.__items.append(None)
+        self.__decoded.append(value)
+
+    @property
+    def decoded_count(self):
+        return sum(1 for value in self.__decoded if value is not NOT_DECODED)
+
+    def to_list(self):
+        return [self[i] for i in range(len(self))]
+
+
+def gltf_from_dict(s, lazy=False, error=None):
+    if lazy and isinstance(s, dict) and all(isinstance(s.get(key, []), list) for key in LAZY_ARRAYS.keys()):
+        # Decode the root without the lazy arrays, then set them
+        gltf = decode('Gltf', {k: v for (k, v) in s.items() if k not in LAZY_ARRAYS.keys()})
+        for key, class_name in LAZY_ARRAYS.items():
+            if s.get(key) is not None:
+                setattr(gltf, key, LazyList(s[key], class_name, error))
+        return gltf
+
+    return decode('Gltf', s)
 
 
 def gltf_to_dict(x):
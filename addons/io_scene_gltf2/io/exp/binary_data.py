@@ -12,24 +12,57 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import abc
 import typing
 import array
 from ...io.com import constants as gltf2_io_constants
 
 
+class DeferredBytes(abc.ABC):
+    """Placeholder for bytes computed by a later export stage, like image encoding.
+
+    The bytes are only requested when laying out buffers or writing files.
+    """
+
+    @abc.abstractmethod
+    def resolve(self) -> bytes:
+        pass
+
+
 class BinaryData:
     """Store for gltf binary data that can later be stored in a buffer."""
 
-    def __init__(self, data: bytes, bufferViewTarget=None):
-        if not isinstance(data, bytes):
+    def __init__(self, data: bytes, bufferViewTarget=None, byteStride=None):
+        if not isinstance(data, (bytes, DeferredBytes)):
             raise TypeError("Data is not a bytes array")
-        self.data = data
+        self._data = data
+        # Deferred data is compared by placeholder, so caching does not wait for it
+        self._deferred = data if isinstance(data, DeferredBytes) else None
         self.bufferViewTarget = bufferViewTarget
+        self.byteStride = byteStride
+
+    @property
+    def data(self):
+        if isinstance(self._data, DeferredBytes):
+            self._data = self._data.resolve()
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._deferred = None
 
     def __eq__(self, other):
-        return self.data == other.data
+        # Deferred data is compared by placeholder only, consistently with the hash
+        if self._deferred is not None or other._deferred is not None:
+            if self._deferred is not other._deferred:
+                return False
+            return self.byteStride == other.byteStride
+        return self.data == other.data and self.byteStride == other.byteStride
 
     def __hash__(self):
+        if self._deferred is not None:
+            return hash(self._deferred)
         return hash(self.data)
 
     def set_extension(self, extension_name, extension_data):
@@ -24,11 +24,26 @@ class Buffer:
     def __init__(self, is_glb, meshopt_extension, buffer_index=0, initial_data=None):
         self.is_glb = is_glb
         self.meshopt_extension = meshopt_extension
-        self.__data = bytearray(b"")
+        # Blobs are only referenced here, with their aligned offsets.
+        # The buffer is laid out once, when writing it
+        self.__blobs = []
+        self.__byte_length = 0
         if initial_data is not None:
-            self.__data = bytearray(initial_data.tobytes())
+            self.__add_blob(initial_data.tobytes())
         self.__buffer_index = buffer_index
         self.__fake_bytelength = 0
+        # Meshopt data not encoded yet, with the extension to fill once encoded
+        self.__deferred = []
+
+    def __add_blob(self, data):
+        """Reserve an aligned range for data, and return its offset."""
+        offset = self.__byte_length
+        length = len(data)
+        if length > 0:
+            self.__blobs.append((offset, data))
+        # offsets should be a multiple of 4 --> therefore add padding if necessary
+        self.__byte_length += length + (4 - (length % 4)) % 4
+        return offset
 
     def add_fake_bytelength(self, byte_length):
         """used for meshopt compression fallback"""
@@ -52,14 +67,13 @@ class Buffer:
         # else => no compressed data, so populate main bufferview with additional (compressed) buffer, no extension
 
         if not additional_buffer:
-            offset = len(self.__data)
-            self.__data.extend(binary_data.data)
+            offset = self.__add_blob(binary_data.data)
 
         else:
-            offset = len(additional_buffer.__data)
+            offset = additional_buffer.__byte_length
             fake_byte_length = self.__fake_bytelength  # Calculate the offset for the fallback data
             if not hasattr(binary_data, 'extensions'):
-                additional_buffer.__data.extend(binary_data.data)
+                additional_buffer.__add_blob(binary_data.data)
             else:
                 self.add_fake_bytelength(binary_data.byte_length)
                 # We also need to have a padding in the main buffer for the fallback data,
@@ -70,14 +84,6 @@ class Buffer:
 
         length = binary_data.byte_length
 
-        # offsets should be a multiple of 4 --> therefore add padding if necessary
-        padding = (4 - (length % 4)) % 4
-        if not additional_buffer:
-            self.__data.extend(b"\x00" * padding)
-        else:
-            if not hasattr(binary_data, 'extensions'):
-                additional_buffer.__data.extend(b"\x00" * padding)
-
         if not additional_buffer:
             buffer_index = self.__buffer_index
         else:
@@ -97,7 +103,7 @@ class Buffer:
             buffer=buffer_index,
             byte_length=length,
             byte_offset=fake_byte_length if hasattr(binary_data, 'extensions') else offset,
-            byte_stride=None,
+            byte_stride=binary_data.byteStride,
             extensions=None,
             extras=None,
             name=None,
@@ -107,10 +113,13 @@ class Buffer:
         if additional_buffer is not None and hasattr(binary_data, 'extensions'):
             # KHR/EXT_meshopt_compression
             compressed_binary_data = binary_data.extensions[self.meshopt_extension]['buffer']
-            additional_buffer.__data.extend(compressed_binary_data)
-            length = len(compressed_binary_data)
-            padding = (4 - (length % 4)) % 4
-            additional_buffer.__data.extend(b"\x00" * padding)
+            if isinstance(compressed_binary_data, bytes):
+                additional_buffer.__add_blob(compressed_binary_data)
+            else:
+                # Encoding is deferred, the compressed data will be added by resolve_deferred
+                additional_buffer.__deferred.append(
+                    (compressed_binary_data, binary_data.extensions[self.meshopt_extension]))
+                offset = None
 
             buffer_view.extensions = binary_data.extensions
 
@@ -125,15 +134,46 @@ class Buffer:
 
         return buffer_view
 
+    def deferred_data(self):
+        """Meshopt placeholders added to this buffer, that still need to be encoded."""
+        return [deferred for deferred, _ in self.__deferred]
+
+    def resolve_deferred(self):
+        """Add encoded meshopt data to the buffer, and fill offset and length of their extensions."""
+        for deferred, extension in self.__deferred:
+            if deferred.encoded is None:
+                raise RuntimeError("Meshopt data added to the buffer, but not encoded")
+            extension['byteOffset'] = self.__add_blob(deferred.encoded)
+            extension['byteLength'] = len(deferred.encoded)
+        self.__deferred = []
+
     @property
     def byte_length(self):
-        return len(self.__data)
+        return self.__byte_length
 
     def to_bytes(self):
-        return self.__data
+        """Lay out the buffer in a single allocation, copying each blob at its offset."""
+        data = bytearray(self.__byte_length)
+        view = memoryview(data)
+        for offset, blob in self.__blobs:
+            view[offset:offset + len(blob)] = blob
+        return data
+
+    def write_to(self, file):
+        """Write the buffer to a file, blob by blob, without laying it out in memory."""
+        position = 0
+        for offset, blob in self.__blobs:
+            if offset > position:
+                file.write(b"\x00" * (offset - position))
+            file.write(blob)
+            position = offset + len(blob)
+        if self.__byte_length > position:
+            file.write(b"\x00" * (self.__byte_length - position))
 
     def clear(self):
-        self.__data = b""
+        self.__blobs = []
+        self.__byte_length = 0
+        self.__deferred = []
 
     def to_embed_string(self):
-        return 'data:application/octet-stream;base64,' + base64.b64encode(self.__data).decode('ascii')
+        return 'data:application/octet-stream;base64,' + base64.b64encode(self.to_bytes()).decode('ascii')
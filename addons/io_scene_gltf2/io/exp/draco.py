@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from ctypes import *
 
 from ...io.exp.binary_data import BinaryData
 from ...io.com.library import dll_path
+from ...io.com.debug import get_profiler
 
 
 def encode_scene_primitives(scenes, export_settings):
@@ -61,12 +65,48 @@ def encode_scene_primitives(scenes, export_settings):
     dll.encoderCopy.argtypes = [c_void_p, c_void_p]
 
     # Don't encode the same primitive multiple times.
-    encoded_primitives_cache = {}
+    # Primitives are collected first, then encoded concurrently, as the encoder calls release the GIL.
+    primitives_to_encode = {}  # Used as an ordered set: primitive -> mesh name
 
-    # Compress meshes into Draco buffers.
     for scene in scenes:
         for node in scene.nodes:
-            __traverse_node(node, lambda node: __encode_node(node, dll, export_settings, encoded_primitives_cache))
+            __traverse_node(node, lambda node: __collect_node(node, export_settings, primitives_to_encode))
+
+    num_threads = export_settings.get('gltf_compression_threads', 0)
+    if num_threads == 0:
+        num_threads = os.cpu_count() or 1
+
+    # Compress meshes into Draco buffers.
+    start_time = time.time()
+    primitives = list(primitives_to_encode.keys())
+    if num_threads > 1 and len(primitives) > 1:
+        with ThreadPoolExecutor(max_workers=num_threads, thread_name_prefix='glTFDracoEncode') as executor:
+            results = list(executor.map(lambda primitive: __encode_primitive(primitive, dll, export_settings), primitives))
+    else:
+        results = [__encode_primitive(primitive, dll, export_settings) for primitive in primitives]
+
+    # Primitives are updated on the main thread, once everything is encoded.
+    # Encoding reads the accessors, that can be shared between primitives.
+    total_raw_length = 0
+    total_encoded_length = 0
+    for primitive, result in zip(primitives, results):
+        if result is None:
+            continue
+        __apply_encoded_primitive(primitive, result)
+
+        raw_length, encoded_length, elapsed = result['raw_length'], result['encoded_length'], result['time']
+        total_raw_length += raw_length
+        total_encoded_length += encoded_length
+        export_settings['log'].info('Draco encoder: Encoded primitive of mesh {} in {:.3f} s, {} -> {} bytes ({:.2f}x).'.format(
+            primitives_to_encode[primitive], elapsed, raw_length, encoded_length, raw_length / max(encoded_length, 1)))
+
+    export_settings['log'].info('Draco encoder: Encoded {} primitives in {:.3f} s, {} -> {} bytes ({:.2f}x).'.format(
+        len(primitives), time.time() - start_time, total_raw_length, total_encoded_length,
+        total_raw_length / max(total_encoded_length, 1)))
+    profiler = get_profiler(export_settings)
+    profiler.count('draco primitives', len(primitives))
+    profiler.count('draco raw bytes', total_raw_length)
+    profiler.count('draco encoded bytes', total_encoded_length)
 
     # Release uncompressed index and attribute buffers.
     # Since those buffers may be shared across nodes, this step must happen after all meshes have been compressed.
@@ -96,38 +136,37 @@ def __traverse_node(node, f):
             __traverse_node(child, f)
 
 
-def __encode_node(node, dll, export_settings, encoded_primitives_cache):
+def __collect_node(node, export_settings, primitives_to_encode):
     if node.mesh is not None:
         export_settings['log'].info('Draco encoder: Encoding mesh {}.'.format(node.name))
         for primitive in node.mesh.primitives:
-            __encode_primitive(primitive, dll, export_settings, encoded_primitives_cache)
+            # Check if this primitive has already been collected.
+            # This usually happens when nodes are duplicated in Blender, thus their indices/attributes are shared data.
+            if primitive not in primitives_to_encode:
+                primitives_to_encode[primitive] = node.mesh.name or node.name
 
 
-def __encode_primitive(primitive, dll, export_settings, encoded_primitives_cache):
+def __encode_primitive(primitive, dll, export_settings):
+    """Encode a primitive, without modifying it. Can be called from worker threads."""
     attributes = primitive.attributes
     indices = primitive.indices
 
-    # Check if this primitive has already been encoded.
-    # This usually happens when nodes are duplicated in Blender, thus their indices/attributes are shared data.
-    if primitive in encoded_primitives_cache:
-        if primitive.extensions is None:
-            primitive.extensions = {}
-        primitive.extensions['KHR_draco_mesh_compression'] = encoded_primitives_cache[primitive]
-        return
-
     # Only do TRIANGLES primitives
     if primitive.mode not in [None, 4]:
-        return
+        return None
 
     if 'POSITION' not in attributes:
         export_settings['log'].warning('Draco encoder: Primitive without positions encountered. Skipping.')
-        return
+        return None
 
     positions = attributes['POSITION']
 
     # Skip nodes without a position buffer, e.g. a primitive from a Blender shared instance.
     if attributes['POSITION'].buffer_view is None:
-        return
+        return None
+
+    start_time = time.time()
+    raw_length = len(indices.buffer_view.data)
 
     encoder = dll.encoderCreate(positions.count)
 
@@ -142,6 +181,7 @@ def __encode_primitive(primitive, dll, export_settings, encoded_primitives_cache
             attr.buffer_view.data,
             attr.normalized)
         draco_ids[attr_name] = draco_id
+        raw_length += len(attr.buffer_view.data)
 
     dll.encoderSetIndices(encoder, indices.component_type, indices.count, indices.buffer_view.data)
 
@@ -161,23 +201,35 @@ def __encode_primitive(primitive, dll, export_settings, encoded_primitives_cache
     encoded_data = bytes(byte_length)
     dll.encoderCopy(encoder, encoded_data)
 
+    result = {
+        'data': encoded_data,
+        'attributes': draco_ids,
+        'index_count': dll.encoderGetEncodedIndexCount(encoder),
+        'vertex_count': dll.encoderGetEncodedVertexCount(encoder),
+        'raw_length': raw_length,
+        'encoded_length': byte_length,
+        'time': time.time() - start_time,
+    }
+
+    dll.encoderRelease(encoder)
+
+    return result
+
+
+def __apply_encoded_primitive(primitive, result):
     if primitive.extensions is None:
         primitive.extensions = {}
 
     extension_info = {
-        'bufferView': BinaryData(encoded_data),
-        'attributes': draco_ids
+        'bufferView': BinaryData(result['data']),
+        'attributes': result['attributes']
     }
     primitive.extensions['KHR_draco_mesh_compression'] = extension_info
-    encoded_primitives_cache[primitive] = extension_info
 
     # Set to triangle list mode.
     primitive.mode = 4
 
     # Update accessors to match encoded data.
-    indices.count = dll.encoderGetEncodedIndexCount(encoder)
-    encoded_vertices = dll.encoderGetEncodedVertexCount(encoder)
-    for attr_name in attributes:
-        attributes[attr_name].count = encoded_vertices
-
-    dll.encoderRelease(encoder)
+    primitive.indices.count = result['index_count']
+    for attr_name in primitive.attributes:
+        primitive.attributes[attr_name].count = result['vertex_count']
@@ -16,9 +16,10 @@
 # Imports
 #
 
-import json
 import struct
+from ...io.exp.buffer import Buffer
 from ...io.exp.user_extensions import export_user_extensions
+from ...io.com.debug import get_profiler
 
 #
 # Globals
@@ -27,7 +28,6 @@ from ...io.exp.user_extensions import export_user_extensions
 #
 # Functions
 #
-from collections import OrderedDict
 
 
 def save_gltf(gltf, export_settings, encoder, glb_buffer):
@@ -69,21 +69,19 @@ def save_gltf(gltf, export_settings, encoder, glb_buffer):
 
     export_user_extensions('gather_gltf_encoded_hook', export_settings, gltf_format, sort_order)
 
-    gltf_ordered = OrderedDict(sorted(gltf.items(), key=lambda item: sort_order.index(item[0])))
-    gltf_encoded = json.dumps(
-        gltf_ordered,
+    profiler = get_profiler(export_settings)
+    gltf_ordered = {key: gltf[key] for key in sorted(gltf.keys(), key=lambda key: sort_order.index(key))}
+    gltf_encoder = encoder(
         indent=gltf_format.indent,
         separators=gltf_format.separators,
-        cls=encoder,
         allow_nan=False)
 
-    #
-
     if export_settings['gltf_format'] != 'GLB':
-        file = open(export_settings['gltf_filepath'], "w", encoding="utf8", newline="\n")
-        file.write(gltf_encoded)
-        file.write("\n")
-        file.close()
+        with profiler.span('json encoding'):
+            with open(export_settings['gltf_filepath'], "w", encoding="utf8", newline="\n") as file:
+                length_gltf = __write_json(file.write, gltf_ordered, gltf_encoder)
+                file.write("\n")
+        profiler.count('json characters', length_gltf)
 
         binary = export_settings['gltf_binary']
         if len(binary) > 0 and not export_settings['gltf_embed_buffers']:
@@ -94,14 +92,21 @@ def save_gltf(gltf, export_settings, encoder, glb_buffer):
     else:
         file = open(export_settings['gltf_filepath'], "wb")
 
-        gltf_data = gltf_encoded.encode()
+        # JSON chunk is written directly to the file.
+        # Its length is only known once written, so header and chunk header are written again after it
+        file.write(struct.pack("<4sII", b'glTF', 2, 0))
+        file.write(struct.pack("<I4s", 0, b'JSON'))
+        with profiler.span('json encoding'):
+            # Encoded json is ASCII only, so its length in bytes is its length in characters
+            length_gltf = __write_json(lambda chunk: file.write(chunk.encode()), gltf_ordered, gltf_encoder)
+        profiler.count('json characters', length_gltf)
         binary = glb_buffer
 
-        length_gltf = len(gltf_data)
         spaces_gltf = (4 - (length_gltf & 3)) & 3
+        file.write(b' ' * spaces_gltf)
         length_gltf += spaces_gltf
 
-        length_bin = len(binary)
+        length_bin = binary.byte_length if isinstance(binary, Buffer) else len(binary)
         zeros_bin = (4 - (length_bin & 3)) & 3
         length_bin += zeros_bin
 
@@ -109,24 +114,60 @@ def save_gltf(gltf, export_settings, encoder, glb_buffer):
         if length_bin > 0:
             length += 8 + length_bin
 
-        # Header (Version 2)
-        file.write('glTF'.encode())
-        file.write(struct.pack("I", 2))
-        file.write(struct.pack("I", length))
-
-        # Chunk 0 (JSON)
-        file.write(struct.pack("I", length_gltf))
-        file.write('JSON'.encode())
-        file.write(gltf_data)
-        file.write(b' ' * spaces_gltf)
-
         # Chunk 1 (BIN)
         if length_bin > 0:
-            file.write(struct.pack("I", length_bin))
-            file.write('BIN\0'.encode())
-            file.write(binary)
+            file.write(struct.pack("<I4s", length_bin, b'BIN\0'))
+            if isinstance(binary, Buffer):
+                binary.write_to(file)
+            else:
+                file.write(binary)
             file.write(b'\0' * zeros_bin)
 
+        # Header (Version 2) and Chunk 0 (JSON) header
+        file.seek(0)
+        file.write(struct.pack("<4sII", b'glTF', 2, length))
+        file.write(struct.pack("<I4s", length_gltf, b'JSON'))
+
         file.close()
 
     return True
+
+
+def __write_json(write, gltf, encoder):
+    """
+    Stream the json to write(), without building the whole encoded document in memory.
+
+    Return the number of characters written.
+    """
+    length = 0
+
+    if encoder.indent is not None:
+        # Indented json is always encoded in python, it can be streamed as is
+        for chunk in encoder.iterencode(gltf):
+            write(chunk)
+            length += len(chunk)
+        return length
+
+    # Compact json can use the C encoder, but only for whole objects.
+    # So encode root properties one element at a time
+    def write_chunk(chunk):
+        nonlocal length
+        write(chunk)
+        length += len(chunk)
+
+    write_chunk("{")
+    for idx, (key, value) in enumerate(gltf.items()):
+        if idx > 0:
+            write_chunk(encoder.item_separator)
+        write_chunk(encoder.encode(key) + encoder.key_separator)
+        if isinstance(value, list):
+            write_chunk("[")
+            for elem_idx, elem in enumerate(value):
+                if elem_idx > 0:
+                    write_chunk(encoder.item_separator)
+                write_chunk(encoder.encode(elem))
+            write_chunk("]")
+        else:
+            write_chunk(encoder.encode(value))
+    write_chunk("}")
+    return length
@@ -0,0 +1,147 @@
+# Copyright 2018-2026 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import tempfile
+import threading
+
+from ..com.debug import get_profiler
+
+# Change it when encoding changes, so that images encoded by a previous version are not used
+CACHE_VERSION = 1
+CACHE_EXTENSION = '.img'
+
+
+class ImageCache:
+    """On-disk cache of encoded images, shared between exports.
+
+    Entries are keyed by a hash of the source image bytes and of the way the image
+    is encoded (channel mapping, file format, quality). The cache is bounded in size,
+    least recently used entries are removed first, based on file modification times.
+    """
+
+    def __init__(self, directory, max_size):
+        self.directory = directory
+        self.max_size = max_size
+        self.lock = threading.Lock()  # Entries can be stored from image encoding threads
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.source_hashes = {}  # Source images of this export are hashed once
+
+        os.makedirs(directory, exist_ok=True)
+        self.size = sum(size for _, _, size in self.__entries())
+
+    @staticmethod
+    def get(export_settings):
+        """Image cache of this export, or None if not enabled."""
+        if 'image_cache' not in export_settings:
+            directory = export_settings.get('gltf_image_cache_directory', '')
+            cache = None
+            if directory:
+                try:
+                    cache = ImageCache(directory, export_settings.get('gltf_image_cache_size', 1024) * 1024 * 1024)
+                except OSError as e:
+                    export_settings['log'].warning("Image cache disabled, can't use {}: {}".format(directory, e))
+            export_settings['image_cache'] = cache
+        return export_settings['image_cache']
+
+    def source_hash(self, name, read_source):
+        """Hash of a source image, read_source returns its bytes, or None if it can't be cached."""
+        if name not in self.source_hashes:
+            data = read_source()
+            self.source_hashes[name] = hashlib.blake2b(data, digest_size=16).hexdigest() if data is not None else None
+        return self.source_hashes[name]
+
+    @staticmethod
+    def key(recipe, file_format, quality):
+        """Cache key of an image, recipe describes sources (by hash) and how they are combined."""
+        return hashlib.blake2b(
+            repr((CACHE_VERSION, recipe, file_format, quality)).encode('utf-8'),
+            digest_size=20,
+        ).hexdigest()
+
+    def __path(self, key):
+        return os.path.join(self.directory, key + CACHE_EXTENSION)
+
+    def __entries(self):
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(CACHE_EXTENSION) and entry.is_file():
+                    stat = entry.stat()
+                    yield entry.path, stat.st_mtime, stat.st_size
+
+    def load(self, key):
+        """Encoded bytes stored for this key, or None."""
+        path = self.__path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            data = None
+
+        with self.lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.bytes_saved += len(data)
+        return data
+
+    def store(self, key, data):
+        """Store encoded bytes, and remove least recently used entries if the cache is too big."""
+        if not data or len(data) > self.max_size:
+            return
+        path = self.__path(key)
+        try:
+            # Unique name, as several threads and Blender processes can share the cache directory
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)  # Atomic, so that concurrent exports never read partial entries
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self.lock:
+            self.size += len(data)
+            if self.size > self.max_size:
+                self.__evict()
+
+    def __evict(self):
+        entries = sorted(self.__entries(), key=lambda e: e[1])
+        self.size = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if self.size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+                self.size -= size
+            except OSError:
+                pass
+
+    def report(self, export_settings):
+        export_settings['log'].info("Image cache: {} hits, {} misses, {} bytes reused".format(
+            self.hits, self.misses, self.bytes_saved))
+        profiler = get_profiler(export_settings)
+        profiler.count('image cache hits', self.hits)
+        profiler.count('image cache bytes reused', self.bytes_saved)
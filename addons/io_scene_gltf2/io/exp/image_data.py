@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import re
+from .binary_data import DeferredBytes
 
 
 class ImageData:
@@ -22,16 +23,25 @@ class ImageData:
 
     def __init__(self, data: bytes, mime_type: str, name: str):
         self._data = data
+        # Deferred data is compared by placeholder, so caching does not wait for it
+        self._deferred = data if isinstance(data, DeferredBytes) else None
         self._mime_type = mime_type
         self._name = name
         self._adjusted_name = None
         self._uri = None
 
     def __eq__(self, other):
-        return self._data == other.data
+        # Deferred data is compared by placeholder only, consistently with the hash
+        if self._deferred is not None or other._deferred is not None:
+            if self._deferred is not other._deferred:
+                return False
+            return True
+        return self.data == other.data
 
     def __hash__(self):
-        return hash(self._data)
+        if self._deferred is not None:
+            return hash(self._deferred)
+        return hash(self.data)
 
     def adjusted_name(self):
         regex_dot = re.compile(r"\.")
@@ -41,6 +51,8 @@ class ImageData:
 
     @property
     def data(self):
+        if isinstance(self._data, DeferredBytes):
+            self._data = self._data.resolve()
         return self._data
 
     @property
@@ -57,7 +69,7 @@ class ImageData:
 
     @property
     def byte_length(self):
-        return len(self._data)
+        return len(self.data)
 
     @property
     def uri(self):
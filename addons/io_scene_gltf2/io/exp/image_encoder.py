@@ -0,0 +1,208 @@
+# Copyright 2018-2026 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+from ..com.debug import get_profiler
+from .binary_data import DeferredBytes
+
+PNG_COMPRESSION_LEVEL = 6
+PNG_ROWS_PER_CHUNK = 256  # Rows filtered at once, to bound memory used by filtering
+
+
+def pixels_to_bytes(pixels, width, height, channels):
+    """Convert float RGBA pixels, stored bottom to top like in Blender, to 8 bits rows from top to bottom.
+
+    Rounding matches the one of Blender when it stores float pixels in a byte image.
+    """
+    pixels = np.asarray(pixels, dtype=np.float32).reshape(height, width, 4)[::-1, :, :channels]
+    return np.clip(pixels * 255.0 + 0.5, 0, 255).astype(np.uint8)
+
+
+def __png_chunk(chunk_type, data):
+    chunk = chunk_type + data
+    return struct.pack('>I', len(data)) + chunk + struct.pack('>I', zlib.crc32(chunk) & 0xFFFFFFFF)
+
+
+def __png_filter_rows(rows, previous, bpp):
+    """Filter rows with the filter type giving the smallest sum of absolute differences, for each row."""
+    x = rows.astype(np.int16)
+    b = np.vstack([previous[np.newaxis].astype(np.int16), x[:-1]])  # up
+    a = np.zeros_like(x)  # left
+    a[:, bpp:] = x[:, :-bpp]
+    c = np.zeros_like(x)  # up left
+    c[:, bpp:] = b[:, :-bpp]
+
+    p = a + b - c
+    pa = np.abs(p - a)
+    pb = np.abs(p - b)
+    pc = np.abs(p - c)
+    paeth = np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+
+    candidates = np.stack([
+        x,
+        x - a,
+        x - b,
+        x - ((a + b) >> 1),
+        x - paeth,
+    ]).astype(np.uint8)  # Wraps modulo 256, as PNG filters do
+
+    # Heuristic from the PNG specification: minimum sum of absolute values, as signed bytes
+    signed = candidates.view(np.int8).astype(np.int16)
+    filter_types = np.abs(signed).sum(axis=2).argmin(axis=0)
+
+    filtered = np.empty((rows.shape[0], rows.shape[1] + 1), np.uint8)
+    filtered[:, 0] = filter_types
+    filtered[:, 1:] = candidates[filter_types, np.arange(rows.shape[0])]
+    return filtered
+
+
+def encode_png(pixels, width, height, alpha):
+    """Encode float RGBA pixels as an 8 bits RGB(A) PNG, without Blender.
+
+    Only numpy and zlib are used, that both release the GIL, so images can be encoded in threads.
+    """
+    channels = 4 if alpha else 3
+    rows = pixels_to_bytes(pixels, width, height, channels).reshape(height, width * channels)
+
+    compressor = zlib.compressobj(PNG_COMPRESSION_LEVEL)
+    idat = []
+    previous = np.zeros(width * channels, np.uint8)
+    for start in range(0, height, PNG_ROWS_PER_CHUNK):
+        chunk = rows[start:start + PNG_ROWS_PER_CHUNK]
+        idat.append(compressor.compress(__png_filter_rows(chunk, previous, channels).tobytes()))
+        previous = chunk[-1]
+    idat.append(compressor.flush())
+
+    color_type = 6 if alpha else 2
+    header = struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0)
+    return b''.join([
+        b'\x89PNG\r\n\x1a\n',
+        __png_chunk(b'IHDR', header),
+        __png_chunk(b'IDAT', b''.join(idat)),
+        __png_chunk(b'IEND', b''),
+    ])
+
+
+class ImageDeferredData(DeferredBytes):
+    """Encoded image, computed by a worker of the ImageEncoder.
+
+    Used in place of the encoded bytes in BinaryData and ImageData, until they are needed.
+    When encoding fails, the bytes are empty, and the image is not exported.
+    """
+
+    def __init__(self, key, export_settings):
+        self.key = key
+        self.export_settings = export_settings
+        self.future = None
+        self.encoded = None
+        self.raw_length = 0
+        self.time = 0.0
+
+    def resolve(self):
+        if self.encoded is None:
+            try:
+                self.encoded = self.future.result()
+            except Exception as e:
+                self.export_settings['log'].warning("Image encoding failed, not exporting image: {}".format(e))
+                self.encoded = b''
+        return self.encoded
+
+
+class ImageEncoder:
+    """Encode images on worker threads, while gathering goes on.
+
+    Images are deduplicated twice: by recipe key (same Blender sources composed the same way),
+    before pixels are composed, and by a hash of their pixels, before they are submitted.
+    Duplicates get the placeholder of the first image, so that images and buffer views, compared
+    by placeholder, are deduplicated like images compared by bytes.
+    """
+
+    def __init__(self, num_threads, export_settings):
+        self.export_settings = export_settings
+        self.executor = ThreadPoolExecutor(max_workers=num_threads, thread_name_prefix='glTFImageEncode')
+        # Composed pixels are kept until encoded, so the number of images waiting is bounded
+        self.max_pending = 2 * num_threads
+        self.pending = deque()
+        self.by_key = {}
+        self.by_hash = {}
+        self.recipe_hits = 0
+        self.content_hits = 0
+
+    @staticmethod
+    def get(export_settings):
+        """Image encoder of this export, or None if images are encoded on the main thread."""
+        if 'image_encoder' not in export_settings:
+            num_threads = export_settings.get('gltf_image_threads', 0)
+            if num_threads == 0:
+                num_threads = os.cpu_count() or 1
+            export_settings['image_encoder'] = ImageEncoder(num_threads, export_settings) if num_threads > 1 else None
+        return export_settings['image_encoder']
+
+    def lookup(self, key):
+        """Placeholder of an image with the same recipe, already submitted."""
+        deferred = self.by_key.get(key) if key is not None else None
+        if deferred is not None:
+            self.recipe_hits += 1
+        return deferred
+
+    def submit(self, key, pixels, width, height, alpha):
+        """Encode pixels as PNG on a worker. Return the placeholder of the encoded bytes."""
+        pixels = np.ascontiguousarray(pixels, dtype=np.float32)
+        content_hash = hashlib.blake2b(memoryview(pixels).cast('B'), digest_size=16)
+        content_hash.update(struct.pack('<II?', width, height, alpha))
+        content_hash = content_hash.digest()
+
+        deferred = self.by_hash.get(content_hash)
+        if deferred is not None:
+            self.content_hits += 1
+        else:
+            while len(self.pending) >= self.max_pending:
+                self.pending.popleft().resolve()
+
+            deferred = ImageDeferredData(key, self.export_settings)
+            deferred.raw_length = width * height * (4 if alpha else 3)
+            deferred.future = self.executor.submit(self.__encode, deferred, pixels, width, height, alpha)
+            self.pending.append(deferred)
+            self.by_hash[content_hash] = deferred
+        if key is not None:
+            self.by_key[key] = deferred
+        return deferred
+
+    def __encode(self, deferred, pixels, width, height, alpha):
+        start_time = time.time()
+        encoded = encode_png(pixels, width, height, alpha)
+        deferred.time = time.time() - start_time
+        return encoded
+
+    def finish(self):
+        """Wait for all images, log statistics and stop workers."""
+        self.executor.shutdown(wait=True)
+        encoded = list(self.by_hash.values())
+        raw_length = sum(d.raw_length for d in encoded)
+        encoded_length = sum(len(d.resolve()) for d in encoded)
+        self.export_settings['log'].info(
+            'Image encoder: Encoded {} images in {:.3f} s, {} -> {} bytes, {} recipe and {} content duplicates skipped.'.format(
+                len(encoded), sum(d.time for d in encoded), raw_length, encoded_length, self.recipe_hits,
+                self.content_hits))
+        profiler = get_profiler(self.export_settings)
+        profiler.count('encoded images', len(encoded))
+        profiler.count('deduplicated images', self.recipe_hits + self.content_hits)
@@ -13,9 +13,13 @@
 # limitations under the License.
 
 import ctypes
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 from ...io.com.library import dll_path
+from ...io.com.debug import get_profiler
 
 # encodeExpMode enum values (from encoder.h)
 ENCODE_EXP_SEPARATE = 0
@@ -29,6 +33,30 @@ EXP_FILTER_BITS = 12
 QUAT_FILTER_BITS = 8
 
 
+class MeshoptDeferredData:
+    """Raw data recorded during gathering, to be encoded by the meshopt compression stage.
+
+    It is used as placeholder for the compressed data in the meshopt extension of a BinaryData,
+    until MeshoptEncoder.encode_deferred is called.
+    """
+
+    def __init__(self, attribute_name, data, byteStride, mode=None):
+        self.attribute_name = attribute_name  # None for indices
+        self.data = data
+        self.byteStride = byteStride
+        self.mode = mode
+        self.raw_length = data.nbytes
+        self.encoded = None
+        self.time = 0.0
+
+    @property
+    def kind(self):
+        """Attribute kind used for reporting, numbered attributes (TEXCOORD_0, TEXCOORD_1...) are grouped."""
+        if self.attribute_name is None:
+            return 'INDICES'
+        return self.attribute_name.rstrip('0123456789').rstrip('_') or self.attribute_name
+
+
 class MeshoptEncoder:
     """Meshopt encoder."""
     def __new__(cls, *args, **kwargs):
@@ -135,6 +163,84 @@ class MeshoptEncoder:
         ]
         lib.encodeFilterExp.restype = None
 
+    @staticmethod
+    def attribute_filter(attribute_name):
+        """Filter applied before encoding an attribute, or None."""
+        if attribute_name in ["POSITION", "SK_POSITION", "NORMAL", "SK_NORMAL", "TANGENT", "SK_TANGENT",
+                              "SCALE", "TIME", "GPU_TRANSLATION", "GPU_SCALE", "SK_ANIM"]:
+            return 'EXPONENTIAL'
+        elif attribute_name in ["ROTATION", "SK_ROTATION", "GPU_ROTATION"]:
+            return 'QUATERNION'
+        return None
+
+    @staticmethod
+    def defer_attribute(attribute_name, data, byteStride):
+        """Record an attribute to be encoded later. Return the placeholder, and the filter that will be used."""
+        return MeshoptDeferredData(attribute_name, data, byteStride), MeshoptEncoder.attribute_filter(attribute_name)
+
+    @staticmethod
+    def defer_indices(mode, data):
+        """Record indices to be encoded later. Return the placeholder, and the filter that will be used."""
+        return MeshoptDeferredData(None, data, None, mode=mode), None
+
+    @staticmethod
+    def encode_deferred(deferred, export_settings):
+        """Encode recorded data concurrently, as the encoder calls release the GIL."""
+        # Same placeholder can be referenced multiple times
+        to_encode = list({id(d): d for d in deferred if d.encoded is None}.values())
+        if len(to_encode) == 0:
+            return
+
+        # Library is loaded on the main thread, before starting workers
+        MeshoptEncoder.load_library(export_settings)
+
+        num_threads = export_settings.get('gltf_compression_threads', 0)
+        if num_threads == 0:
+            num_threads = os.cpu_count() or 1
+
+        start_time = time.time()
+        if num_threads > 1 and len(to_encode) > 1:
+            with ThreadPoolExecutor(max_workers=num_threads, thread_name_prefix='glTFMeshoptEncode') as executor:
+                list(executor.map(lambda d: MeshoptEncoder.__encode_deferred_data(d, export_settings), to_encode))
+        else:
+            for d in to_encode:
+                MeshoptEncoder.__encode_deferred_data(d, export_settings)
+        elapsed = time.time() - start_time
+
+        stats = {}  # kind -> [count, raw length, encoded length, time]
+        for d in to_encode:
+            kind_stats = stats.setdefault(d.kind, [0, 0, 0, 0.0])
+            kind_stats[0] += 1
+            kind_stats[1] += d.raw_length
+            kind_stats[2] += len(d.encoded)
+            kind_stats[3] += d.time
+
+        for kind, (count, raw_length, encoded_length, kind_time) in stats.items():
+            export_settings['log'].info('Meshopt encoder: Encoded {} {} buffer views in {:.3f} s, {} -> {} bytes ({:.2f}x).'.format(
+                count, kind, kind_time, raw_length, encoded_length, raw_length / max(encoded_length, 1)))
+
+        total_raw_length = sum(s[1] for s in stats.values())
+        total_encoded_length = sum(s[2] for s in stats.values())
+        export_settings['log'].info('Meshopt encoder: Encoded {} buffer views in {:.3f} s, {} -> {} bytes ({:.2f}x).'.format(
+            len(to_encode), elapsed, total_raw_length, total_encoded_length,
+            total_raw_length / max(total_encoded_length, 1)))
+        profiler = get_profiler(export_settings)
+        profiler.count('meshopt buffer views', len(to_encode))
+        profiler.count('meshopt raw bytes', total_raw_length)
+        profiler.count('meshopt encoded bytes', total_encoded_length)
+
+    @staticmethod
+    def __encode_deferred_data(deferred, export_settings):
+        start_time = time.time()
+        if deferred.attribute_name is None:
+            deferred.encoded, _ = MeshoptEncoder.encode_indices(deferred.mode, deferred.data, export_settings)
+        else:
+            deferred.encoded, _ = MeshoptEncoder.encode_attribute(
+                deferred.attribute_name, deferred.data, deferred.byteStride, export_settings)
+        deferred.time = time.time() - start_time
+        # Raw data is no more needed
+        deferred.data = None
+
     @staticmethod
     def encode_indices(mode, data, export_settings):
 
@@ -196,14 +302,7 @@ class MeshoptEncoder:
     @staticmethod
     def encode_attribute(attribute_name, data, byteStride, export_settings):
 
-        filter = None
-        if attribute_name in ["POSITION", "SK_POSITION", "NORMAL", "SK_NORMAL", "TANGENT", "SK_TANGENT",
-                              "SCALE", "TIME", "GPU_TRANSLATION", "GPU_SCALE", "SK_ANIM"]:
-            filter = 'EXPONENTIAL'
-        elif attribute_name in ["ROTATION", "SK_ROTATION", "GPU_ROTATION"]:
-            filter = 'QUATERNION'
-        else:
-            pass
+        filter = MeshoptEncoder.attribute_filter(attribute_name)
 
         MeshoptEncoder.load_library(export_settings)
         lib = export_settings['meshopt_encoder']
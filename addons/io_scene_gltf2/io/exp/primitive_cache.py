@@ -0,0 +1,203 @@
+# Copyright 2018-2026 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+
+from ..com.constants import ComponentType
+from ..com.debug import get_profiler
+
+# Change it when primitive extraction changes, so that primitives extracted by a previous version are not used
+CACHE_VERSION = 1
+CACHE_EXTENSION = '.prim'
+MANIFEST = 'entry.json'
+
+
+class PrimitiveCache:
+    """On-disk cache of extracted primitives, shared between exports.
+
+    Each entry is a directory, keyed by a fingerprint of the evaluated mesh, of the export
+    settings and of the materials the extraction depends on. It holds a manifest describing
+    the primitives, and one .npy file per array. Arrays are memory-mapped when loaded,
+    copy-on-write, so later export steps can still modify them in place.
+    Entries are removed least recently used first, based on manifest modification times.
+    """
+
+    def __init__(self, directory, max_size):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self.size = sum(size for _, _, size in self.__entries())
+
+    @staticmethod
+    def get(export_settings):
+        """Primitive cache of this export, or None if not enabled."""
+        if 'primitive_cache' not in export_settings:
+            directory = export_settings.get('gltf_primitive_cache_directory', '')
+            cache = None
+            if directory:
+                try:
+                    cache = PrimitiveCache(
+                        directory, export_settings.get('gltf_primitive_cache_size', 1024) * 1024 * 1024)
+                except OSError as e:
+                    export_settings['log'].warning("Primitive cache disabled, can't use {}: {}".format(directory, e))
+            export_settings['primitive_cache'] = cache
+        return export_settings['primitive_cache']
+
+    @staticmethod
+    def key(fingerprint):
+        """Cache key of a mesh, fingerprint is the digest of everything its extraction depends on."""
+        return hashlib.blake2b(
+            repr((CACHE_VERSION, fingerprint)).encode('utf-8'),
+            digest_size=20,
+        ).hexdigest()
+
+    def __path(self, key):
+        return os.path.join(self.directory, key + CACHE_EXTENSION)
+
+    def __entries(self):
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(CACHE_EXTENSION) or not entry.is_dir():
+                    continue
+                try:
+                    mtime = os.stat(os.path.join(entry.path, MANIFEST)).st_mtime
+                    size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                except OSError:
+                    continue
+                yield entry.path, mtime, size
+
+    def load(self, key):
+        """Primitives stored for this key, or None."""
+        path = self.__path(key)
+        try:
+            with open(os.path.join(path, MANIFEST), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            arrays = [self.__load_array(os.path.join(path, name)) for name in manifest['arrays']]
+            value = self.__decode(manifest['value'], arrays)
+            os.utime(os.path.join(path, MANIFEST))  # Mark as recently used
+        except (OSError, ValueError, KeyError, IndexError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.bytes_saved += sum(a.nbytes for a in arrays)
+        return value
+
+    @staticmethod
+    def __load_array(path):
+        try:
+            # Plain ndarray view, still backed by the file
+            return np.load(path, mmap_mode='c', allow_pickle=False).view(np.ndarray)
+        except ValueError:
+            # Empty arrays can't be memory-mapped
+            return np.load(path, allow_pickle=False)
+
+    def store(self, key, value):
+        """Store primitives, and remove least recently used entries if the cache is too big.
+
+        Values are nested dicts and lists of numpy arrays, component types, strings and numbers.
+        Tuples are loaded back as lists.
+        """
+        arrays = []
+        try:
+            manifest = {'value': self.__encode(value, arrays), 'arrays': [str(i) + '.npy' for i in range(len(arrays))]}
+        except TypeError:
+            return
+        size = sum(a.nbytes for a in arrays)
+        if size > self.max_size:
+            return
+
+        path = self.__path(key)
+        if os.path.isdir(path):
+            return
+        try:
+            # Unique name, as several threads and Blender processes can share the cache directory
+            tmp_path = tempfile.mkdtemp(dir=self.directory, suffix='.tmp')
+        except OSError:
+            return
+        try:
+            for name, array in zip(manifest['arrays'], arrays):
+                np.save(os.path.join(tmp_path, name), array, allow_pickle=False)
+            # Written last, so that an entry with a manifest is always complete
+            with open(os.path.join(tmp_path, MANIFEST), 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+            os.rename(tmp_path, path)  # Atomic, so that concurrent exports never read partial entries
+        except (OSError, ValueError):
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            return
+
+        self.size += size
+        if self.size > self.max_size:
+            self.__evict()
+
+    def __evict(self):
+        entries = sorted(self.__entries(), key=lambda e: e[1])
+        self.size = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if self.size <= self.max_size:
+                break
+            try:
+                shutil.rmtree(path)
+                self.size -= size
+            except OSError:
+                pass  # Can be memory-mapped by this export, on some platforms
+
+    @staticmethod
+    def __encode(value, arrays):
+        if isinstance(value, np.ndarray):
+            if value.dtype.hasobject:
+                raise TypeError("Object arrays can't be cached")
+            arrays.append(value)
+            return {'__array__': len(arrays) - 1}
+        if isinstance(value, ComponentType):
+            return {'__component_type__': int(value)}
+        if isinstance(value, np.generic):
+            return value.item()
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, (list, tuple)):
+            return [PrimitiveCache.__encode(v, arrays) for v in value]
+        if isinstance(value, dict):
+            if not all(isinstance(k, str) for k in value.keys()):
+                raise TypeError("Only string keys can be cached")
+            return {k: PrimitiveCache.__encode(v, arrays) for k, v in value.items()}
+        raise TypeError("Can't cache " + type(value).__name__)
+
+    @staticmethod
+    def __decode(value, arrays):
+        if isinstance(value, list):
+            return [PrimitiveCache.__decode(v, arrays) for v in value]
+        if isinstance(value, dict):
+            if '__array__' in value:
+                return arrays[value['__array__']]
+            if '__component_type__' in value:
+                return ComponentType(value['__component_type__'])
+            return {k: PrimitiveCache.__decode(v, arrays) for k, v in value.items()}
+        return value
+
+    def report(self, export_settings):
+        export_settings['log'].info("Primitive cache: {} hits, {} misses, {} bytes reused".format(
+            self.hits, self.misses, self.bytes_saved))
+        profiler = get_profiler(export_settings)
+        profiler.count('primitive cache hits', self.hits)
+        profiler.count('primitive cache bytes reused', self.bytes_saved)
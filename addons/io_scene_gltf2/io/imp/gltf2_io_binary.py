@@ -48,9 +48,11 @@ class BinaryData():
         if buffer_idx in gltf.buffers.keys():
             buffer = gltf.buffers[buffer_idx]
         else:
-            # load buffer
-            gltf.load_buffer(buffer_idx)
-            buffer = gltf.buffers[buffer_idx]
+            # load buffer, only once even if decode threads request it at the same time
+            with gltf.data_lock:
+                if buffer_idx not in gltf.buffers.keys():
+                    gltf.load_buffer(buffer_idx)
+                buffer = gltf.buffers[buffer_idx]
         return buffer[byte_offset:byte_offset + byte_length]
 
     @staticmethod
@@ -79,21 +81,15 @@ class BinaryData():
     @staticmethod
     def get_data_from_accessor(gltf, accessor_idx, cache=False):
         """Get data from accessor."""
-        if accessor_idx in gltf.accessor_cache:
-            return gltf.accessor_cache[accessor_idx]
-
-        data = BinaryData.decode_accessor(gltf, accessor_idx).tolist()
-
-        if cache:
-            gltf.accessor_cache[accessor_idx] = data
-
-        return data
+        return BinaryData.decode_accessor(gltf, accessor_idx, cache=cache).tolist()
 
     @staticmethod
     def decode_accessor(gltf, accessor_idx, cache=False):
         """Decodes accessor to 2D numpy array (count x num_components)."""
-        if accessor_idx in gltf.decode_accessor_cache:
-            return gltf.accessor_cache[accessor_idx]
+        if cache:
+            array = gltf.accessor_cache.get(accessor_idx)
+            if array is not None:
+                return array
 
         accessor = gltf.data.accessors[accessor_idx]
 
@@ -107,9 +103,9 @@ class BinaryData():
         array = array.value
 
         if cache:
-            gltf.accessor_cache[accessor_idx] = array
             # Prevent accidentally modifying cached arrays
             array.flags.writeable = False
+            gltf.accessor_cache.put(accessor_idx, array)
 
         return array
 
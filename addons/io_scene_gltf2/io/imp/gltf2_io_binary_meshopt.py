@@ -44,8 +44,6 @@ class MeshoptDecoder:
         except Exception as e:
             raise ImportError("Failed to load Meshopt decoder library: {}".format(e))
 
-        gltf.meshopt_decoder = lib
-
         # Define type signatures for the decoder functions
         decode_funcs = [
             lib.decodeVertexBuffer,
@@ -75,12 +73,17 @@ class MeshoptDecoder:
                 ctypes.c_size_t,  # size_t stride
             ]
 
+        # Only expose the library once signatures are set, as buffer views can be decoded from worker threads
+        gltf.meshopt_decoder = lib
+
     @staticmethod
     def get_buffer_view(gltf, bufferview_index):
         """Decodes EXT/KHR_meshopt_compression buffer view."""
         # Check if already in cache
         if not hasattr(gltf, 'meshopt_cache'):
-            gltf.meshopt_cache = {}
+            with gltf.data_lock:
+                if not hasattr(gltf, 'meshopt_cache'):
+                    gltf.meshopt_cache = {}
         if bufferview_index in gltf.meshopt_cache:
             return gltf.meshopt_cache[bufferview_index]
 
@@ -16,10 +16,14 @@ from ...io.com.path import uri_to_path
 from ..com.gltf2_io import gltf_from_dict
 from ..com.debug import Log
 from .user_extensions import MutatingArgument, import_user_extensions as import_user_extensions_fn
+from .gltf2_io_selection import ImportSelection
 import logging
 import json
+import mmap
 import struct
 import base64
+import threading
+from collections import OrderedDict
 from os.path import dirname, join, isfile
 
 
@@ -28,6 +32,54 @@ class ImportError(RuntimeError):
     pass
 
 
+class AccessorCache():
+    """LRU cache of decoded accessors, keyed by accessor index, bounded by the total size of the arrays.
+
+    The cache can be shared between the main thread and decode worker threads.
+    """
+
+    def __init__(self, budget):
+        self.budget = budget  # In bytes
+        self.byte_size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__arrays = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __contains__(self, accessor_idx):
+        return accessor_idx in self.__arrays
+
+    def get(self, accessor_idx):
+        with self.__lock:
+            array = self.__arrays.get(accessor_idx)
+            if array is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.__arrays.move_to_end(accessor_idx)
+            return array
+
+    def put(self, accessor_idx, array):
+        with self.__lock:
+            if accessor_idx in self.__arrays:
+                self.byte_size -= self.__arrays.pop(accessor_idx).nbytes
+            if array.nbytes > self.budget:
+                # Will never fit, don't flush the whole cache for it
+                return
+            self.__arrays[accessor_idx] = array
+            self.byte_size += array.nbytes
+            while self.byte_size > self.budget:
+                _, evicted = self.__arrays.popitem(last=False)
+                self.byte_size -= evicted.nbytes
+                self.evictions += 1
+
+    def clear(self):
+        with self.__lock:
+            self.__arrays.clear()
+            self.byte_size = 0
+
+
 class glTFImporter():
     """glTF Importer class."""
 
@@ -37,8 +89,11 @@ class glTFImporter():
         self.import_settings = import_settings
         self.glb_buffer = None
         self.buffers = {}
-        self.accessor_cache = {}
-        self.decode_accessor_cache = {}
+        self.data_lock = threading.RLock()  # Guards buffers loading and registration, shared with decode threads
+        self.decode_pipeline = None
+        self.selection = None  # ImportSelection, when import filters are set
+        self.mapped_files = []
+        self.accessor_cache = AccessorCache(import_settings.get('accessor_cache_size', 512) * 1024 * 1024)
         self.import_user_extensions = import_settings['import_user_extensions']
         self.variant_mapping = {}  # Used to map between mgltf material idx and blender material, for Variants
 
@@ -157,13 +212,30 @@ class glTFImporter():
 
         return data_type, data_length, data, offset + 8 + data_length
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        # Files stay mapped until closed, for users of the importer that don't close it
+        if getattr(self, 'mapped_files', None):
+            self.close()
+
     def read(self):
-        """Read file."""
+        """Read file. Mapped files are released if reading fails."""
+        try:
+            self.__read()
+        except BaseException:
+            self.close()
+            raise
+
+    def __read(self):
         if not isfile(self.filename):
             raise ImportError("Please select a file")
 
-        with open(self.filename, 'rb') as f:
-            content = memoryview(f.read())
+        content = self.read_file(self.filename)
 
         if content[:4] == b'glTF':
             gltf, self.glb_buffer = self.load_glb(content)
@@ -173,13 +245,34 @@ class glTFImporter():
 
         glTFImporter.check_version(gltf)
 
+        # Tools only needing a few objects can ask to decode them on first access.
+        # Filtered imports only touch the selected objects, so they always do.
+        lazy = self.import_settings.get('import_lazy_document', False) or \
+            ImportSelection.has_filter(self.import_settings)
         try:
-            self.data = gltf_from_dict(gltf)
-        except AssertionError:
+            # Elements decoded later report errors the same way
+            self.data = gltf_from_dict(gltf, lazy=lazy, error=ImportError)
+
+            # Selected elements are decoded now, so that invalid ones are reported before creating anything
+            self.selection = ImportSelection.from_settings(self.data, self.import_settings)
+            if self.selection is not None:
+                self.selection.decode(self.data)
+        except (AssertionError, TypeError):
             import traceback
             traceback.print_exc()
             raise ImportError("Couldn't parse glTF. Check that the file is valid")
 
+        if self.selection is not None and self.import_settings.get('import_filter_scene', -1) >= 0:
+            # The filtered scene is imported as the default one
+            self.data.scene = self.import_settings['import_filter_scene']
+
+    def selected(self, name):
+        """Enumerate (index, element) of a document array, restricted to the selection if any."""
+        items = getattr(self.data, name) or []
+        if self.selection is None:
+            return enumerate(items)
+        return ((i, items[i]) for i in sorted(getattr(self.selection, name)) if 0 <= i < len(items))
+
     def load_buffer(self, buffer_idx):
         """Load buffer."""
         buffer = self.data.buffers[buffer_idx]
@@ -211,8 +304,34 @@ class glTFImporter():
 
         path = join(dirname(self.filename), uri_to_path(uri))
         try:
-            with open(path, 'rb') as f_:
-                return memoryview(f_.read())
+            return self.read_file(path)
         except Exception:
             self.log.error("Couldn't read file: " + path)
             return None
+
+    def read_file(self, path):
+        """Read a file, or map it in memory, so that slices are views over the mapped file."""
+        with open(path, 'rb') as f:
+            if self.import_settings.get('import_memory_map', False):
+                try:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # Empty files, or files that can't be mapped
+                    mapped = None
+                if mapped is not None:
+                    self.mapped_files.append(mapped)
+                    return memoryview(mapped)
+            return memoryview(f.read())
+
+    def close(self):
+        """Release loaded buffers and unmap mapped files."""
+        self.glb_buffer = None
+        self.buffers = {}
+        self.accessor_cache.clear()
+        for mapped in self.mapped_files:
+            try:
+                mapped.close()
+            except BufferError:
+                # Some arrays still reference the mapped file. It will be closed when they are released
+                pass
+        self.mapped_files = []
@@ -0,0 +1,200 @@
+# Copyright 2018-2026 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from fnmatch import fnmatchcase
+from ..com.gltf2_io import LazyList
+
+
+class ImportSelection:
+    """Part of a glTF document to import, built from the import filters.
+
+    Filters are a scene index, a node name glob and a list of mesh indices.
+    Nodes matching all the given filters, and their descendants, are imported
+    with their content. Their ancestors, and the joints and skeletons of their
+    skins, are imported without content, to keep transforms and armatures.
+    """
+
+    def __init__(self):
+        self.nodes = set()          # Nodes turned into vnodes
+        self.content_nodes = set()  # Nodes whose mesh, camera and light are imported
+        self.scenes = set()
+        self.meshes = set()
+        self.skins = set()
+        self.materials = set()
+        self.cameras = set()
+        self.lights = set()
+        self.animations = set()     # Animations with at least one channel kept, filled at import
+
+    @staticmethod
+    def has_filter(import_settings):
+        return import_settings.get('import_filter_scene', -1) >= 0 or \
+            bool(import_settings.get('import_filter_nodes')) or \
+            bool(import_settings.get('import_filter_meshes'))
+
+    @staticmethod
+    def from_settings(data, import_settings):
+        """Compute the selection, or None when no filter is set."""
+        # Imported here to avoid a circular import
+        from .gltf2_io_gltf import ImportError
+
+        if not ImportSelection.has_filter(import_settings):
+            return None
+
+        scene_idx = import_settings.get('import_filter_scene', -1)
+        pattern = import_settings.get('import_filter_nodes') or None
+        meshes = import_settings.get('import_filter_meshes') or None
+        if isinstance(meshes, str):
+            try:
+                meshes = {int(i) for i in meshes.split(',') if i.strip()}
+            except ValueError:
+                raise ImportError("Mesh filter must be a comma separated list of mesh indices")
+        elif meshes is not None:
+            meshes = set(meshes)
+
+        pynodes = data.nodes or []
+        candidates = None
+
+        if scene_idx >= 0:
+            if scene_idx >= len(data.scenes or []):
+                raise ImportError("Scene filter: there is no scene %d in this file" % scene_idx)
+            candidates = ImportSelection.__descendants(pynodes, data.scenes[scene_idx].nodes or [])
+
+        if pattern is not None:
+            matched = []
+            for i in (sorted(candidates) if candidates is not None else range(len(pynodes))):
+                name = ImportSelection.__node_json(pynodes, i).get('name')
+                if isinstance(name, str) and fnmatchcase(name, pattern):
+                    matched.append(i)
+            candidates = ImportSelection.__descendants(pynodes, matched)
+
+        if meshes is not None:
+            candidates = {
+                i for i in (candidates if candidates is not None else range(len(pynodes)))
+                if ImportSelection.__node_json(pynodes, i).get('mesh') in meshes
+            }
+
+        selection = ImportSelection()
+        selection.content_nodes = candidates
+        selection.nodes = set(candidates)
+
+        for node_idx in candidates:
+            pynode = pynodes[node_idx]
+            if pynode.mesh is not None:
+                selection.meshes.add(pynode.mesh)
+            if pynode.skin is not None:
+                selection.skins.add(pynode.skin)
+            if pynode.camera is not None:
+                selection.cameras.add(pynode.camera)
+            if pynode.extensions and 'KHR_lights_punctual' in pynode.extensions:
+                light = pynode.extensions['KHR_lights_punctual'].get('light')
+                if light is not None:
+                    selection.lights.add(light)
+
+        for skin_idx in selection.skins:
+            pyskin = data.skins[skin_idx]
+            selection.nodes.update(pyskin.joints)
+            if pyskin.skeleton is not None:
+                selection.nodes.add(pyskin.skeleton)
+
+        # A scene subtree already contains all the ancestors of its nodes
+        if not (scene_idx >= 0 and pattern is None and meshes is None and selection.nodes <= candidates):
+            parents = {
+                child: i for i in range(len(pynodes))
+                for child in ImportSelection.__node_json(pynodes, i).get('children') or []
+            }
+            for node_idx in list(selection.nodes):
+                while node_idx in parents and parents[node_idx] not in selection.nodes:
+                    node_idx = parents[node_idx]
+                    selection.nodes.add(node_idx)
+
+        selection.scenes = {
+            i for i, pyscene in enumerate(data.scenes or [])
+            if any(node_idx in selection.nodes for node_idx in pyscene.nodes or [])
+        }
+
+        for mesh_idx in selection.meshes:
+            if not (0 <= mesh_idx < len(data.meshes or [])):
+                continue
+            for prim in data.meshes[mesh_idx].primitives:
+                if prim.material is not None:
+                    selection.materials.add(prim.material)
+                if prim.extensions and 'KHR_materials_variants' in prim.extensions:
+                    for mapping in prim.extensions['KHR_materials_variants'].get('mappings', []):
+                        selection.materials.add(mapping['material'])
+
+        return selection
+
+    def decode(self, data):
+        """Decode selected elements of lazy arrays, and accessors of selected meshes, on first access."""
+        for name in ['nodes', 'meshes', 'materials']:
+            items = getattr(data, name) or []
+            for idx in getattr(self, name):
+                if 0 <= idx < len(items):
+                    items[idx]
+
+        accessors = data.accessors or []
+        for mesh_idx in self.meshes:
+            if not (0 <= mesh_idx < len(data.meshes or [])):
+                continue
+            for prim in data.meshes[mesh_idx].primitives:
+                accessor_indices = list(prim.attributes.values())
+                if prim.indices is not None:
+                    accessor_indices.append(prim.indices)
+                for target in prim.targets or []:
+                    accessor_indices.extend(target.values())
+                for accessor_idx in accessor_indices:
+                    if isinstance(accessor_idx, int) and 0 <= accessor_idx < len(accessors):
+                        accessors[accessor_idx]
+
+    def keeps_pointer(self, pointer):
+        """Whether a KHR_animation_pointer target belongs to the selection."""
+        pointer_tab = pointer.split("/")
+        if len(pointer_tab) < 3:
+            return False
+        try:
+            if pointer_tab[1] == "extensions":
+                if len(pointer_tab) >= 5 and pointer_tab[2] == "KHR_lights_punctual" and pointer_tab[3] == "lights":
+                    return int(pointer_tab[4]) in self.lights
+                return False
+            idx = int(pointer_tab[2])
+        except ValueError:
+            return False
+        return idx in {
+            "nodes": self.nodes,
+            "meshes": self.meshes,
+            "materials": self.materials,
+            "cameras": self.cameras,
+        }.get(pointer_tab[1], ())
+
+    @staticmethod
+    def __descendants(pynodes, roots):
+        nodes = set()
+        stack = list(roots)
+        while stack:
+            node_idx = stack.pop()
+            if node_idx in nodes:
+                continue
+            nodes.add(node_idx)
+            stack.extend(ImportSelection.__node_json(pynodes, node_idx).get('children') or [])
+        return nodes
+
+    @staticmethod
+    def __node_json(pynodes, node_idx):
+        # Filters read nodes from their json, so that only the selected ones are decoded
+        if isinstance(pynodes, LazyList):
+            node = pynodes.raw(node_idx)
+            if isinstance(node, dict):
+                return node
+        # Decoding reports invalid nodes
+        return pynodes[node_idx].to_dict()
@@ -0,0 +1,40 @@
+# Copyright 2018-2026 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Python tests of the add-on. Run them with `python -m pytest tests/python`.
+# Tests of io modules run with any Python. Tests needing Blender are skipped,
+# unless run with a Python where the bpy module is available. CI runs all of
+# them in Blender, with the add-on enabled:
+# blender -b --addons io_scene_gltf2 --python-expr "import pytest; pytest.main(['tests/python'])"
+
+import os
+import sys
+import types
+
+ADDONS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'addons'))
+
+try:
+    import bpy  # noqa: F401
+    HAS_BPY = True
+except ImportError:
+    HAS_BPY = False
+
+if HAS_BPY:
+    sys.path.insert(0, ADDONS_DIR)
+elif 'io_scene_gltf2' not in sys.modules:
+    # The package __init__ registers the Blender operators, and needs bpy.
+    # Without it, only the io modules are imported, from the package directory.
+    package = types.ModuleType('io_scene_gltf2')
+    package.__path__ = [os.path.join(ADDONS_DIR, 'io_scene_gltf2')]
+    sys.modules['io_scene_gltf2'] = package
@@ -0,0 +1,111 @@
+# Copyright 2018-2026 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import time
+
+from io_scene_gltf2.io.exp.image_cache import ImageCache, CACHE_EXTENSION
+
+
+def entries(directory):
+    return sorted(name for name in os.listdir(directory))
+
+
+def age(cache, key, seconds):
+    path = os.path.join(cache.directory, key + CACHE_EXTENSION)
+    mtime = time.time() - seconds
+    os.utime(path, (mtime, mtime))
+
+
+def test_store_and_load(tmp_path):
+    cache = ImageCache(str(tmp_path), 1024)
+    key = ImageCache.key(('source', 'hash'), 'PNG', 90)
+
+    assert cache.load(key) is None
+    cache.store(key, b'encoded image')
+
+    assert cache.load(key) == b'encoded image'
+    assert (cache.hits, cache.misses, cache.bytes_saved) == (1, 1, len(b'encoded image'))
+    assert entries(tmp_path) == [key + CACHE_EXTENSION]
+
+
+def test_key_depends_on_encoding():
+    recipe = ('source', 'hash')
+    assert ImageCache.key(recipe, 'PNG', 90) == ImageCache.key(recipe, 'PNG', 90)
+    assert ImageCache.key(recipe, 'PNG', 90) != ImageCache.key(recipe, 'JPEG', 90)
+    assert ImageCache.key(recipe, 'JPEG', 90) != ImageCache.key(recipe, 'JPEG', 80)
+
+
+def test_size_is_read_from_directory(tmp_path):
+    cache = ImageCache(str(tmp_path), 1024)
+    cache.store('a', b'x' * 100)
+    cache.store('b', b'x' * 50)
+
+    assert ImageCache(str(tmp_path), 1024).size == 150
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ImageCache(str(tmp_path), 250)
+    cache.store('a', b'a' * 100)
+    cache.store('b', b'b' * 100)
+    age(cache, 'a', 20)
+    age(cache, 'b', 10)
+
+    # Loading marks an entry as recently used
+    assert cache.load('a') == b'a' * 100
+
+    cache.store('c', b'c' * 100)
+
+    assert entries(tmp_path) == ['a' + CACHE_EXTENSION, 'c' + CACHE_EXTENSION]
+    assert cache.size == 200
+
+
+def test_too_big_and_empty_data_are_not_stored(tmp_path):
+    cache = ImageCache(str(tmp_path), 10)
+    cache.store('big', b'x' * 11)
+    cache.store('empty', b'')
+
+    assert entries(tmp_path) == []
+    assert cache.size == 0
+
+
+def test_failed_store_leaves_no_temporary_file(tmp_path, monkeypatch):
+    cache = ImageCache(str(tmp_path), 1024)
+
+    def failing_replace(src, dst):
+        raise OSError("replace failed")
+    monkeypatch.setattr(os, 'replace', failing_replace)
+
+    cache.store('a', b'encoded image')
+
+    assert entries(tmp_path) == []
+    assert cache.size == 0
+
+
+def test_temporary_files_are_unique(tmp_path, monkeypatch):
+    cache = ImageCache(str(tmp_path), 1024)
+    temporary_paths = []
+    replace = os.replace
+
+    def recording_replace(src, dst):
+        temporary_paths.append(src)
+        replace(src, dst)
+    monkeypatch.setattr(os, 'replace', recording_replace)
+
+    cache.store('a', b'first')
+    cache.store('a', b'second')
+
+    assert len(set(temporary_paths)) == 2
+    assert all(os.path.dirname(p) == str(tmp_path) for p in temporary_paths)
+    assert entries(tmp_path) == ['a' + CACHE_EXTENSION]
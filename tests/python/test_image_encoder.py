@@ -0,0 +1,80 @@
+# Copyright 2018-2026 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import zlib
+
+import numpy as np
+import pytest
+
+from io_scene_gltf2.io.exp.binary_data import BinaryData
+from io_scene_gltf2.io.exp.image_encoder import ImageEncoder
+
+
+@pytest.fixture
+def encoder():
+    encoder = ImageEncoder(2, {'log': logging.getLogger('test_image_encoder')})
+    yield encoder
+    encoder.executor.shutdown(wait=True)
+
+
+def pixels(value, width=4, height=3):
+    return np.full(width * height * 4, value, np.float32)
+
+
+def test_encodes_png(encoder):
+    data = encoder.submit(None, pixels(0.5), 4, 3, False).resolve()
+
+    assert data.startswith(b'\x89PNG\r\n\x1a\n')
+    idat = data[data.index(b'IDAT') + 4:data.index(b'IEND') - 8]
+    rows = zlib.decompress(idat)
+    assert len(rows) == 3 * (1 + 4 * 3)
+
+
+def test_same_pixels_share_placeholder(encoder):
+    first = encoder.submit(('recipe', 1), pixels(0.5), 4, 3, False)
+    second = encoder.submit(('recipe', 2), pixels(0.5), 4, 3, False)
+    other = encoder.submit(('recipe', 3), pixels(0.25), 4, 3, False)
+
+    assert second is first
+    assert other is not first
+    assert encoder.content_hits == 1
+    # Buffer views of duplicates are deduplicated, as when comparing bytes
+    assert BinaryData(first) == BinaryData(second)
+    assert len({BinaryData(first), BinaryData(second), BinaryData(other)}) == 2
+
+
+def test_alpha_is_part_of_content(encoder):
+    first = encoder.submit(None, pixels(0.5), 4, 3, False)
+    second = encoder.submit(None, pixels(0.5), 4, 3, True)
+
+    assert second is not first
+
+
+def test_recipe_lookup(encoder):
+    deferred = encoder.submit(('recipe', 1), pixels(0.5), 4, 3, False)
+
+    assert encoder.lookup(('recipe', 1)) is deferred
+    assert encoder.lookup(('recipe', 2)) is None
+    assert encoder.recipe_hits == 1
+
+
+def test_failed_encoding_gives_empty_data(encoder, caplog):
+    # Fewer pixels than the size tells
+    deferred = encoder.submit(None, pixels(0.5, 2, 2), 4, 3, False)
+
+    with caplog.at_level(logging.WARNING):
+        assert deferred.resolve() == b''
+    assert 'not exporting image' in caplog.text
+    assert BinaryData(deferred).byte_length == 0
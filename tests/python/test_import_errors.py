@@ -0,0 +1,120 @@
+# Copyright 2018-2026 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+
+from io_scene_gltf2.io.imp.gltf2_io_gltf import glTFImporter, ImportError
+
+
+def document(meshes):
+    return {
+        'asset': {'version': '2.0'},
+        'scene': 0,
+        'scenes': [{'nodes': list(range(len(meshes)))}],
+        'nodes': [{'name': 'Node%d' % i, 'mesh': i} for i in range(len(meshes))],
+        'meshes': meshes,
+        'accessors': [{'componentType': 5126, 'count': 3, 'type': 'VEC3'}],
+    }
+
+
+VALID_MESH = {'primitives': [{'attributes': {'POSITION': 0}}]}
+INVALID_MESH = {'primitives': 'not a list'}
+
+
+def read(tmp_path, gltf, **import_settings):
+    path = tmp_path / 'document.gltf'
+    path.write_text(json.dumps(gltf))
+    import_settings['import_user_extensions'] = []
+    with glTFImporter(str(path), import_settings) as importer:
+        importer.read()
+    return importer
+
+
+def test_invalid_document_is_reported(tmp_path):
+    with pytest.raises(ImportError):
+        read(tmp_path, document([VALID_MESH, INVALID_MESH]))
+
+
+def test_lazy_document_reports_invalid_elements_on_access(tmp_path):
+    importer = read(tmp_path, document([VALID_MESH, INVALID_MESH]), import_lazy_document=True)
+
+    assert len(importer.data.meshes[0].primitives) == 1
+    with pytest.raises(ImportError):
+        importer.data.meshes[1]
+
+
+def test_filtered_import_reports_invalid_selected_elements(tmp_path):
+    with pytest.raises(ImportError):
+        read(tmp_path, document([VALID_MESH, INVALID_MESH]), import_filter_meshes='1')
+
+
+def test_filtered_import_ignores_invalid_elements_not_selected(tmp_path):
+    importer = read(tmp_path, document([VALID_MESH, INVALID_MESH]), import_filter_meshes='0')
+
+    assert importer.selection.meshes == {0}
+    assert len(importer.data.meshes[0].primitives) == 1
+
+
+def test_filtered_import_reports_invalid_accessors_of_selected_meshes(tmp_path):
+    gltf = document([VALID_MESH, VALID_MESH])
+    gltf['accessors'][0]['count'] = 'three'
+    with pytest.raises(ImportError):
+        read(tmp_path, gltf, import_filter_meshes='1')
+
+
+def test_filtered_import_only_decodes_selected_nodes(tmp_path):
+    gltf = document([VALID_MESH])
+    gltf['nodes'] = [{'name': 'Root', 'children': list(range(1, 100))}] + \
+        [{'name': 'Node%d' % i} for i in range(1, 100)]
+    gltf['nodes'][42]['mesh'] = 0
+    # Light without index
+    gltf['nodes'][43]['extensions'] = {'KHR_lights_punctual': {}}
+    gltf['scenes'] = [{'nodes': [0]}]
+
+    importer = read(tmp_path, gltf, import_filter_meshes='0')
+    assert importer.selection.nodes == {0, 42}
+    assert importer.data.nodes.decoded_count == 2
+
+    importer = read(tmp_path, gltf, import_filter_nodes='Node43')
+    assert importer.selection.nodes == {0, 43}
+    assert importer.selection.lights == set()
+
+
+def test_failed_read_unmaps_files(tmp_path, monkeypatch):
+    path = tmp_path / 'document.gltf'
+    path.write_text(json.dumps(document([VALID_MESH, INVALID_MESH])))
+    importer = glTFImporter(str(path), {'import_user_extensions': [], 'import_memory_map': True})
+    mapped = []
+    read_file = importer.read_file
+    monkeypatch.setattr(importer, 'read_file', lambda p: mapped.append(read_file(p)) or mapped[-1])
+
+    with pytest.raises(ImportError):
+        importer.read()
+
+    assert len(mapped) == 1
+    assert importer.mapped_files == []
+    assert importer.buffers == {}
+
+
+def test_importer_closes_when_leaving_context(tmp_path):
+    path = tmp_path / 'document.gltf'
+    path.write_text(json.dumps(document([VALID_MESH])))
+
+    with glTFImporter(str(path), {'import_user_extensions': [], 'import_memory_map': True}) as importer:
+        importer.read()
+        assert importer.data.meshes[0] is not None
+
+    assert importer.mapped_files == []
@@ -0,0 +1,183 @@
+# Copyright 2018-2026 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Needs Blender, with this add-on enabled, for exports.
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+bpy = pytest.importorskip('bpy')
+
+from io_scene_gltf2.blender.exp.animation import action  # noqa: E402
+from io_scene_gltf2.blender.exp.tree import VExportNode  # noqa: E402
+
+# Module level names are not mangled
+is_timeline_independent = getattr(action, '__is_timeline_independent')
+is_relative_to_blender_parent = getattr(action, '__is_relative_to_blender_parent')
+
+
+@pytest.fixture
+def scene():
+    # Not read_factory_settings, that would disable the add-on
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+    for action in list(bpy.data.actions):
+        bpy.data.actions.remove(action)
+    return bpy.context.scene
+
+
+def new_object(name, parent=None):
+    obj = bpy.data.objects.new(name, None)
+    bpy.context.scene.collection.objects.link(obj)
+    obj.parent = parent
+    return obj
+
+
+def animate(obj, name, values):
+    """Create an action from (frame, x location) keyframes. The previous action is pushed to an NLA track."""
+    animation_data = obj.animation_data_create()
+    if animation_data.action is not None:
+        previous = animation_data.action
+        track = animation_data.nla_tracks.new()
+        track.strips.new(previous.name, int(previous.frame_range[0]), previous)
+        animation_data.action = None
+    for frame, x in values:
+        obj.location.x = x
+        obj.keyframe_insert('location', frame=frame)
+    animation_data.action.name = name
+    return animation_data.action
+
+
+def export_settings(objects, parents=None, **settings):
+    """Settings with a vtree of one node per object, parented as in parents (uuid of the parent, by name)."""
+    parents = parents or {}
+    nodes = {}
+    for obj in objects:
+        nodes[obj.name] = SimpleNamespace(
+            uuid=obj.name,
+            blender_type=VExportNode.ARMATURE if obj.type == 'ARMATURE' else VExportNode.OBJECT,
+            blender_object=obj,
+            blender_bone=None,
+            node=object(),
+            parent_uuid=parents.get(obj.name),
+            children=[],
+        )
+    settings.setdefault('gltf_armature_object_remove', False)
+    settings['vtree'] = SimpleNamespace(nodes=nodes)
+    return settings
+
+
+def test_animated_object_is_independent(scene):
+    obj = new_object('Object')
+    animate(obj, 'Move', [(1, 0.0), (10, 1.0)])
+
+    assert is_timeline_independent('Object', export_settings([obj]))
+
+
+def test_object_without_animation_is_not_independent(scene):
+    obj = new_object('Object')
+
+    assert not is_timeline_independent('Object', export_settings([obj]))
+
+
+def test_constraint_on_other_object_is_not_independent(scene):
+    target = new_object('Target')
+    obj = new_object('Object')
+    animate(obj, 'Move', [(1, 0.0), (10, 1.0)])
+    constraint = obj.constraints.new('COPY_ROTATION')
+
+    assert is_timeline_independent('Object', export_settings([obj, target]))
+
+    constraint.target = target
+    assert not is_timeline_independent('Object', export_settings([obj, target]))
+
+
+def test_driver_reading_other_object_is_not_independent(scene):
+    other = new_object('Other')
+    obj = new_object('Object')
+    animate(obj, 'Move', [(1, 0.0), (10, 1.0)])
+    fcurve = obj.driver_add('location', 1)
+    variable = fcurve.driver.variables.new()
+    variable.targets[0].id = obj
+
+    assert is_timeline_independent('Object', export_settings([obj, other]))
+
+    variable.targets[0].id = other
+    assert not is_timeline_independent('Object', export_settings([obj, other]))
+
+
+def test_vertex_parent_is_not_independent(scene):
+    mesh = bpy.data.meshes.new('Mesh')
+    mesh.from_pydata([(0, 0, 0), (1, 0, 0), (0, 1, 0)], [], [(0, 1, 2)])
+    parent = bpy.data.objects.new('Parent', mesh)
+    scene.collection.objects.link(parent)
+    obj = new_object('Object', parent)
+    animate(obj, 'Move', [(1, 0.0), (10, 1.0)])
+    settings = export_settings([parent, obj], {'Object': 'Parent'})
+
+    assert is_timeline_independent('Object', settings)
+
+    obj.parent_type = 'VERTEX'
+    obj.parent_vertices = (0, 0, 0)
+    assert not is_timeline_independent('Object', settings)
+
+
+def test_flattened_child_is_not_relative_to_blender_parent(scene):
+    parent = new_object('Parent')
+    child = new_object('Child', parent)
+
+    assert is_relative_to_blender_parent('Child', export_settings([parent, child], {'Child': 'Parent'}))
+    assert is_relative_to_blender_parent('Parent', export_settings([parent, child], {'Child': 'Parent'}))
+    # Flattened hierarchy: the cached matrix of the child is its world matrix
+    assert not is_relative_to_blender_parent('Child', export_settings([parent, child]))
+
+
+def export(path, **settings):
+    bpy.ops.export_scene.gltf(
+        filepath=str(path),
+        export_format='GLTF_EMBEDDED',
+        export_animation_mode='ACTIONS',
+        export_force_sampling=True,
+        export_optimize_animation_size=False,
+        **settings)
+    with open(path) as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize('flatten', [False, True])
+def test_shared_sweeps_export_the_same_animations(scene, tmp_path, flatten):
+    parent = new_object('Parent')
+    child = new_object('Child', parent)
+    other = new_object('Other')
+    animate(parent, 'ParentWalk', [(1, 0.0), (20, 2.0)])
+    animate(parent, 'ParentRun', [(1, 0.0), (10, 5.0)])
+    animate(child, 'ChildWalk', [(1, 1.0), (15, -1.0)])
+    animate(child, 'ChildRun', [(5, 0.0), (25, 3.0)])
+    animate(other, 'OtherWalk', [(1, 0.0), (30, 1.0)])
+    animate(other, 'OtherRun', [(1, 2.0), (12, 0.0)])
+
+    # Actions are sampled separately when pose bones are not reset
+    expected = export(tmp_path / 'separate.gltf', export_reset_pose_bones=False,
+                      export_hierarchy_flatten_objs=flatten)
+    result = export(tmp_path / 'shared.gltf', export_reset_pose_bones=True,
+                    export_hierarchy_flatten_objs=flatten)
+
+    assert len(result['animations']) == len(expected['animations'])
+    assert result['animations'] == expected['animations']
+    assert result['accessors'] == expected['accessors']
+    assert result['buffers'] == expected['buffers']
@@ -16,6 +16,15 @@ import bpy
 import os
 import sys
 
+
+def option_value(argv, name, default):
+    """Value of a --name=value option."""
+    for arg in argv:
+        if arg.startswith(name + '='):
+            return arg[len(name) + 1:]
+    return default
+
+
 try:
     argv = sys.argv
     if "--" in argv:
@@ -32,7 +41,13 @@ try:
     if '--import-not-merge' in argv:
         import_merge_material_slots=False
 
-    bpy.ops.import_scene.gltf(filepath=argv[0], import_merge_material_slots=import_merge_material_slots)
+    import_filter_nodes = option_value(argv, '--import-filter-nodes', '')
+
+    bpy.ops.import_scene.gltf(
+        filepath=argv[0],
+        import_merge_material_slots=import_merge_material_slots,
+        import_filter_nodes=import_filter_nodes
+    )
 
     bpy.context.scene.frame_start = 0
 
@@ -55,17 +70,24 @@ try:
     export_force_sample_anim = False if '--no-sample-anim' in argv else True
     export_attributes = True if '--export-attributes' in argv else False
     export_gpu_instances = True if '--export-gpu_instances' in argv else False
+    export_hierarchy_flatten_objs = True if '--export-hierarchy-flatten-objs' in argv else False
+    export_image_format = option_value(argv, '--export-image-format', 'AUTO')
+    export_image_cache_directory = os.path.join(output_dir, 'image_cache') if '--export-image-cache' in argv else ''
 
-
-    bpy.ops.export_scene.gltf(
-        export_format=export_format,
-        filepath=os.path.join(output_dir, path_parts[1]),
-        export_shared_accessors=export_shared_accessors,
-        export_tangents=export_tangent,
-        export_force_sampling=export_force_sample_anim,
-        export_attributes=export_attributes,
-        export_gpu_instances=export_gpu_instances
-    )
+    # With an image cache, a first export fills it, and the checked export reads from it
+    for _ in range(2 if export_image_cache_directory else 1):
+        bpy.ops.export_scene.gltf(
+            export_format=export_format,
+            filepath=os.path.join(output_dir, path_parts[1]),
+            export_shared_accessors=export_shared_accessors,
+            export_tangents=export_tangent,
+            export_force_sampling=export_force_sample_anim,
+            export_attributes=export_attributes,
+            export_gpu_instances=export_gpu_instances,
+            export_hierarchy_flatten_objs=export_hierarchy_flatten_objs,
+            export_image_format=export_image_format,
+            export_image_cache_directory=export_image_cache_directory
+        )
 except Exception as err:
     print(err, file=sys.stderr)
     sys.exit(1)
@@ -228,6 +228,45 @@ function buildVectorHash(accessorData) {
     return vectorHashTable;
 }
 
+function interpolateLinear(times, values, time) {
+    // Linear interpolation of VEC3 keyframes, clamped to the keyframe range.
+    if (time <= times[0]) {
+        return values[0];
+    }
+    for (let i = 1; i < times.length; ++i) {
+        if (time <= times[i]) {
+            const t = (time - times[i - 1]) / (times[i] - times[i - 1]);
+            return values[i - 1].map((value, j) => value + t * (values[i][j] - value));
+        }
+    }
+    return values[values.length - 1];
+}
+
+function checkSampledTranslation(gltfPath, asset, animationName, nodeName, expected) {
+    // Each sampled translation must be the value of the expected function at its time.
+    const animation = asset.animations.find(anim => anim.name === animationName);
+    assert(animation !== undefined, "Expected an animation " + animationName);
+    const nodeIndex = asset.nodes.findIndex(node => node.name === nodeName);
+    const channel = animation.channels.find(c => c.target.node === nodeIndex && c.target.path === 'translation');
+    assert(channel !== undefined, "Expected a translation of " + nodeName + " in " + animationName);
+
+    const sampler = animation.samplers[channel.sampler];
+    const bufferCache = {};
+    const times = getAccessorData(gltfPath, asset, sampler.input, bufferCache);
+    const values = getAccessorData(gltfPath, asset, sampler.output, bufferCache);
+    assert.strictEqual(values.length, 3 * times.length);
+
+    times.forEach((time, i) => {
+        const expectedValue = expected(time);
+        for (let j = 0; j < 3; ++j) {
+            if (Math.abs(values[3 * i + j] - expectedValue[j]) > 1e-4) {
+                throw new Error(nodeName + " in " + animationName + " at " + time + ": expected " +
+                    expectedValue + ", got " + values.slice(3 * i, 3 * i + 3));
+            }
+        }
+    });
+}
+
 describe('General', function () {
     describe('gltf_validator', function () {
         it('should verify a simple glTF file without errors', function (done) {
@@ -4609,6 +4648,104 @@ describe('Exporter', function () {
 
                 });
 
+                it('roundtrips only the nodes selected by the import filter', function () {
+                    let dir = '26_import_filter';
+                    let outDirPath = path.resolve(OUT_PREFIX, 'roundtrip', dir, outDirName);
+                    let gltfPath = path.resolve(outDirPath, dir + '.gltf');
+                    const asset = JSON.parse(fs.readFileSync(gltfPath));
+
+                    const nodeNames = asset.nodes.map(node => node.name);
+                    assert.deepStrictEqual(nodeNames.sort(), ['Car', 'Wheel_L', 'Wheel_R']);
+
+                    // Ancestors of matching nodes keep their transform, without their content
+                    const car = asset.nodes.find(node => node.name === 'Car');
+                    assert.strictEqual(car.mesh, undefined);
+                    assert.equalEpsilonArray(car.translation, [0, 1, 0]);
+                    assert.strictEqual(car.children.length, 2);
+
+                    const wheel_l = asset.nodes.find(node => node.name === 'Wheel_L');
+                    const wheel_r = asset.nodes.find(node => node.name === 'Wheel_R');
+                    assert.equalEpsilonArray(wheel_l.translation, [1, 0, 0]);
+                    assert.equalEpsilonArray(wheel_r.translation, [-1, 0, 0]);
+                    assert.strictEqual(wheel_l.mesh, wheel_r.mesh);
+
+                    assert.strictEqual(asset.meshes.length, 1);
+                    assert.strictEqual(asset.meshes[wheel_l.mesh].name, 'Wheel');
+                });
+
+                it('roundtrips actions sampled in shared timeline sweeps', function () {
+                    let dir = '26_shared_sweeps';
+                    let outDirPath = path.resolve(OUT_PREFIX, 'roundtrip', dir, outDirName);
+                    let gltfPath = path.resolve(outDirPath, dir + '.gltf');
+                    const asset = JSON.parse(fs.readFileSync(gltfPath));
+
+                    const animNames = asset.animations.map(anim => anim.name);
+                    assert.deepStrictEqual(animNames.sort(), ['Run', 'Walk']);
+
+                    // Each action keeps its own values, whatever the actions of the other objects in the sweep
+                    const walk = {
+                        Parent: [[0, 1], [[0, 0, 0], [2, 0, 0]]],
+                        Child: [[0, 0.5, 1], [[1, 0, 0], [1, 1, 0], [1, 0, 0]]],
+                        Other: [[0, 1], [[0, 0, 0], [0, 0, 3]]],
+                    };
+                    const run = {
+                        Parent: [[0, 0.5], [[0, 0, 0], [4, 0, 0]]],
+                        Child: [[0, 0.5], [[1, 0, 0], [1, 0, 2]]],
+                        Other: [[0, 0.5], [[0, 0, 0], [0, 2, 0]]],
+                    };
+                    [['Walk', walk], ['Run', run]].forEach(([animationName, keyframes]) => {
+                        Object.entries(keyframes).forEach(([nodeName, [times, values]]) => {
+                            checkSampledTranslation(gltfPath, asset, animationName, nodeName,
+                                time => interpolateLinear(times, values, time));
+                        });
+                    });
+                });
+
+                it('roundtrips actions sampled in shared timeline sweeps, with a flattened hierarchy', function () {
+                    let dir = '26_shared_sweeps_flatten';
+                    let outDirPath = path.resolve(OUT_PREFIX, 'roundtrip', dir, outDirName);
+                    let gltfPath = path.resolve(outDirPath, dir + '.gltf');
+                    const asset = JSON.parse(fs.readFileSync(gltfPath));
+
+                    const child = asset.nodes.find(node => node.name === 'Child');
+                    const parent = asset.nodes.find(node => node.name === 'Parent');
+                    assert.strictEqual(parent.children, undefined);
+                    assert(asset.scenes[0].nodes.includes(asset.nodes.indexOf(child)));
+
+                    // The flattened child is animated in world space, on top of its static parent
+                    const parentTranslation = [0, 1, 0];
+                    const world = (times, values) => time => interpolateLinear(times, values, time)
+                        .map((value, j) => value + parentTranslation[j]);
+                    checkSampledTranslation(gltfPath, asset, 'Walk', 'Child',
+                        world([0, 0.5, 1], [[1, 0, 0], [1, 1, 0], [1, 0, 0]]));
+                    checkSampledTranslation(gltfPath, asset, 'Run', 'Child',
+                        world([0, 0.5], [[1, 0, 0], [1, 0, 2]]));
+                    checkSampledTranslation(gltfPath, asset, 'Walk', 'Other',
+                        time => interpolateLinear([0, 1], [[0, 0, 0], [0, 0, 3]], time));
+                    checkSampledTranslation(gltfPath, asset, 'Run', 'Other',
+                        time => interpolateLinear([0, 0.5], [[0, 0, 0], [0, 2, 0]], time));
+                });
+
+                it('roundtrips an image converted through the image cache', function () {
+                    let dir = '26_image_cache';
+                    let outDirPath = path.resolve(OUT_PREFIX, 'roundtrip', dir, outDirName);
+                    let gltfPath = path.resolve(outDirPath, dir + '.gltf');
+                    const asset = JSON.parse(fs.readFileSync(gltfPath));
+
+                    assert.strictEqual(asset.materials.length, 1);
+                    const textureIndex = asset.materials[0].pbrMetallicRoughness.baseColorTexture.index;
+                    const image = asset.images[asset.textures[textureIndex].source];
+                    assert.strictEqual(image.uri, '26_image_cache_baseColor.jpg');
+                    const imageData = fs.readFileSync(path.resolve(outDirPath, image.uri));
+
+                    // The image is exported twice: the first export stores it, the second one reuses it
+                    const cacheDirPath = path.resolve(outDirPath, 'image_cache');
+                    const entries = fs.readdirSync(cacheDirPath).filter(name => name.endsWith('.img'));
+                    assert.strictEqual(entries.length, 1);
+                    const cachedData = fs.readFileSync(path.resolve(cacheDirPath, entries[0]));
+                    assert(cachedData.equals(imageData));
+                });
+
             });
         });
     });
@@ -0,0 +1,99 @@
+# Copyright 2018-2026 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This script compares the fast glTF JSON decoder with the from_dict path.
+# It doesn't need Blender.
+# Example:
+# python bench_gltf_decode.py -n 100000
+# python bench_gltf_decode.py -f /path/to/file.gltf
+
+import argparse
+import importlib.util
+import json
+import time
+from os.path import dirname, realpath
+
+ap = argparse.ArgumentParser()
+ap.add_argument("-n", "--nodes", type=int, default=100000, help="number of nodes of the generated glTF")
+ap.add_argument("-f", "--file", help="use this .gltf file instead of a generated one")
+ap.add_argument("-r", "--repeat", type=int, default=3, help="number of runs, best one is kept")
+args = vars(ap.parse_args())
+
+# gltf2_io doesn't use bpy, so it can be loaded alone
+path = dirname(realpath(__file__)) + "/../addons/io_scene_gltf2/io/com/gltf2_io.py"
+spec = importlib.util.spec_from_file_location("gltf2_io", path)
+gltf2_io = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(gltf2_io)
+
+
+def generate_gltf(nb_nodes):
+    nodes = []
+    for i in range(nb_nodes):
+        node = {"name": "Node." + str(i), "mesh": i % 100, "translation": [float(i), 0.0, 1.5]}
+        if i % 3 == 0:
+            node["rotation"] = [0.0, 0.0, 0.70710677, 0.70710677]
+        if i % 10 == 0:
+            node["children"] = [j for j in range(i + 1, min(i + 10, nb_nodes))]
+        nodes.append(node)
+
+    accessors = []
+    buffer_views = []
+    for i in range(nb_nodes // 10):
+        buffer_views.append({"buffer": 0, "byteLength": 1200, "byteOffset": i * 1200, "target": 34962})
+        accessors.append({"bufferView": i, "componentType": 5126, "count": 100, "type": "VEC3",
+                          "max": [1.0, 1.0, 1.0], "min": [-1.0, -1.0, -1.0]})
+
+    meshes = [{"name": "Mesh." + str(i), "primitives": [{"attributes": {"POSITION": i}, "material": 0}]}
+              for i in range(100)]
+
+    return {
+        "asset": {"version": "2.0", "generator": "bench_gltf_decode"},
+        "scene": 0,
+        "scenes": [{"nodes": [i for i in range(0, nb_nodes, 10)]}],
+        "nodes": nodes,
+        "meshes": meshes,
+        "materials": [{"name": "Material", "pbrMetallicRoughness": {"baseColorFactor": [1.0, 0.5, 0.5, 1.0]},
+                       "extensions": {"KHR_materials_emissive_strength": {"emissiveStrength": 2.0}}}],
+        "accessors": accessors,
+        "bufferViews": buffer_views,
+        "buffers": [{"byteLength": 1200 * len(buffer_views)}],
+    }
+
+
+def bench(name, fn, gltf):
+    best = None
+    for _ in range(args['repeat']):
+        start = time.perf_counter()
+        result = fn(gltf)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print("{:<12} {:.3f}s".format(name, best))
+    return result, best
+
+
+if args['file']:
+    with open(args['file'], "r", encoding="utf-8") as f:
+        gltf = json.load(f)
+else:
+    gltf = generate_gltf(args['nodes'])
+
+print("{} nodes, {} accessors".format(len(gltf.get("nodes", [])), len(gltf.get("accessors", []))))
+
+reference, reference_time = bench("from_dict", gltf2_io.Gltf.from_dict, gltf)
+fast, fast_time = bench("fast", gltf2_io.DECODERS['Gltf'], gltf)
+
+if gltf2_io.gltf_to_dict(reference) != gltf2_io.gltf_to_dict(fast):
+    print("ERROR: decoded data differs")
+else:
+    print("speedup      {:.1f}x".format(reference_time / fast_time))